@@ -0,0 +1,3 @@
+"""
+Benchmark suite for the Anagram Checker
+"""
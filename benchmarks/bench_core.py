@@ -0,0 +1,88 @@
+"""
+Micro-benchmarks for the checker core: normalizers and validators
+"""
+import random
+from typing import Dict, Tuple
+
+from benchmarks.stats import time_callable
+from src.anagram_checker import (
+    NORMALIZERS,
+    VALIDATORS,
+    CachedAnagramValidator,
+    CaseInsensitiveNormalizer,
+    create_anagram_checker,
+)
+from src.cache import LRUCache
+
+
+def _shuffled(text: str, seed: int) -> str:
+    characters = list(text)
+    random.Random(seed).shuffle(characters)
+    return ''.join(characters)
+
+
+def build_inputs(seed: int = 42) -> Dict[str, Tuple[str, str]]:
+    """
+    Build the input pairs every core benchmark runs against
+
+    Args:
+        seed: Random seed so runs are reproducible
+
+    Returns:
+        Mapping of input name to an anagram pair
+    """
+    rng = random.Random(seed)
+    long_text = ''.join(rng.choice("abcdefghijklmnopqrstuvwxyz ") for _ in range(10000))
+    unicode_text = ''.join(rng.choice("абвгдежзийклмнопрстуфхцчшщ ") for _ in range(10000))
+    return {
+        "short": ("A gentleman", "Elegant Man"),
+        "long": (long_text, _shuffled(long_text, seed)),
+        "unicode": (unicode_text, _shuffled(unicode_text, seed)),
+    }
+
+
+def run(quick: bool = False) -> Dict[str, Dict[str, float]]:
+    """
+    Run all core benchmarks
+
+    Args:
+        quick: Use fewer rounds, for smoke runs
+
+    Returns:
+        Mapping of benchmark name to its summary
+    """
+    rounds = 5 if quick else 30
+    results = {}
+    normalizer = CaseInsensitiveNormalizer()
+
+    for input_name, (text1, text2) in build_inputs().items():
+        inner = 2000 if input_name == "short" else 20
+        if quick:
+            inner = max(1, inner // 10)
+
+        results[f"core.normalize.{input_name}"] = time_callable(
+            lambda: normalizer.normalize(text1), rounds, inner
+        )
+        for profile, profile_normalizer in NORMALIZERS.items():
+            if profile != "default":
+                results[f"core.normalize.{profile}.{input_name}"] = time_callable(
+                    lambda: profile_normalizer.normalize(text1), rounds, inner
+                )
+
+        for strategy in VALIDATORS:
+            checker = create_anagram_checker(strategy)
+            results[f"core.check.{strategy}.{input_name}"] = time_callable(
+                lambda: checker.check(text1, text2), rounds, inner
+            )
+
+        cached = CachedAnagramValidator(
+            normalizer,
+            LRUCache(max_size=100),
+            VALIDATORS["counting"](normalizer),
+            max_cached_length=len(text1)
+        )
+        results[f"core.check.cached_hit.{input_name}"] = time_callable(
+            lambda: cached.validate(text1, text2), rounds, inner
+        )
+
+    return results
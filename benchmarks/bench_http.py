@@ -0,0 +1,61 @@
+"""
+In-process ASGI benchmarks for the HTTP endpoints
+"""
+import asyncio
+import time
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.stats import summarize
+from src.app import app
+
+BATCH_PAIRS = [{"input1": "school master", "input2": "the classroom"}] * 100
+
+ENDPOINTS = {
+    "health": ("GET", "/health", None),
+    "ui": ("GET", "/", None),
+    "check": ("POST", "/api/check", {"input1": "A gentleman", "input2": "Elegant Man"}),
+    "check_batch_100": ("POST", "/api/check/batch", {"pairs": BATCH_PAIRS}),
+    "anagrams": ("GET", "/api/anagrams?word=listen", None),
+}
+
+
+async def _measure(method: str, path: str, body, requests: int, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.request(method, path, json=body)
+        queue = iter(range(requests))
+
+        async def worker():
+            for _ in queue:
+                begin = time.perf_counter()
+                response = await client.request(method, path, json=body)
+                latencies.append((time.perf_counter() - begin) * 1e6)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return summarize(latencies, elapsed, requests)
+
+
+def run(quick: bool = False, concurrency: int = 8) -> Dict[str, Dict[str, float]]:
+    """
+    Run all HTTP benchmarks through the ASGI app without a network socket
+
+    Args:
+        quick: Use fewer requests, for smoke runs
+        concurrency: Number of concurrent in-flight requests
+
+    Returns:
+        Mapping of benchmark name to its summary
+    """
+    requests = 100 if quick else 2000
+    results = {}
+    for name, (method, path, body) in ENDPOINTS.items():
+        results[f"http.{name}"] = asyncio.run(
+            _measure(method, path, body, requests, concurrency)
+        )
+    return results
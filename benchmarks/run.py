@@ -0,0 +1,103 @@
+"""
+Benchmark runner: writes machine-readable results and compares to a baseline
+
+Usage:
+    python -m benchmarks.run [--quick] [--output FILE] [--baseline FILE]
+                             [--threshold 0.2] [--fail-on-regression]
+                             [--suite core|http|all] [--no-compare]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """
+    List benchmarks whose mean latency grew beyond the threshold
+
+    Args:
+        results: Current benchmark summaries
+        baseline: Stored benchmark summaries
+        threshold: Allowed relative slowdown, e.g. 0.2 for 20%
+
+    Returns:
+        Human-readable descriptions of each regression
+    """
+    regressions = []
+    for name, current in sorted(results.items()):
+        previous = baseline.get(name)
+        if not previous or not previous.get("mean_us"):
+            continue
+        change = current["mean_us"] / previous["mean_us"] - 1
+        if change > threshold:
+            regressions.append(
+                f"{name}: {previous['mean_us']:.1f}us -> {current['mean_us']:.1f}us "
+                f"(+{change:.0%})"
+            )
+    return regressions
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Run the Anagram Checker benchmarks")
+    parser.add_argument("--suite", choices=["core", "http", "all"], default="all")
+    parser.add_argument("--quick", action="store_true", help="Fewer iterations")
+    parser.add_argument("--output", default="bench-results.json")
+    parser.add_argument("--baseline", default="benchmarks/baseline.json")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--no-compare", action="store_true", help="Skip the baseline check")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Dict] = {}
+    if args.suite in ("core", "all"):
+        from benchmarks import bench_core
+        results.update(bench_core.run(quick=args.quick))
+    if args.suite in ("http", "all"):
+        from benchmarks import bench_http
+        results.update(bench_http.run(quick=args.quick))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+
+    width = max(len(name) for name in results)
+    print(f"{'benchmark':<{width}}  {'ops/s':>12}  {'p50 us':>10}  {'p99 us':>10}")
+    for name, summary in sorted(results.items()):
+        print(
+            f"{name:<{width}}  {summary['ops_per_sec']:>12.1f}  "
+            f"{summary['p50_us']:>10.1f}  {summary['p99_us']:>10.1f}"
+        )
+    print(f"\nResults written to {args.output}")
+
+    if args.no_compare:
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run 'make bench-baseline' to store one")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)["results"]
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nRegressions beyond {args.threshold:.0%} against {args.baseline}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1 if args.fail_on_regression else 0
+    print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,187 @@
+"""
+Cold-start report: import costs and time to the first /health response
+
+Usage:
+    python -m benchmarks.startup [--top 15] [--budget 5.0] [--json FILE]
+
+Every measurement runs in a fresh interpreter, as after a scale-from-zero.
+Import costs come from "python -X importtime"; time to first response is
+measured from spawning the production launcher (src.serve, with its
+production worker count) until /health answers 200.
+"""
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+ImportRow = Tuple[str, int, int]
+
+
+def import_times(module: str = "src.app") -> List[ImportRow]:
+    """
+    Import a module in a fresh interpreter and record every import's cost
+
+    Args:
+        module: Module to import
+
+    Returns:
+        (module, self microseconds, cumulative microseconds) per import
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def by_package(rows: List[ImportRow]) -> Dict[str, int]:
+    """
+    Sum self import time per top-level package (per module for src.*)
+
+    Args:
+        rows: Output of import_times
+
+    Returns:
+        Microseconds per package, most expensive first
+    """
+    totals: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        key = name if name.startswith("src.") else name.split(".")[0]
+        totals[key] += self_us
+    return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+
+def interpreter_baseline() -> float:
+    """Seconds to start and exit a bare interpreter"""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - started
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_response(
+    path: str = "/health",
+    timeout: float = 30.0,
+    env: Optional[Dict[str, str]] = None,
+    workers: Optional[int] = None
+) -> float:
+    """
+    Start the production launcher and wait for the first successful response
+
+    Args:
+        path: Endpoint to poll
+        timeout: Give up after this many seconds
+        env: Extra environment variables for the server
+        workers: Worker processes; by default the launcher's own choice
+            (one per available CPU), as in production
+
+    Returns:
+        Seconds from spawning the process to the first 200 response
+
+    Raises:
+        TimeoutError: If the server does not answer in time
+    """
+    port = _free_port()
+    server_env = dict(os.environ, HOST="127.0.0.1", PORT=str(port))
+    if workers is not None:
+        server_env["WEB_CONCURRENCY"] = str(workers)
+    server_env.update(env or {})
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.serve"], env=server_env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited with status {process.returncode}")
+            try:
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+                connection.request("GET", path)
+                if connection.getresponse().status == 200:
+                    return time.perf_counter() - started
+            except OSError:
+                pass
+            time.sleep(0.01)
+        raise TimeoutError(f"No response from {path} within {timeout} s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def build_report(top: int = 15) -> Dict:
+    """
+    Measure everything and return a JSON-serializable report
+
+    Args:
+        top: Number of modules and packages to list
+
+    Returns:
+        Report dictionary
+    """
+    rows = import_times()
+    app_row = next((row for row in rows if row[0] == "src.app"), ("src.app", 0, 0))
+    slowest = sorted(rows, key=lambda row: -row[1])[:top]
+    return {
+        "interpreter_s": round(interpreter_baseline(), 3),
+        "import_src_app_s": round(app_row[2] / 1e6, 3),
+        "first_health_s": round(time_to_first_response(), 3),
+        "packages_ms": {
+            name: round(us / 1000, 1) for name, us in list(by_package(rows).items())[:top]
+        },
+        "modules_ms": {name: round(self_us / 1000, 1) for name, self_us, _ in slowest},
+    }
+
+
+def print_report(report: Dict) -> None:
+    """Print a human-readable version of the report"""
+    print(f"Interpreter start:        {report['interpreter_s'] * 1000:8.1f} ms")
+    print(f"import src.app:           {report['import_src_app_s'] * 1000:8.1f} ms")
+    print(f"Spawn to first /health:   {report['first_health_s'] * 1000:8.1f} ms")
+    print("Self import time by package:")
+    for name, ms in report["packages_ms"].items():
+        print(f"  {name:<40} {ms:8.1f} ms")
+    print("Slowest modules (self time):")
+    for name, ms in report["modules_ms"].items():
+        print(f"  {name:<40} {ms:8.1f} ms")
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Report cold-start costs")
+    parser.add_argument("--top", type=int, default=15, help="Entries per table")
+    parser.add_argument("--budget", type=float,
+                        help="Fail if the first /health takes longer (seconds)")
+    parser.add_argument("--json", dest="json_path", help="Also write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = build_report(args.top)
+    print_report(report)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    if args.budget is not None and report["first_health_s"] > args.budget:
+        print(f"Cold start {report['first_health_s']:.3f} s exceeds the "
+              f"{args.budget:.3f} s budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,71 @@
+"""
+Timing helpers shared by the benchmark modules
+"""
+import time
+from typing import Callable, Dict, List
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of a list of samples
+
+    Args:
+        samples: Measurements (need not be sorted)
+        fraction: Percentile as a fraction, e.g. 0.99
+
+    Returns:
+        The sample at that rank, or 0.0 for an empty list
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(samples_us: List[float], total_seconds: float, operations: int) -> Dict[str, float]:
+    """
+    Build the machine-readable record for one benchmark
+
+    Args:
+        samples_us: Per-operation latencies in microseconds
+        total_seconds: Wall-clock time of the whole run
+        operations: Number of operations performed
+
+    Returns:
+        Dictionary with throughput and latency percentiles
+    """
+    return {
+        "operations": operations,
+        "ops_per_sec": round(operations / total_seconds, 2) if total_seconds else 0.0,
+        "mean_us": round(sum(samples_us) / len(samples_us), 3) if samples_us else 0.0,
+        "p50_us": round(percentile(samples_us, 0.50), 3),
+        "p95_us": round(percentile(samples_us, 0.95), 3),
+        "p99_us": round(percentile(samples_us, 0.99), 3),
+    }
+
+
+def time_callable(func: Callable[[], object], rounds: int, inner: int) -> Dict[str, float]:
+    """
+    Time a callable in rounds of inner calls
+
+    Each round is timed as a block and divided by inner, so very fast
+    functions are not dominated by timer overhead.
+
+    Args:
+        func: Zero-argument callable to measure
+        rounds: Number of timed rounds
+        inner: Calls per round
+
+    Returns:
+        Summary as produced by summarize()
+    """
+    func()
+    samples = []
+    started = time.perf_counter()
+    for _ in range(rounds):
+        begin = time.perf_counter()
+        for _ in range(inner):
+            func()
+        samples.append((time.perf_counter() - begin) / inner * 1e6)
+    return summarize(samples, time.perf_counter() - started, rounds * inner)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Load generator for a running Anagram Checker service
+
+Replays a weighted mix of /api/check, /health and UI requests against a
+running server, either at a fixed request rate (open model) or with a
+fixed number of concurrent clients (closed model), and reports latency
+percentiles, a latency histogram, error rates and achieved throughput.
+
+Examples:
+    python scripts/load_test.py --url http://localhost:8000 --rps 500 --duration 30
+    python scripts/load_test.py --concurrency 64 --mix check=8,health=1,ui=1
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+CHECK_PAIRS = [
+    ("listen", "silent"),
+    ("hello", "world"),
+    ("A gentleman", "Elegant Man"),
+    ("school master", "the classroom"),
+    ("conversation", "voices rant on"),
+    ("eleven plus two", "twelve plus one"),
+]
+
+REQUESTS = {
+    "check": lambda rng: ("POST", "/api/check", dict(zip(("input1", "input2"), rng.choice(CHECK_PAIRS)))),
+    "health": lambda rng: ("GET", "/health", None),
+    "ui": lambda rng: ("GET", "/", None),
+}
+
+# Histogram bucket upper bounds in milliseconds
+BUCKETS_MS = [0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, math.inf]
+
+
+class Recorder:
+    """Collects per-request outcomes for the final report"""
+
+    def __init__(self):
+        self.latencies_ms: List[float] = []
+        self.by_kind: Dict[str, List[float]] = {}
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+
+    def record(self, kind: str, latency_ms: float, status: Optional[int], error: Optional[str]):
+        self.latencies_ms.append(latency_ms)
+        self.by_kind.setdefault(kind, []).append(latency_ms)
+        if error is not None:
+            self.errors[error] += 1
+        else:
+            self.statuses[status] += 1
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples"""
+    if not samples:
+        return 0.0
+    rank = min(len(samples) - 1, max(0, int(math.ceil(fraction * len(samples))) - 1))
+    return samples[rank]
+
+
+def parse_mix(text: str) -> List[Tuple[str, float]]:
+    """Parse 'check=8,health=1,ui=1' into weighted request kinds"""
+    mix = []
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in REQUESTS:
+            raise argparse.ArgumentTypeError(f"Unknown request kind: {name}")
+        mix.append((name, float(weight or 1)))
+    return mix
+
+
+async def issue(client: httpx.AsyncClient, recorder: Recorder, kind: str,
+                rng: random.Random, scheduled: float) -> None:
+    """
+    Send one request and record its latency
+
+    Latency is measured from the scheduled start, so a server that falls
+    behind a fixed request rate is charged for the queueing it causes.
+    """
+    method, path, body = REQUESTS[kind](rng)
+    status = error = None
+    try:
+        response = await client.request(method, path, json=body)
+        status = response.status_code
+        if status >= 400:
+            error = f"HTTP {status}"
+    except httpx.HTTPError as exc:
+        error = type(exc).__name__
+    recorder.record(kind, (time.perf_counter() - scheduled) * 1000, status, error)
+
+
+async def run_open(client, recorder, mix, rps: float, duration: float,
+                   max_in_flight: int, rng: random.Random) -> int:
+    """Fire requests at a fixed rate; returns requests dropped at the in-flight cap"""
+    kinds, weights = zip(*mix)
+    interval = 1.0 / rps
+    tasks = set()
+    dropped = 0
+    start = time.perf_counter()
+    sent = 0
+    while True:
+        scheduled = start + sent * interval
+        if scheduled - start >= duration:
+            break
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        sent += 1
+        if len(tasks) >= max_in_flight:
+            dropped += 1
+            continue
+        kind = rng.choices(kinds, weights)[0]
+        task = asyncio.create_task(issue(client, recorder, kind, rng, scheduled))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+    return dropped
+
+
+async def run_closed(client, recorder, mix, concurrency: int, duration: float,
+                     rng: random.Random) -> None:
+    """Keep a fixed number of clients busy for the duration"""
+    kinds, weights = zip(*mix)
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            kind = rng.choices(kinds, weights)[0]
+            await issue(client, recorder, kind, rng, time.perf_counter())
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+def histogram(samples: List[float]) -> List[Tuple[str, int]]:
+    """Count samples into the fixed latency buckets"""
+    counts = [0] * len(BUCKETS_MS)
+    for sample in samples:
+        for position, bound in enumerate(BUCKETS_MS):
+            if sample <= bound:
+                counts[position] += 1
+                break
+    labels = [f"<= {bound:g} ms" if bound != math.inf else "> 5000 ms" for bound in BUCKETS_MS]
+    return list(zip(labels, counts))
+
+
+def build_report(recorder: Recorder, elapsed: float, dropped: int) -> Dict:
+    """Summarize the run as a JSON-serializable dictionary"""
+    ordered = sorted(recorder.latencies_ms)
+    total = len(ordered)
+    errors = sum(recorder.errors.values())
+
+    def summary(samples: List[float]) -> Dict[str, float]:
+        samples = sorted(samples)
+        return {
+            "count": len(samples),
+            "p50_ms": round(percentile(samples, 0.50), 3),
+            "p95_ms": round(percentile(samples, 0.95), 3),
+            "p99_ms": round(percentile(samples, 0.99), 3),
+            "p999_ms": round(percentile(samples, 0.999), 3),
+            "max_ms": round(samples[-1], 3) if samples else 0.0,
+        }
+
+    return {
+        "requests": total,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "error_rate": round(errors / total, 5) if total else 0.0,
+        "dropped": dropped,
+        "statuses": {str(status): count for status, count in recorder.statuses.items()},
+        "errors": dict(recorder.errors),
+        "latency": summary(recorder.latencies_ms),
+        "by_kind": {kind: summary(samples) for kind, samples in recorder.by_kind.items()},
+        "histogram": histogram(ordered),
+    }
+
+
+def print_report(report: Dict) -> None:
+    """Print a human-readable version of the report"""
+    latency = report["latency"]
+    print(f"Requests:    {report['requests']} in {report['duration_s']} s "
+          f"({report['throughput_rps']} req/s)")
+    print(f"Errors:      {report['error_rate']:.3%} {report['errors'] or ''}")
+    if report["dropped"]:
+        print(f"Dropped:     {report['dropped']} (in-flight limit reached)")
+    print(f"Latency:     p50 {latency['p50_ms']} ms  p95 {latency['p95_ms']} ms  "
+          f"p99 {latency['p99_ms']} ms  p999 {latency['p999_ms']} ms  max {latency['max_ms']} ms")
+    for kind, stats in sorted(report["by_kind"].items()):
+        print(f"  {kind:<8} n={stats['count']:<7} p50 {stats['p50_ms']} ms  "
+              f"p99 {stats['p99_ms']} ms  p999 {stats['p999_ms']} ms")
+    print("Histogram:")
+    peak = max((count for _, count in report["histogram"]), default=0) or 1
+    for label, count in report["histogram"]:
+        print(f"  {label:>12}  {count:>8}  {'#' * int(40 * count / peak)}")
+
+
+async def main_async(args) -> Dict:
+    rng = random.Random(args.seed)
+    recorder = Recorder()
+    connections = args.concurrency or args.max_in_flight
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+        await client.get("/health")
+        started = time.perf_counter()
+        dropped = 0
+        if args.concurrency:
+            await run_closed(client, recorder, args.mix, args.concurrency, args.duration, rng)
+        else:
+            dropped = await run_open(client, recorder, args.mix, args.rps, args.duration,
+                                     args.max_in_flight, rng)
+        elapsed = time.perf_counter() - started
+    return build_report(recorder, elapsed, dropped)
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Load test a running Anagram Checker")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--rps", type=float, default=100.0, help="Target request rate")
+    mode.add_argument("--concurrency", type=int, help="Concurrent clients (closed model)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("check=8,health=1,ui=1"),
+                        help="Weighted request kinds, e.g. check=8,health=1,ui=1")
+    parser.add_argument("--max-in-flight", type=int, default=256,
+                        help="Cap on outstanding requests at a fixed rate")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", dest="json_path", help="Also write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(main_async(args))
+    print_report(report)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    return 1 if report["error_rate"] > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -31,4 +31,9 @@ echo ""
 echo "Press Ctrl+C to stop the server"
 echo ""
 
-uvicorn src.app:app --reload --host 0.0.0.0 --port 8000
+if [ "$1" = "--production" ]; then
+    # Multi-worker launcher sized to the available CPUs (see src/serve.py)
+    python -m src.serve
+else
+    uvicorn src.app:app --reload --host 0.0.0.0 --port 8000
+fi
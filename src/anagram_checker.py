@@ -3,7 +3,25 @@ Anagram Checker - Core Logic
 Implements SOLID principles with OOP design
 """
 from abc import ABC, abstractmethod
-from typing import Protocol
+import codecs
+import functools
+import time
+import unicodedata
+from collections import Counter
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 
 class StringNormalizer(Protocol):
@@ -29,6 +47,171 @@ class CaseInsensitiveNormalizer:
         return ''.join(text.lower().split())
 
 
+class _TranslationTable(dict):
+    """
+    str.translate table that classifies each character on first sight
+
+    Entries map a code point to None (delete) or to itself (keep). ASCII
+    and Latin-1 are filled in up front; other characters are classified
+    once by __missing__ and then looked up at C speed like the rest.
+    """
+
+    def __init__(self, drop: Callable[[str], bool]):
+        super().__init__()
+        self._drop = drop
+        for code in range(256):
+            self[code]
+
+    def __missing__(self, code: int) -> Optional[int]:
+        value = None if self._drop(chr(code)) else code
+        self[code] = value
+        return value
+
+
+@functools.lru_cache(maxsize=None)
+def _translation_table(
+    strip_marks: bool,
+    strip_punctuation: bool,
+    strip_digits: bool
+) -> _TranslationTable:
+    """Return the shared deletion table for one normalizer configuration"""
+    dropped_categories = (
+        ("M" if strip_marks else "")
+        + ("PS" if strip_punctuation else "")
+        + ("N" if strip_digits else "")
+    )
+
+    def drop(char: str) -> bool:
+        return char.isspace() or unicodedata.category(char)[0] in dropped_categories
+
+    return _TranslationTable(drop)
+
+
+class FoldingNormalizer:
+    """
+    Configurable, table-driven normalizer
+    (Open/Closed Principle - new profiles need no new code)
+
+    Whitespace is always removed. Optionally the text is case-folded
+    (Unicode caseless matching, e.g. "ß" matches "ss"), decomposed with
+    NFKD so accents can be dropped, and stripped of punctuation, symbols
+    and digits. All deletions happen in one str.translate pass over a
+    table shared by every normalizer with the same configuration.
+    """
+
+    def __init__(
+        self,
+        casefold: bool = True,
+        strip_accents: bool = False,
+        strip_punctuation: bool = False,
+        strip_digits: bool = False
+    ):
+        """
+        Initialize the normalizer
+
+        Args:
+            casefold: Apply Unicode case folding instead of keeping case
+            strip_accents: Decompose with NFKD and drop combining marks
+            strip_punctuation: Drop punctuation and symbol characters
+            strip_digits: Drop numeric characters
+        """
+        self._casefold = casefold
+        self._strip_accents = strip_accents
+        self._table = _translation_table(strip_accents, strip_punctuation, strip_digits)
+
+    def normalize(self, text: str) -> str:
+        """
+        Normalize string according to the configuration
+
+        Args:
+            text: Input string to normalize
+
+        Returns:
+            Normalized string
+        """
+        if self._strip_accents:
+            text = unicodedata.normalize("NFKD", text)
+        if self._casefold:
+            text = text.casefold()
+        return text.translate(self._table)
+
+
+# Named normalization profiles selectable per request
+NORMALIZERS: Dict[str, StringNormalizer] = {
+    "default": CaseInsensitiveNormalizer(),
+    "casefold": FoldingNormalizer(),
+    "accents": FoldingNormalizer(strip_accents=True),
+    "letters": FoldingNormalizer(strip_accents=True, strip_punctuation=True, strip_digits=True),
+}
+
+
+class SignatureCache(Protocol):
+    """Interface for memoizing anagram signatures (Interface Segregation Principle)"""
+    def get_or_compute(self, key: Hashable, compute: Callable[[], str]) -> str:
+        """Return the cached value for key, computing it on a miss"""
+        ...
+
+
+def anagram_signature(normalized: str) -> str:
+    """
+    Build the canonical anagram signature of a normalized string
+
+    Two normalized strings are anagrams exactly when their signatures are
+    equal, which makes the signature usable as a dictionary key.
+
+    Args:
+        normalized: String already passed through a StringNormalizer
+
+    Returns:
+        The characters of the string in sorted order
+    """
+    return ''.join(sorted(normalized))
+
+
+class StageObserver(Protocol):
+    """Interface for receiving timing and size measurements (Interface Segregation Principle)"""
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """Record the duration of one processing stage"""
+        ...
+
+    def observe_input(self, chars: int) -> None:
+        """Record the size of one checked input"""
+        ...
+
+
+class TimedNormalizer:
+    """
+    Decorates a StringNormalizer with stage timing
+    (Open/Closed Principle - adds instrumentation without modification)
+    """
+
+    def __init__(self, normalizer: StringNormalizer, observer: StageObserver):
+        """
+        Initialize with the normalizer to time and the observer to report to
+
+        Args:
+            normalizer: Wrapped normalizer
+            observer: Receives the "normalize" stage duration
+        """
+        self._normalizer = normalizer
+        self._observer = observer
+
+    def normalize(self, text: str) -> str:
+        """
+        Normalize text with the wrapped normalizer, timing the call
+
+        Args:
+            text: Input string to normalize
+
+        Returns:
+            Normalized string
+        """
+        started = time.perf_counter()
+        normalized = self._normalizer.normalize(text)
+        self._observer.observe_stage("normalize", time.perf_counter() - started)
+        return normalized
+
+
 class AnagramValidator(ABC):
     """Abstract base class for anagram validation (Open/Closed Principle)"""
 
@@ -68,21 +251,229 @@ class SortedAnagramValidator(AnagramValidator):
         return sorted(normalized1) == sorted(normalized2)
 
 
+class CountingAnagramValidator(AnagramValidator):
+    """
+    Validates anagrams by counting characters in a single linear pass
+    (Single Responsibility Principle)
+    """
+
+    def __init__(self, normalizer: StringNormalizer):
+        """
+        Initialize validator with a normalizer
+        (Dependency Inversion Principle - depends on abstraction)
+        """
+        self._normalizer = normalizer
+
+    def validate(self, str1: str, str2: str) -> bool:
+        """
+        Check if two strings are anagrams by comparing character counts
+
+        Strings of different normalized length are rejected immediately.
+        Latin-1 text is counted in a dense 256-slot array; any other
+        Unicode text falls back to a dictionary of counts.
+
+        Args:
+            str1: First string
+            str2: Second string
+
+        Returns:
+            True if strings are anagrams, False otherwise
+        """
+        normalized1 = self._normalizer.normalize(str1)
+        normalized2 = self._normalizer.normalize(str2)
+
+        if len(normalized1) != len(normalized2):
+            return False
+
+        try:
+            encoded1 = normalized1.encode('latin-1')
+            encoded2 = normalized2.encode('latin-1')
+        except UnicodeEncodeError:
+            return Counter(normalized1) == Counter(normalized2)
+
+        counts = [0] * 256
+        for code in encoded1:
+            counts[code] += 1
+        for code in encoded2:
+            counts[code] -= 1
+        return not any(counts)
+
+
+# Longest input CachedAnagramValidator caches by default
+MAX_CACHED_LENGTH = 1024
+
+
+class CachedAnagramValidator(AnagramValidator):
+    """
+    Validates anagrams by comparing memoized signatures
+    (Open/Closed Principle - decorates another validator)
+
+    Inputs up to max_cached_length characters are mapped to their
+    signature through the cache, so a repeated input costs one dictionary
+    lookup. Longer inputs are passed to the wrapped validator to keep the
+    cache from holding large strings.
+    """
+
+    def __init__(
+        self,
+        normalizer: StringNormalizer,
+        cache: SignatureCache,
+        fallback: AnagramValidator,
+        max_cached_length: int = MAX_CACHED_LENGTH,
+        namespace: str = ""
+    ):
+        """
+        Initialize validator with a normalizer, a cache and a fallback
+
+        Args:
+            normalizer: Normalizer used to build signatures
+            cache: Cache mapping raw inputs to signatures
+            fallback: Validator used for inputs too long to cache
+            max_cached_length: Longest input that is cached
+            namespace: Key prefix so validators with different normalizers
+                can share one cache
+        """
+        self._normalizer = normalizer
+        self._cache = cache
+        self._fallback = fallback
+        self._max_cached_length = max_cached_length
+        self._namespace = namespace
+
+    def signature(self, text: str) -> str:
+        """
+        Return the signature of text, using the cache
+
+        Args:
+            text: Raw input string
+
+        Returns:
+            Canonical anagram signature
+        """
+        key = (self._namespace, text) if self._namespace else text
+        return self._cache.get_or_compute(
+            key, lambda: anagram_signature(self._normalizer.normalize(text))
+        )
+
+    def validate(self, str1: str, str2: str) -> bool:
+        """
+        Check if two strings are anagrams by comparing their signatures
+
+        Args:
+            str1: First string
+            str2: Second string
+
+        Returns:
+            True if strings are anagrams, False otherwise
+        """
+        if len(str1) > self._max_cached_length or len(str2) > self._max_cached_length:
+            return self._fallback.validate(str1, str2)
+        return self.signature(str1) == self.signature(str2)
+
+
+def multiset_distance(normalized1: str, normalized2: str) -> int:
+    """
+    Count the letter edits separating two strings as multisets
+
+    An edit inserts, deletes or substitutes one letter; order is ignored.
+    A substitution removes one surplus letter from each side, so the
+    distance is the larger of the two surpluses.
+
+    Args:
+        normalized1: First normalized string
+        normalized2: Second normalized string
+
+    Returns:
+        Minimum number of edits; 0 for exact anagrams
+    """
+    counts1 = Counter(normalized1)
+    counts2 = Counter(normalized2)
+    surplus1 = sum((counts1 - counts2).values())
+    surplus2 = sum((counts2 - counts1).values())
+    return max(surplus1, surplus2)
+
+
+class NearAnagramValidator(AnagramValidator):
+    """
+    Validates near-anagrams within a bounded number of letter edits
+    (Single Responsibility Principle)
+    """
+
+    def __init__(self, normalizer: StringNormalizer, max_distance: int = 1):
+        """
+        Initialize validator with a normalizer and an edit tolerance
+        (Dependency Inversion Principle - depends on abstraction)
+
+        Args:
+            normalizer: Normalizer applied before comparing
+            max_distance: Largest multiset distance still accepted
+        """
+        if max_distance < 0:
+            raise ValueError("max_distance must not be negative")
+        self._normalizer = normalizer
+        self._max_distance = max_distance
+
+    def distance(self, str1: str, str2: str) -> int:
+        """
+        Compute the multiset distance between two strings
+
+        Args:
+            str1: First string
+            str2: Second string
+
+        Returns:
+            Minimum number of letter edits
+        """
+        return multiset_distance(
+            self._normalizer.normalize(str1), self._normalizer.normalize(str2)
+        )
+
+    def validate(self, str1: str, str2: str) -> bool:
+        """
+        Check if two strings are anagrams within max_distance edits
+
+        Args:
+            str1: First string
+            str2: Second string
+
+        Returns:
+            True if strings are near-anagrams, False otherwise
+        """
+        normalized1 = self._normalizer.normalize(str1)
+        normalized2 = self._normalizer.normalize(str2)
+
+        if abs(len(normalized1) - len(normalized2)) > self._max_distance:
+            return False
+        return multiset_distance(normalized1, normalized2) <= self._max_distance
+
+
+VALIDATORS: Dict[str, Type[AnagramValidator]] = {
+    "counting": CountingAnagramValidator,
+    "sorted": SortedAnagramValidator,
+}
+
+
 class AnagramChecker:
     """
     Main class for checking anagrams
     (Single Responsibility Principle - orchestrates the checking process)
     """
 
-    def __init__(self, validator: AnagramValidator):
+    def __init__(
+        self,
+        validator: AnagramValidator,
+        observer: Optional[StageObserver] = None
+    ):
         """
         Initialize checker with a validator
         (Dependency Inversion Principle)
 
         Args:
             validator: AnagramValidator implementation
+            observer: Optional receiver of input sizes and the
+                "validate" stage duration
         """
         self._validator = validator
+        self._observer = observer
 
     def check(self, input1: str, input2: str) -> bool:
         """
@@ -98,17 +489,385 @@ class AnagramChecker:
         if not isinstance(input1, str) or not isinstance(input2, str):
             raise ValueError("Both inputs must be strings")
 
-        return self._validator.validate(input1, input2)
+        if self._observer is None:
+            return self._validator.validate(input1, input2)
+
+        self._observer.observe_input(len(input1))
+        self._observer.observe_input(len(input2))
+        started = time.perf_counter()
+        result = self._validator.validate(input1, input2)
+        self._observer.observe_stage("validate", time.perf_counter() - started)
+        return result
+
+    def check_batch(self, pairs: Iterable[Tuple[str, str]]) -> List[bool]:
+        """
+        Check many input pairs in a single pass
+
+        Args:
+            pairs: Iterable of (input1, input2) tuples
+
+        Returns:
+            List of results in the same order as the pairs
+        """
+        if self._observer is not None:
+            return [self.check(input1, input2) for input1, input2 in pairs]
+
+        validate = self._validator.validate
+        results = []
+        for input1, input2 in pairs:
+            if not isinstance(input1, str) or not isinstance(input2, str):
+                raise ValueError("Both inputs must be strings")
+            results.append(validate(input1, input2))
+        return results
+
+
+class LetterBalance:
+    """
+    Running letter-count difference between two texts
+    (Single Responsibility Principle - incremental re-evaluation)
+
+    Text added to or removed from either side adjusts the per-character
+    difference, and a counter of unbalanced characters makes the anagram
+    test O(1). Fragments are normalized on their own, which matches
+    normalizing the whole text for character-wise normalizers such as
+    CaseInsensitiveNormalizer.
+    """
+
+    def __init__(self, normalizer: StringNormalizer):
+        """
+        Initialize an empty balance
+
+        Args:
+            normalizer: Normalizer applied to every fragment
+        """
+        self._normalizer = normalizer
+        self._delta: Dict[str, int] = {}
+        self._unbalanced = 0
+
+    def _adjust(self, text: str, amount: int) -> int:
+        delta = self._delta
+        normalized = self._normalizer.normalize(text)
+        for char, count in Counter(normalized).items():
+            before = delta.get(char, 0)
+            after = before + amount * count
+            if after:
+                delta[char] = after
+                if not before:
+                    self._unbalanced += 1
+            else:
+                del delta[char]
+                self._unbalanced -= 1
+        return len(normalized)
+
+    def add(self, text: str, side: int) -> int:
+        """
+        Add text to one side
+
+        Args:
+            text: Fragment to add
+            side: 1 for the first text, 2 for the second
+
+        Returns:
+            Number of normalized characters added
+        """
+        return self._adjust(text, 1 if side == 1 else -1)
+
+    def remove(self, text: str, side: int) -> None:
+        """
+        Remove previously added text from one side
+
+        Args:
+            text: Fragment to remove
+            side: 1 for the first text, 2 for the second
+        """
+        self._adjust(text, -1 if side == 1 else 1)
+
+    def is_anagram(self) -> bool:
+        """
+        Check whether both sides currently hold the same letters
+
+        Returns:
+            True if every character count matches
+        """
+        return self._unbalanced == 0
 
 
-def create_anagram_checker() -> AnagramChecker:
+class AnagramAccumulator:
+    """
+    Streaming anagram check over chunked input
+    (Single Responsibility Principle - incremental comparison of large texts)
+
+    Chunks of either text can be fed in any order and size. Bytes are
+    decoded with an incremental decoder per side, so multi-byte characters
+    may be split across chunks. Each chunk is normalized and counted on its
+    own and folded into a LetterBalance, so memory stays O(alphabet) plus
+    one chunk no matter how large the documents are.
+    """
+
+    def __init__(
+        self,
+        normalizer: StringNormalizer,
+        encoding: str = "utf-8",
+        errors: str = "strict"
+    ):
+        """
+        Initialize an empty accumulator
+
+        Args:
+            normalizer: Character-wise normalizer applied to every chunk
+            encoding: Encoding of bytes chunks
+            errors: Decoding error handler, as for bytes.decode
+
+        Raises:
+            LookupError: If the encoding is unknown or is not a text
+                encoding (e.g. rot13 or zlib)
+        """
+        # Bytes-to-bytes and str-to-str codecs would not produce text, and
+        # decompressing ones would break the memory bound
+        if not codecs.lookup(encoding)._is_text_encoding:
+            raise LookupError(f"{encoding!r} is not a text encoding")
+        decoder = codecs.getincrementaldecoder(encoding)
+        self._decoders = {1: decoder(errors), 2: decoder(errors)}
+        self._balance = LetterBalance(normalizer)
+        self._sizes = {1: 0, 2: 0}
+
+    def feed(self, chunk: Union[str, bytes], side: int) -> None:
+        """
+        Add the next chunk of one text
+
+        Args:
+            chunk: Text, or bytes in the accumulator's encoding
+            side: 1 for the first text, 2 for the second
+
+        Raises:
+            ValueError: If side is not 1 or 2, or bytes cannot be decoded
+        """
+        if side not in (1, 2):
+            raise ValueError("side must be 1 or 2")
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            chunk = self._decoders[side].decode(chunk)
+        self._sizes[side] += self._balance.add(chunk, side)
+
+    def result(self) -> bool:
+        """
+        Finish both texts and report whether they are anagrams
+
+        Returns:
+            True if both texts have the same normalized characters
+
+        Raises:
+            ValueError: If a text ends with an incomplete byte sequence
+        """
+        for side in (1, 2):
+            self.feed(self._decoders[side].decode(b"", final=True), side)
+        return self._balance.is_anagram()
+
+    @property
+    def sizes(self) -> Tuple[int, int]:
+        """Normalized character counts fed so far for both texts"""
+        return self._sizes[1], self._sizes[2]
+
+
+Index = TypeVar("Index", bound="WordListIndex")
+
+
+class WordListIndex:
+    """
+    Mixin for corpus indexes constructed as cls(normalizer, words)
+    (Don't Repeat Yourself - one way to load a word list file)
+    """
+
+    @classmethod
+    def from_file(cls: Type[Index], path: str, normalizer: StringNormalizer) -> Index:
+        """
+        Build an index from a word list file (see read_word_list)
+
+        Args:
+            path: Path to the word list
+            normalizer: Passed to the index constructor
+
+        Returns:
+            Index populated with every word in the file
+        """
+        return cls(normalizer, read_word_list(path))
+
+
+class AnagramIndex(WordListIndex):
+    """
+    Signature-keyed index of a word corpus
+    (Single Responsibility Principle - answers "anagrams of X" queries)
+
+    Words are grouped by the signature of their normalized form, so a
+    lookup costs one normalization plus one dictionary access regardless
+    of corpus size.
+    """
+
+    def __init__(self, normalizer: StringNormalizer, words: Iterable[str] = ()):
+        """
+        Initialize the index
+
+        Args:
+            normalizer: Normalizes words and queries before their signatures
+                are taken, so it decides which spellings share a group
+            words: Initial corpus
+        """
+        self._normalizer = normalizer
+        self._groups: Dict[str, List[str]] = {}
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        """
+        Add a word to the index; duplicates are ignored
+
+        Args:
+            word: Word to add
+        """
+        group = self._groups.setdefault(self.signature(word), [])
+        if word not in group:
+            group.append(word)
+            self._size += 1
+
+    def signature(self, text: str) -> str:
+        """
+        Compute the index key of text
+
+        Args:
+            text: Raw input string
+
+        Returns:
+            Canonical anagram signature
+        """
+        return anagram_signature(self._normalizer.normalize(text))
+
+    def lookup(self, word: str) -> List[str]:
+        """
+        Find all corpus words that are anagrams of word
+
+        Entries that normalize to the same string as the query (the query
+        itself, possibly in another case) are left out.
+
+        Args:
+            word: Query string
+
+        Returns:
+            Matching words in insertion order
+        """
+        normalized = self._normalizer.normalize(word)
+        group = self._groups.get(anagram_signature(normalized), [])
+        return [
+            candidate for candidate in group
+            if self._normalizer.normalize(candidate) != normalized
+        ]
+
+    def groups(self) -> Dict[str, List[str]]:
+        """
+        Return the signature to words mapping
+
+        Returns:
+            Dictionary of signature to words (not a copy)
+        """
+        return self._groups
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def group_anagrams(
+    words: Iterable[str],
+    normalizer: StringNormalizer,
+    min_size: int = 1
+) -> List[List[str]]:
+    """
+    Partition words into anagram classes in a single pass
+
+    Args:
+        words: Input strings; duplicates are kept in their group
+        normalizer: Normalizer defining which strings are anagrams
+        min_size: Only return groups with at least this many members
+
+    Returns:
+        Groups in order of first appearance, members in input order
+    """
+    groups: Dict[str, List[str]] = {}
+    for word in words:
+        groups.setdefault(anagram_signature(normalizer.normalize(word)), []).append(word)
+    return [group for group in groups.values() if len(group) >= min_size]
+
+
+def read_word_list(path: str) -> Iterator[str]:
+    """
+    Read a UTF-8 word list with one word per line
+
+    Blank lines and lines starting with '#' are skipped.
+
+    Args:
+        path: Path to the word list
+
+    Yields:
+        Each word with surrounding whitespace stripped
+    """
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            word = line.strip()
+            if word and not word.startswith("#"):
+                yield word
+
+
+def create_anagram_checker(
+    strategy: str = "counting",
+    cache: Optional[SignatureCache] = None,
+    observer: Optional[StageObserver] = None,
+    normalization: str = "default"
+) -> AnagramChecker:
     """
     Factory function to create AnagramChecker instance
     (Dependency Injection)
 
+    Args:
+        strategy: Name of the validator to use ("counting" or "sorted")
+        cache: Optional signature cache; when given, the validator is
+            wrapped in a CachedAnagramValidator
+        observer: Optional receiver of per-stage timings and input sizes
+        normalization: Name of the normalization profile in NORMALIZERS
+
     Returns:
         Configured AnagramChecker instance
+
+    Raises:
+        ValueError: If the strategy or normalization profile is unknown
+    """
+    try:
+        validator_class = VALIDATORS[strategy]
+    except KeyError:
+        raise ValueError(f"Unknown validator strategy: {strategy}")
+    try:
+        normalizer = NORMALIZERS[normalization]
+    except KeyError:
+        raise ValueError(f"Unknown normalization profile: {normalization}")
+
+    if observer is not None:
+        normalizer = TimedNormalizer(normalizer, observer)
+    validator = validator_class(normalizer)
+    if cache is not None:
+        namespace = "" if normalization == "default" else normalization
+        validator = CachedAnagramValidator(normalizer, cache, validator, namespace=namespace)
+    return AnagramChecker(validator, observer)
+
+
+def create_anagram_index(path: Optional[str] = None) -> AnagramIndex:
+    """
+    Factory function to create AnagramIndex instance
+    (Dependency Injection)
+
+    Args:
+        path: Optional word list to load; an empty index is built without one
+
+    Returns:
+        AnagramIndex using the same normalizer as create_anagram_checker
     """
     normalizer = CaseInsensitiveNormalizer()
-    validator = SortedAnagramValidator(normalizer)
-    return AnagramChecker(validator)
+    if path is None:
+        return AnagramIndex(normalizer)
+    return AnagramIndex.from_file(path, normalizer)
@@ -1,16 +1,85 @@
 """
 FastAPI application for Anagram Checker
 """
-from fastapi import FastAPI, HTTPException
+import functools
+import hmac
+import json
+import os
+import threading
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from src.anagram_checker import create_anagram_checker
-from src.models import AnagramRequest, AnagramResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse, StreamingResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from src.anagram_checker import (
+    MAX_CACHED_LENGTH,
+    AnagramAccumulator,
+    NORMALIZERS,
+    CaseInsensitiveNormalizer,
+    create_anagram_checker,
+    create_anagram_index,
+    group_anagrams,
+)
+from src.cache import LRUCache, TieredCache, create_shared_cache
+from src.executor import DispatcherBusyError, SingleFlight, SizeAwareDispatcher
+from src.live import LiveCheckSession
+from src.metrics import Metrics, MetricsMiddleware, stats_collector
+from src.models import (
+    MAX_NEAR_ANAGRAM_WORD,
+    MAX_SUBANAGRAM_LETTERS,
+    AnagramBatchRequest,
+    AnagramBatchResponse,
+    AnagramGroupRequest,
+    AnagramGroupResponse,
+    AnagramLookupResponse,
+    AnagramRequest,
+    AnagramResponse,
+    AnagramUploadResponse,
+    NearAnagramMatch,
+    NearAnagramResponse,
+    Normalization,
+    SubAnagramResponse,
+)
+from src.profiler import ProfilerBusyError, SamplingProfiler, render_collapsed
+from src.responses import FastJSONResponse
+from src.streaming import (
+    NDJSON_MEDIA_TYPE,
+    DuplexStreamingResponse,
+    LineTooLongError,
+    iter_lines,
+)
+from src.ui import INDEX_HTML, StaticPage
+from src.word_search import NearAnagramIndex, PhraseAnagramSearch, SubAnagramIndex
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Pre-warm before serving and release worker threads and processes on
+    shutdown
+
+    Uvicorn only starts accepting connections once this startup part has
+    finished. ANAGRAM_PREWARM=1 (the default) warms the checkers and maps
+    an ANAGRAM_INDEX_FILE index, which takes milliseconds;
+    ANAGRAM_PREWARM=all also builds the word-list indexes, trading a
+    slower cold start for fast first lookups.
+    """
+    prewarm = os.getenv("ANAGRAM_PREWARM", "1")
+    if prewarm != "0":
+        warm_up(include_indexes=prewarm == "all")
+    yield
+    check_dispatcher.close()
+    if process_backend is not None:
+        process_backend.close()
+
 
 app = FastAPI(
     title="Anagram Checker API",
     description="API to check if two strings are anagrams",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware for web UI access
@@ -22,194 +91,697 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create anagram checker instance
-checker = create_anagram_checker()
+# ANAGRAM_ECHO_INPUTS=0 omits input1/input2 from /api/check responses
+echo_inputs = os.getenv("ANAGRAM_ECHO_INPUTS", "1") != "0"
+
+# Web UI, encoded and compressed once (UI_CACHE_MAX_AGE sets Cache-Control)
+index_page = StaticPage(INDEX_HTML, max_age=int(os.getenv("UI_CACHE_MAX_AGE", "300")))
+
+# Metrics and per-stage timing (METRICS_ENABLED=0 removes all instrumentation)
+metrics = Metrics() if os.getenv("METRICS_ENABLED", "1") != "0" else None
+if metrics is not None:
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+
+def timed(stage: str):
+    """Record an endpoint's handler time as a stage when metrics are enabled"""
+    if metrics is None:
+        return lambda endpoint: endpoint
+    return metrics.timed(stage)
+
+
+# Normalizer shared by corpus lookups and grouping so they match check()
+normalizer = CaseInsensitiveNormalizer()
+
+# Signature cache for repeated inputs (ANAGRAM_CACHE_SIZE=0 disables it)
+_cache_size = int(os.getenv("ANAGRAM_CACHE_SIZE", "10000"))
+_cache_ttl = float(os.getenv("ANAGRAM_CACHE_TTL", "0"))
+signature_cache = LRUCache(_cache_size, _cache_ttl) if _cache_size > 0 else None
+
+# Cache shared by all worker processes behind the local one, e.g.
+# ANAGRAM_SHARED_CACHE=sqlite:////tmp/anagram-cache.db or redis://localhost:6379/0.
+# Its lookups block, so checks that may use it run on the check threads.
+shared_cache_enabled = bool(os.getenv("ANAGRAM_SHARED_CACHE"))
+if shared_cache_enabled:
+    signature_cache = TieredCache(
+        create_shared_cache(
+            os.environ["ANAGRAM_SHARED_CACHE"],
+            int(os.getenv("ANAGRAM_SHARED_CACHE_SIZE", "100000"))
+        ),
+        local=signature_cache
+    )
+
+# One checker per normalization profile (ANAGRAM_VALIDATOR selects the
+# strategy); the profiles share the signature cache under separate keys
+checkers = {
+    name: create_anagram_checker(
+        os.getenv("ANAGRAM_VALIDATOR", "counting"),
+        cache=signature_cache,
+        observer=metrics,
+        normalization=name
+    )
+    for name in NORMALIZERS
+}
+checker = checkers["default"]
+
+# Process pool for large batch and grouping requests (ANAGRAM_PROCESS_WORKERS=0,
+# the default, keeps everything in the server process). Requests smaller than
+# ANAGRAM_PROCESS_MIN_BATCH items always run inline.
+_process_workers = int(os.getenv("ANAGRAM_PROCESS_WORKERS", "0"))
+process_backend = None
+if _process_workers > 0:
+    from src.executor import ProcessPoolBackend
+
+    process_backend = ProcessPoolBackend(
+        os.getenv("ANAGRAM_VALIDATOR", "counting"),
+        workers=_process_workers,
+        min_parallel=int(os.getenv("ANAGRAM_PROCESS_MIN_BATCH", "4096"))
+    )
+
+if metrics is not None and signature_cache is not None:
+    metrics.add_collector(
+        stats_collector("anagram_cache", "Signature cache counter", signature_cache.stats)
+    )
+
+# Single checks and batches longer than ANAGRAM_INLINE_MAX_CHARS (all inputs
+# together) run on ANAGRAM_CHECK_THREADS threads; beyond ANAGRAM_CHECK_QUEUE
+# queued or running large checks, /api/check and /api/check/batch answer
+# 503 (/api/check/stream reports it per line). ANAGRAM_MAX_INPUT_LENGTH
+# caps each input (0 = unlimited).
+check_dispatcher = SizeAwareDispatcher(
+    inline_limit=int(os.getenv("ANAGRAM_INLINE_MAX_CHARS", "10000")),
+    workers=int(os.getenv("ANAGRAM_CHECK_THREADS", "4")),
+    max_pending=int(os.getenv("ANAGRAM_CHECK_QUEUE", "32"))
+)
+max_input_length = int(os.getenv("ANAGRAM_MAX_INPUT_LENGTH", "1000000"))
+if metrics is not None:
+    metrics.add_collector(
+        stats_collector("anagram_dispatch", "Check dispatch counter", check_dispatcher.stats)
+    )
+
+# Concurrent offloaded checks of the same pair (in either order, same
+# profile) share one computation (ANAGRAM_COALESCE=0 disables this).
+# Inline checks finish before another request can start, so they are
+# never in flight together and skip the lookup.
+check_flights = SingleFlight() if os.getenv("ANAGRAM_COALESCE", "1") != "0" else None
+if metrics is not None and check_flights is not None:
+    metrics.add_collector(
+        stats_collector("anagram_coalesce", "Single check coalescing counter", check_flights.stats)
+    )
+
+# Word corpus for the lookup endpoints. The indexes are built on first
+# use, on a worker thread, so they neither slow down a cold start nor
+# block the event loop; ANAGRAM_PREWARM=all builds them before traffic
+# instead. ANAGRAM_INDEX_FILE points
+# at a prebuilt memory-mapped index and takes precedence over building
+# one from the ANAGRAM_WORDLIST word list.
+DEFAULT_WORDLIST = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "words.txt"
+)
+wordlist_path = os.getenv("ANAGRAM_WORDLIST", DEFAULT_WORDLIST)
+
+
+def build_once(build):
+    """
+    Make a builder run at most once, even when called from several threads
+
+    Args:
+        build: Zero-argument callable creating an expensive object
+
+    Returns:
+        Getter returning the built object; its is_built() tells whether
+        the build has already happened
+    """
+    lock = threading.Lock()
+    built = []
+
+    @functools.wraps(build)
+    def get():
+        if not built:
+            with lock:
+                if not built:
+                    built.append(build())
+        return built[0]
+
+    get.is_built = lambda: bool(built)
+    return get
+
+
+async def load(getter):
+    """
+    Return a build_once object, building it on a worker thread the first time
+
+    Args:
+        getter: Function decorated with build_once
+
+    Returns:
+        The built object
+    """
+    if getter.is_built():
+        return getter()
+    return await run_in_threadpool(getter)
+
+
+@build_once
+def get_anagram_index():
+    """Index for "find all anagrams" queries"""
+    if os.getenv("ANAGRAM_INDEX_FILE"):
+        from src.index_file import MappedAnagramIndex
+
+        return MappedAnagramIndex(os.environ["ANAGRAM_INDEX_FILE"], normalizer)
+    return create_anagram_index(wordlist_path)
+
+
+@build_once
+def get_sub_anagram_index() -> SubAnagramIndex:
+    """Letter trie over the word list for "can be spelled from" queries"""
+    return SubAnagramIndex.from_file(wordlist_path, normalizer)
+
+
+@build_once
+def get_phrase_search() -> PhraseAnagramSearch:
+    """Multi-word anagram search over the letter trie"""
+    return PhraseAnagramSearch(get_sub_anagram_index())
+
+
+@build_once
+def get_near_anagram_index() -> NearAnagramIndex:
+    """Length- and letter-mask-bucketed index for near-anagram queries"""
+    return NearAnagramIndex.from_file(wordlist_path, normalizer)
+
+
+def warm_up(include_indexes: bool = False) -> None:
+    """
+    Run the hot paths once so lazily built state exists before traffic
+
+    A memory-mapped ANAGRAM_INDEX_FILE index is always opened and
+    preloaded, since that costs milliseconds whatever the corpus size.
+
+    Args:
+        include_indexes: Also build and exercise the word-list indexes
+    """
+    for profile_checker in checkers.values():
+        profile_checker.check("A gentleman", "Elegant Man")
+    FastJSONResponse({"result": True})
+    if os.getenv("ANAGRAM_INDEX_FILE"):
+        get_anagram_index().preload()
+    if not include_indexes:
+        return
+    anagram_index = get_anagram_index()
+    anagram_index.lookup("listen")
+    get_sub_anagram_index().search("listen", limit=1)
+    get_near_anagram_index().lookup("listen", limit=1)
+    next(get_phrase_search().search("listen", max_results=1, max_seconds=0.1), None)
 
 
 @app.get("/", response_class=HTMLResponse)
-async def root():
-    """Serve the web UI"""
-    return """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Anagram Checker</title>
-        <style>
-            body {
-                font-family: Arial, sans-serif;
-                max-width: 800px;
-                margin: 50px auto;
-                padding: 20px;
-                background-color: #f5f5f5;
-            }
-            .container {
-                background-color: white;
-                padding: 30px;
-                border-radius: 10px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            }
-            h1 {
-                color: #333;
-                text-align: center;
-            }
-            .form-group {
-                margin: 20px 0;
-            }
-            label {
-                display: block;
-                margin-bottom: 5px;
-                font-weight: bold;
-                color: #555;
-            }
-            input[type="text"] {
-                width: 100%;
-                padding: 10px;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                font-size: 16px;
-                box-sizing: border-box;
-            }
-            button {
-                width: 100%;
-                padding: 12px;
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-                cursor: pointer;
-                margin-top: 10px;
-            }
-            button:hover {
-                background-color: #45a049;
-            }
-            #result {
-                margin-top: 20px;
-                padding: 15px;
-                border-radius: 5px;
-                text-align: center;
-                font-size: 18px;
-                font-weight: bold;
-                display: none;
-            }
-            .result-true {
-                background-color: #d4edda;
-                color: #155724;
-                border: 1px solid #c3e6cb;
-            }
-            .result-false {
-                background-color: #f8d7da;
-                color: #721c24;
-                border: 1px solid #f5c6cb;
-            }
-            .example {
-                background-color: #e7f3ff;
-                padding: 15px;
-                border-radius: 5px;
-                margin-top: 20px;
-            }
-            .example h3 {
-                margin-top: 0;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>Anagram Checker</h1>
-            <p style="text-align: center; color: #666;">
-                Check if two strings are anagrams of each other
-            </p>
-
-            <form id="anagramForm">
-                <div class="form-group">
-                    <label for="input1">Input 1:</label>
-                    <input type="text" id="input1" name="input1" required
-                           placeholder="Enter first string" data-testid="input1">
-                </div>
-
-                <div class="form-group">
-                    <label for="input2">Input 2:</label>
-                    <input type="text" id="input2" name="input2" required
-                           placeholder="Enter second string" data-testid="input2">
-                </div>
-
-                <button type="submit" data-testid="check-button">Check Anagram</button>
-            </form>
-
-            <div id="result" data-testid="result"></div>
-
-            <div class="example">
-                <h3>Examples:</h3>
-                <ul>
-                    <li><strong>listen</strong> and <strong>silent</strong> → TRUE</li>
-                    <li><strong>hello</strong> and <strong>world</strong> → FALSE</li>
-                    <li><strong>A gentleman</strong> and <strong>Elegant Man</strong> → TRUE</li>
-                    <li><strong>school master</strong> and <strong>the classroom</strong> → TRUE</li>
-                </ul>
-            </div>
-
-            <footer style="text-align: center; color: #777; margin-top: 25px; font-size: 14px;">
-                <span id="copyright"></span>
-            </footer>
-        </div>
-
-        <script>
-            // Set current year in footer
-            document.getElementById('copyright').textContent =
-              `\u00A9 ${new Date().getFullYear()} Siarhei Staravoitau`;
-
-            document.getElementById('anagramForm').addEventListener('submit', async (e) => {
-                e.preventDefault();
-
-                const input1 = document.getElementById('input1').value;
-                const input2 = document.getElementById('input2').value;
-
-                try {
-                    const response = await fetch('/api/check', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({ input1, input2 })
-                    });
-
-                    const data = await response.json();
-                    const resultDiv = document.getElementById('result');
-
-                    resultDiv.textContent = data.result ? 'TRUE - These are anagrams!' : 'FALSE - These are not anagrams';
-                    resultDiv.className = data.result ? 'result-true' : 'result-false';
-                    resultDiv.style.display = 'block';
-                } catch (error) {
-                    alert('Error checking anagram: ' + error.message);
-                }
-            });
-        </script>
-    </body>
-    </html>
+async def root(request: Request):
+    """Serve the web UI from precomputed, compressed bytes"""
+    return index_page.response(request.headers)
+
+
+def check_input_lengths(pairs) -> None:
     """
+    Enforce ANAGRAM_MAX_INPUT_LENGTH on every input
+
+    Args:
+        pairs: (input1, input2) tuples
+
+    Raises:
+        HTTPException: 413 if any input is longer than the limit
+    """
+    if max_input_length and any(
+        len(text) > max_input_length for pair in pairs for text in pair
+    ):
+        raise HTTPException(
+            status_code=413, detail=f"Inputs are limited to {max_input_length} characters"
+        )
+
+
+def uses_shared_cache(pairs) -> bool:
+    """
+    Whether checking pairs may look up the shared cache tier
+
+    Args:
+        pairs: (input1, input2) tuples
+
+    Returns:
+        True if a shared cache is configured and some pair is short
+        enough to be cached
+    """
+    return shared_cache_enabled and any(
+        len(input1) <= MAX_CACHED_LENGTH and len(input2) <= MAX_CACHED_LENGTH
+        for input1, input2 in pairs
+    )
 
 
 @app.post("/api/check", response_model=AnagramResponse)
-async def check_anagram(request: AnagramRequest):
+@timed("check_handler")
+async def check_anagram(
+    request: AnagramRequest,
+    normalization: Normalization = Query("default", description="Normalization profile")
+):
     """
     Check if two strings are anagrams
 
     Args:
         request: AnagramRequest with input1 and input2
+        normalization: Name of the normalization profile
 
     Returns:
         AnagramResponse with the result
     """
+    size = len(request.input1) + len(request.input2)
+    check_input_lengths([(request.input1, request.input2)])
+    args = (size, checkers[normalization].check, request.input1, request.input2)
     try:
-        result = checker.check(request.input1, request.input2)
-        return AnagramResponse(
-            input1=request.input1,
-            input2=request.input2,
-            result=result
+        if check_flights is not None and size > check_dispatcher.inline_limit:
+            key = (normalization, *sorted((request.input1, request.input2)))
+            result = await check_flights.run(key, check_dispatcher.run, *args)
+        elif uses_shared_cache([(request.input1, request.input2)]):
+            # Small, but the shared tier does blocking I/O off the loop
+            result = await check_dispatcher.offload(*args[1:])
+        else:
+            result = await check_dispatcher.run(*args)
+    except DispatcherBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if echo_inputs:
+        return FastJSONResponse(
+            {"input1": request.input1, "input2": request.input2, "result": result}
         )
+    return FastJSONResponse({"result": result})
+
+
+@app.post("/api/check/batch", response_model=AnagramBatchResponse)
+@timed("batch_handler")
+async def check_anagram_batch(
+    request: AnagramBatchRequest,
+    normalization: Normalization = Query("default", description="Normalization profile")
+):
+    """
+    Check many pairs of strings in one request
+
+    Each input is capped like /api/check. Batches whose inputs together
+    exceed the inline limit run on the check dispatcher's threads, and
+    with a process pool every batch is handed to it from those threads,
+    so the event loop stays free and the queue limit always applies.
+
+    Args:
+        request: AnagramBatchRequest with a list of pairs
+        normalization: Name of the normalization profile
+
+    Returns:
+        AnagramBatchResponse with one result per pair, in order
+    """
+    pairs = [(pair.input1, pair.input2) for pair in request.pairs]
+    check_input_lengths(pairs)
+    try:
+        if process_backend is not None:
+            # Through the dispatcher so the queue limit also bounds pool work
+            results = await check_dispatcher.offload(
+                process_backend.check_batch, pairs, normalization
+            )
+        elif uses_shared_cache(pairs):
+            results = await check_dispatcher.offload(checkers[normalization].check_batch, pairs)
+        else:
+            size = sum(len(input1) + len(input2) for input1, input2 in pairs)
+            results = await check_dispatcher.run(
+                size, checkers[normalization].check_batch, pairs
+            )
+    except DispatcherBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return FastJSONResponse({"results": results})
+
+
+@app.post("/api/check/stream", response_class=DuplexStreamingResponse)
+async def check_anagram_stream(request: Request):
+    """
+    Check an unbounded NDJSON feed of pairs
+
+    Each request line is a JSON object with input1 and input2. One NDJSON
+    result is written back per line as soon as it is computed; invalid
+    lines produce an error object carrying the line number instead. Input
+    is only read as fast as the client consumes the output. Lines get the
+    same length cap and size-aware dispatch as /api/check; an oversized
+    line or a full check queue is reported as that line's error.
+
+    Args:
+        request: Raw request whose body is newline-delimited JSON
+
+    Returns:
+        Streaming NDJSON response
+    """
+    async def results():
+        line_number = 0
+        try:
+            async for line in iter_lines(request.stream()):
+                line_number += 1
+                try:
+                    pair = AnagramRequest.model_validate_json(line)
+                    check_input_lengths([(pair.input1, pair.input2)])
+                    size = len(pair.input1) + len(pair.input2)
+                    result = {
+                        "input1": pair.input1,
+                        "input2": pair.input2,
+                        "result": await check_dispatcher.run(
+                            size, checker.check, pair.input1, pair.input2
+                        ),
+                    }
+                except HTTPException as e:
+                    result = {"line": line_number, "error": e.detail}
+                except (ValidationError, ValueError, DispatcherBusyError) as e:
+                    result = {"line": line_number, "error": str(e)}
+                yield json.dumps(result) + "\n"
+        except LineTooLongError as e:
+            yield json.dumps({"line": line_number + 1, "error": str(e)}) + "\n"
+
+    return DuplexStreamingResponse(results(), media_type=NDJSON_MEDIA_TYPE)
+
+
+@app.post("/api/check/upload", response_model=AnagramUploadResponse)
+async def check_anagram_upload(
+    request: Request,
+    x_input1_length: int = Header(..., ge=0, description="Size of the first document in bytes"),
+    encoding: str = Query("utf-8", description="Encoding of both documents")
+):
+    """
+    Compare two large documents sent back to back in the request body
+
+    The first X-Input1-Length bytes are the first document and the rest is
+    the second. The body is fed chunk by chunk into an AnagramAccumulator,
+    so memory stays bounded however large the documents are.
+
+    Args:
+        request: Raw request whose body holds both documents
+        x_input1_length: Byte length of the first document
+        encoding: Text encoding of the body
+
+    Returns:
+        AnagramUploadResponse with the result and normalized lengths
+    """
+    try:
+        accumulator = AnagramAccumulator(normalizer, encoding)
+    except LookupError:
+        raise HTTPException(status_code=400, detail=f"Unsupported encoding: {encoding}")
+
+    remaining = x_input1_length
+    try:
+        async for chunk in request.stream():
+            if remaining:
+                head = chunk[:remaining]
+                accumulator.feed(head, 1)
+                remaining -= len(head)
+                chunk = chunk[len(head):]
+            if chunk:
+                accumulator.feed(chunk, 2)
+        if remaining:
+            raise HTTPException(
+                status_code=400, detail="Body is shorter than X-Input1-Length"
+            )
+        result = accumulator.result()
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    input1_chars, input2_chars = accumulator.sizes
+    return FastJSONResponse(
+        {"result": result, "input1_chars": input1_chars, "input2_chars": input2_chars}
+    )
+
+
+@app.websocket("/ws/check")
+async def live_check(websocket: WebSocket):
+    """
+    Check anagrams as the user types
+
+    The client keeps one connection open and sends "set" or "edit"
+    messages (see LiveCheckSession). Every message is answered with
+    {"seq", "result", "complete"}, or {"seq", "error"} if it is invalid
+    (including binary frames); an invalid message leaves the session
+    unchanged.
+    Only the edited characters are re-counted, so each keystroke costs
+    O(1) regardless of text length.
+
+    Args:
+        websocket: Client connection
+    """
+    await websocket.accept()
+    session = LiveCheckSession(normalizer)
+    try:
+        while True:
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                break
+            message = None
+            try:
+                if frame.get("text") is None:
+                    raise ValueError("Messages must be text frames")
+                message = json.loads(frame["text"])
+                reply = session.apply(message)
+            except ValueError as e:
+                seq = message.get("seq") if isinstance(message, dict) else None
+                reply = {"seq": seq, "error": str(e)}
+            await websocket.send_text(json.dumps(reply))
+    except WebSocketDisconnect:
+        pass
+
+
+# Number of groups serialized per chunk of a streamed /api/group response
+GROUP_STREAM_CHUNK = 1000
+
+
+@app.post(
+    "/api/group",
+    response_class=StreamingResponse,
+    responses={200: {"model": AnagramGroupResponse}}
+)
+async def group_words(
+    request: AnagramGroupRequest,
+    normalization: Normalization = Query("default", description="Normalization profile")
+):
+    """
+    Partition a word list into anagram classes
+
+    The body has the shape of AnagramGroupResponse but is streamed in
+    chunks, so large results are never serialized as one string. Grouping
+    runs on a worker thread (or the process pool) so a million-word
+    request does not stall other connections.
+
+    Args:
+        request: AnagramGroupRequest with the words and minimum group size
+        normalization: Name of the normalization profile
+
+    Returns:
+        Streaming JSON response with the groups
+    """
+    if process_backend is not None:
+        groups = await run_in_threadpool(
+            process_backend.group_anagrams, request.words, request.min_size, normalization
+        )
+    else:
+        groups = await run_in_threadpool(
+            group_anagrams, request.words, NORMALIZERS[normalization], request.min_size
+        )
+
+    def body():
+        yield '{"groups":['
+        for start in range(0, len(groups), GROUP_STREAM_CHUNK):
+            chunk = groups[start:start + GROUP_STREAM_CHUNK]
+            prefix = "," if start else ""
+            yield prefix + ",".join(json.dumps(group) for group in chunk)
+        yield "]}"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+@app.get("/api/anagrams", response_model=AnagramLookupResponse)
+async def find_anagrams(word: str = Query(..., min_length=1, description="Word to look up")):
+    """
+    Find all words in the corpus that are anagrams of a word
+
+    Args:
+        word: Query string
+
+    Returns:
+        AnagramLookupResponse with the matching corpus words
+    """
+    anagram_index = await load(get_anagram_index)
+    return AnagramLookupResponse(word=word, anagrams=anagram_index.lookup(word))
+
+
+@app.get("/api/subanagrams", response_model=SubAnagramResponse)
+async def find_subanagrams(
+    letters: str = Query(
+        ..., min_length=1, max_length=MAX_SUBANAGRAM_LETTERS, description="Available letters"
+    ),
+    min_length: int = Query(1, ge=1, description="Shortest word to return"),
+    limit: int = Query(100, ge=1, le=10000, description="Maximum words to return")
+):
+    """
+    Find corpus words that can be spelled from a set of letters
+
+    The trie walk visits every reachable word before limit is applied,
+    so it runs on a worker thread.
+
+    Args:
+        letters: Available letters; each may be used once per occurrence
+        min_length: Shortest word to return
+        limit: Maximum number of words to return
+
+    Returns:
+        SubAnagramResponse with matching words, longest first
+    """
+    sub_anagram_index = await load(get_sub_anagram_index)
+    words = await run_in_threadpool(
+        sub_anagram_index.search, letters, min_length=min_length, limit=limit
+    )
+    return SubAnagramResponse(letters=letters, words=words)
+
+
+@app.get("/api/near-anagrams", response_model=NearAnagramResponse)
+async def find_near_anagrams(
+    word: str = Query(
+        ..., min_length=1, max_length=MAX_NEAR_ANAGRAM_WORD, description="Word to look up"
+    ),
+    max_distance: int = Query(1, ge=0, le=3, description="Maximum letter edits"),
+    limit: int = Query(50, ge=1, le=10000, description="Maximum matches to return")
+):
+    """
+    Find corpus words that are anagrams of a word within a few letter edits
+
+    At max_distance=3 a lookup can compare tens of thousands of
+    candidates, so it runs on a worker thread.
+
+    Args:
+        word: Query string
+        max_distance: Maximum inserted, deleted or substituted letters
+        limit: Maximum number of matches to return
+
+    Returns:
+        NearAnagramResponse with matches ranked by distance
+    """
+    near_anagram_index = await load(get_near_anagram_index)
+    matches = await run_in_threadpool(
+        near_anagram_index.lookup, word, max_distance=max_distance, limit=limit
+    )
+    return NearAnagramResponse(
+        word=word,
+        matches=[NearAnagramMatch(word=match, distance=distance) for match, distance in matches]
+    )
+
+
+@app.get("/api/phrases", response_class=StreamingResponse)
+async def find_phrase_anagrams(
+    phrase: str = Query(..., min_length=1, description="Phrase to rearrange"),
+    max_results: int = Query(100, ge=1, le=10000, description="Maximum phrases to return"),
+    max_seconds: float = Query(5.0, gt=0, le=30, description="Search time limit"),
+    min_word_length: int = Query(2, ge=1, description="Shortest word to use"),
+    max_words: int = Query(4, ge=1, le=10, description="Maximum words per phrase")
+):
+    """
+    Generate multi-word anagrams of a phrase from the corpus
+
+    Results are streamed as NDJSON objects of the form {"phrase": ...}
+    as soon as they are found, so the first ones arrive before the search
+    finishes.
+
+    Args:
+        phrase: Phrase to rearrange
+        max_results: Maximum phrases to return
+        max_seconds: Search time limit
+        min_word_length: Shortest dictionary word to use
+        max_words: Maximum words per phrase
+
+    Returns:
+        Streaming NDJSON response
+    """
+    phrase_search = await load(get_phrase_search)
+    phrases = phrase_search.search(
+        phrase,
+        max_results=max_results,
+        max_seconds=max_seconds,
+        min_word_length=min_word_length,
+        max_words=max_words
+    )
+    lines = (json.dumps({"phrase": result}) + "\n" for result in phrases)
+    return StreamingResponse(lines, media_type=NDJSON_MEDIA_TYPE)
+
+
+@app.get("/api/cache/stats")
+async def cache_stats():
+    """Signature cache hit/miss/eviction counters"""
+    if signature_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **signature_cache.stats()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics_endpoint():
+    """Prometheus text exposition of request, stage and cache metrics"""
+    if metrics is None:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+# Sampling profiler for POST /admin/profile; idle unless a profile is running
+profiler = SamplingProfiler()
+
+
+def require_admin(authorization: str) -> None:
+    """
+    Check the bearer token for admin endpoints
+
+    Admin endpoints are disabled (404) unless ADMIN_TOKEN is set.
+
+    Args:
+        authorization: Value of the Authorization header
+
+    Raises:
+        HTTPException: 404 when disabled, 401 for a missing or wrong token
+    """
+    token = os.getenv("ADMIN_TOKEN")
+    if not token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    expected = f"Bearer {token}"
+    if not hmac.compare_digest(authorization.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid admin token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+@app.post("/admin/profile", response_class=PlainTextResponse, include_in_schema=False)
+async def profile_process(
+    seconds: float = Query(10.0, gt=0, le=60, description="Sampling duration"),
+    interval_ms: float = Query(5.0, ge=1, le=1000, description="Milliseconds between samples"),
+    authorization: str = Header("", description="Bearer admin token")
+):
+    """
+    Sample the stacks of this server process for a number of seconds
+
+    Requires ADMIN_TOKEN to be set and sent as a bearer token. The event
+    loop keeps serving requests while the sampler runs in a worker thread.
+
+    Args:
+        seconds: Sampling duration
+        interval_ms: Milliseconds between samples
+        authorization: Bearer admin token
+
+    Returns:
+        Collapsed stacks ("frame;frame count" per line) for flame graphs
+    """
+    require_admin(authorization)
+    try:
+        counts = await run_in_threadpool(profiler.profile, seconds, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return PlainTextResponse(render_collapsed(counts))
+
 
 @app.get("/health")
 async def health_check():
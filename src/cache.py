@@ -0,0 +1,462 @@
+"""
+Bounded, thread-safe caching for the Anagram Checker
+
+LRUCache lives inside one process. With several server processes,
+TieredCache puts a shared backend behind it (SQLiteCache for one machine,
+RedisCache for anything Redis-compatible), so a signature computed by one
+worker is reused by all of them.
+"""
+import asyncio
+import functools
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    import sqlite3
+
+V = TypeVar("V")
+
+
+class LRUCache:
+    """
+    Least-recently-used cache with an optional time-to-live
+    (Single Responsibility Principle)
+
+    All operations take a single lock, so one instance can be shared by
+    the worker threads of a server process.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Maximum number of entries kept before evicting
+            ttl: Seconds an entry stays valid, or None for no expiry
+
+        Raises:
+            ValueError: If max_size is not positive or ttl is negative
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if ttl is not None and ttl < 0:
+            raise ValueError("ttl must not be negative")
+
+        self._max_size = max_size
+        self._ttl = ttl or None
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], V]) -> V:
+        """
+        Return the cached value for key, computing and storing it on a miss
+
+        The value is computed outside the lock, so concurrent misses on the
+        same key may compute it more than once; the last one is kept.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument callable producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+
+        value = compute()
+        expires_at = now + self._ttl if self._ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of the cache counters
+
+        Returns:
+            Dictionary with size, max_size, hits, misses, evictions and
+            expirations
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class SharedCacheBackend(Protocol):
+    """Interface for caches shared between processes (Interface Segregation Principle)"""
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored value, or None on a miss"""
+        ...
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value, replacing any previous one atomically"""
+        ...
+
+
+class SQLiteCache:
+    """
+    Machine-local cache in a SQLite file shared by all worker processes
+    (Single Responsibility Principle)
+
+    The database runs in WAL mode, so readers never block each other or
+    the writer, and every update is a single atomic statement. Entries
+    carry a last-used timestamp, refreshed on a hit at most once per
+    touch_interval seconds so hot keys do not turn every read into a
+    write. Every evict_every writes the least recently used entries
+    beyond max_size are deleted. Each thread opens its own connection on
+    first use. A locked database is only waited for briefly (timeout), so
+    contention between workers turns into an error, which TieredCache
+    counts as a miss, instead of a stall.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 100000,
+        evict_every: int = 1000,
+        touch_interval: float = 60.0,
+        timeout: float = 0.005
+    ):
+        """
+        Initialize the cache, creating the database file if needed
+
+        Args:
+            path: Database file, e.g. /tmp/anagram-cache.db
+            max_size: Number of entries kept after an eviction pass
+            evict_every: Writes between eviction passes
+            touch_interval: Seconds before a hit refreshes an entry's
+                last-used time
+            timeout: Seconds to wait for another connection's lock
+
+        Raises:
+            ValueError: If max_size or evict_every is not positive
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if evict_every <= 0:
+            raise ValueError("evict_every must be positive")
+        self._path = path
+        self._max_size = max_size
+        self._evict_every = evict_every
+        self._touch_interval = touch_interval
+        self._timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.evictions = 0
+        self._connection()
+
+    def _connection(self) -> "sqlite3.Connection":
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            import sqlite3
+
+            connection = sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, used REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the stored value and mark it as recently used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored value, or None on a miss
+        """
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value, used FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[1] >= self._touch_interval:
+            import sqlite3
+
+            try:
+                connection.execute("UPDATE entries SET used = ? WHERE key = ?", (now, key))
+            except sqlite3.OperationalError:
+                # Another worker holds the write lock; the touch can wait
+                pass
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a value and evict old entries when due
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO entries (key, value, used) VALUES (?, ?, ?)",
+            (key, value, time.time())
+        )
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self._evict_every == 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Delete the least recently used entries beyond max_size
+
+        Returns:
+            Number of entries deleted
+        """
+        connection = self._connection()
+        excess = connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - self._max_size
+        if excess <= 0:
+            return 0
+        deleted = connection.execute(
+            "DELETE FROM entries WHERE key IN "
+            "(SELECT key FROM entries ORDER BY used LIMIT ?)",
+            (excess,)
+        ).rowcount
+        with self._lock:
+            self.evictions += deleted
+        return deleted
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the calling thread's connection"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+class RedisCache:
+    """
+    Cache in a Redis-compatible server
+    (Dependency Inversion Principle - any client with get/set works)
+
+    Eviction is left to the server; run it with a maxmemory limit and
+    maxmemory-policy allkeys-lru.
+    """
+
+    def __init__(self, client: Any, prefix: str = "anagram:sig:", ttl: Optional[int] = None):
+        """
+        Initialize the cache around a client
+
+        Args:
+            client: Object with redis-py style get(name) and set(name, value, ex=None)
+            prefix: Prepended to every key
+            ttl: Seconds an entry stays valid, or None for no expiry
+        """
+        self._client = client
+        self._prefix = prefix
+        self._ttl = ttl or None
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 0.05, **kwargs) -> "RedisCache":
+        """
+        Connect to a server with redis-py
+
+        Args:
+            url: Server URL, e.g. redis://localhost:6379/0
+            timeout: Seconds allowed for connecting and for each command;
+                a slow server then costs a miss rather than a stall
+            kwargs: Passed to RedisCache
+
+        Returns:
+            Connected RedisCache
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+        """
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("RedisCache requires the 'redis' package")
+        client = redis.Redis.from_url(
+            url, socket_timeout=timeout, socket_connect_timeout=timeout
+        )
+        return cls(client, **kwargs)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored value, or None on a miss"""
+        value = self._client.get(self._prefix + key)
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value"""
+        self._client.set(self._prefix + key, value, ex=self._ttl)
+
+
+def _on_event_loop() -> bool:
+    """Whether the calling thread is running an asyncio event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class TieredCache:
+    """
+    Per-process LRU cache in front of a shared backend
+    (Open/Closed Principle - any SharedCacheBackend can be plugged in)
+
+    Satisfies the SignatureCache interface. Local hits never leave the
+    process; local misses try the shared backend before computing, and
+    computed values are written to both. Backend failures count as misses
+    so an unavailable shared cache only costs the computation.
+
+    The shared backend does blocking I/O, so calls made on an event loop
+    thread skip it (counted as shared_skipped) and use the local tier
+    only; calls from worker threads, such as offloaded checks, use both.
+    """
+
+    def __init__(self, shared: SharedCacheBackend, local: Optional[LRUCache] = None):
+        """
+        Initialize the tiers
+
+        Args:
+            shared: Backend shared between processes
+            local: Optional in-process cache consulted first
+        """
+        self._shared = shared
+        self._local = local
+        self._lock = threading.Lock()
+        self.shared_hits = 0
+        self.shared_misses = 0
+        self.shared_errors = 0
+        self.shared_skipped = 0
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _from_shared(self, key: Hashable, compute: Callable[[], str]) -> str:
+        shared_key = json.dumps(key)
+        try:
+            value = self._shared.get(shared_key)
+        except Exception:
+            self._count("shared_errors")
+            return compute()
+        if value is not None:
+            self._count("shared_hits")
+            return value
+
+        self._count("shared_misses")
+        value = compute()
+        try:
+            self._shared.set(shared_key, value)
+        except Exception:
+            self._count("shared_errors")
+        return value
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], str]) -> str:
+        """
+        Return the cached value for key from the nearest tier holding it
+
+        Args:
+            key: Cache key; strings and tuples of strings are supported
+            compute: Zero-argument callable producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        if _on_event_loop():
+            self._count("shared_skipped")
+            shared = compute
+        else:
+            shared = functools.partial(self._from_shared, key, compute)
+        if self._local is None:
+            return shared()
+        return self._local.get_or_compute(key, shared)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of the cache counters
+
+        Returns:
+            The local cache's stats (if any) plus shared_hits,
+            shared_misses, shared_errors and shared_skipped
+        """
+        stats = self._local.stats() if self._local is not None else {}
+        with self._lock:
+            stats.update(
+                shared_hits=self.shared_hits,
+                shared_misses=self.shared_misses,
+                shared_errors=self.shared_errors,
+                shared_skipped=self.shared_skipped,
+            )
+        return stats
+
+
+def create_shared_cache(url: str, max_size: int = 100000) -> SharedCacheBackend:
+    """
+    Factory function to create a shared cache backend from a URL
+    (Dependency Injection)
+
+    Args:
+        url: sqlite:///relative/path.db, sqlite:////absolute/path.db or
+            redis://host:port/db
+        max_size: Entry limit for SQLite (Redis evicts on its own)
+
+    Returns:
+        Configured backend
+
+    Raises:
+        ValueError: If the URL scheme is not supported
+    """
+    if url.startswith("sqlite:///"):
+        return SQLiteCache(url[len("sqlite:///"):], max_size)
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCache.from_url(url)
+    raise ValueError(f"Unsupported shared cache URL: {url}")
@@ -0,0 +1,471 @@
+"""
+Process-pool execution backend for bulk anagram work
+
+Large batches are CPU-bound and a single server process only uses one
+core. ProcessPoolBackend spreads them over worker processes. All strings
+are encoded once into a shared-memory block, and the workers only get
+the block's name and an index range, so nothing but small results is
+pickled. Batches below a threshold run inline because IPC would cost
+more than it saves.
+
+Shared-memory layout (native byte order):
+
+    offsets  2 * pairs + 1 unsigned 64-bit blob offsets (string i spans
+             offsets[i] to offsets[i + 1])
+    blob     UTF-8 strings back to back
+
+SizeAwareDispatcher keeps large single checks off the event loop: small
+inputs run inline, larger ones go to a bounded thread pool, and requests
+beyond a queue-depth limit are refused instead of queued.
+
+SingleFlight lets concurrent identical calls share one computation.
+"""
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+from src.anagram_checker import (
+    NORMALIZERS,
+    AnagramChecker,
+    anagram_signature,
+    create_anagram_checker,
+)
+
+_OFFSET_SIZE = 8
+
+# Validator strategy and checkers per normalization profile, set up in
+# every worker process by _init_worker
+_worker_strategy = "counting"
+_worker_checkers: Dict[str, AnagramChecker] = {}
+
+
+def _init_worker(strategy: str) -> None:
+    global _worker_strategy
+    _worker_strategy = strategy
+
+
+def _worker_checker(normalization: str) -> AnagramChecker:
+    checker = _worker_checkers.get(normalization)
+    if checker is None:
+        checker = _worker_checkers[normalization] = create_anagram_checker(
+            _worker_strategy, normalization=normalization
+        )
+    return checker
+
+
+def _decode_range(name: str, count: int, start: int, end: int) -> List[str]:
+    """Attach to a shared block and decode strings start..end-1"""
+    # Workers share the parent's resource tracker, so attaching here does
+    # not take ownership; the parent unlinks the block when the batch ends.
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        offsets = block.buf[:(count + 1) * _OFFSET_SIZE].cast("Q")
+        blob = block.buf[(count + 1) * _OFFSET_SIZE:]
+        try:
+            return [
+                bytes(blob[offsets[index]:offsets[index + 1]]).decode("utf-8", "surrogatepass")
+                for index in range(start, end)
+            ]
+        finally:
+            offsets.release()
+            blob.release()
+    finally:
+        block.close()
+
+
+def _check_chunk(name: str, count: int, start: int, end: int, normalization: str) -> bytes:
+    texts = _decode_range(name, count, start, end)
+    validate = _worker_checker(normalization).check
+    return bytes(validate(texts[index], texts[index + 1]) for index in range(0, len(texts), 2))
+
+
+def _signature_chunk(name: str, count: int, start: int, end: int, normalization: str) -> List[str]:
+    normalize = NORMALIZERS[normalization].normalize
+    return [anagram_signature(normalize(text)) for text in _decode_range(name, count, start, end)]
+
+
+class _SharedStrings:
+    """Strings encoded into one shared-memory block, unlinked on exit"""
+
+    def __init__(self, texts: Sequence[str]):
+        from multiprocessing import shared_memory
+
+        encoded = []
+        for text in texts:
+            if not isinstance(text, str):
+                raise ValueError("Both inputs must be strings")
+            encoded.append(text.encode("utf-8", "surrogatepass"))
+        self.count = len(encoded)
+        header = (self.count + 1) * _OFFSET_SIZE
+        blob = b"".join(encoded)
+        self.block = shared_memory.SharedMemory(create=True, size=max(1, header + len(blob)))
+        offsets = self.block.buf[:header].cast("Q")
+        try:
+            offsets[0] = 0
+            for index, end in enumerate(accumulate(map(len, encoded)), 1):
+                offsets[index] = end
+        finally:
+            offsets.release()
+        self.block.buf[header:header + len(blob)] = blob
+
+    def __enter__(self) -> "_SharedStrings":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.block.close()
+        self.block.unlink()
+
+
+class ProcessPoolBackend:
+    """
+    Runs bulk checks and signature computation on a pool of processes
+    (Liskov Substitution Principle - check_batch matches AnagramChecker)
+
+    Workers are started on first use and build their own checker with the
+    same strategy. Results are merged back in input order.
+    """
+
+    def __init__(
+        self,
+        strategy: str = "counting",
+        workers: Optional[int] = None,
+        chunk_size: int = 2048,
+        min_parallel: int = 4096
+    ):
+        """
+        Initialize the backend without starting any processes
+
+        Args:
+            strategy: Validator strategy used inside the workers
+            workers: Number of worker processes (default: CPU count)
+            chunk_size: Items per task sent to a worker
+            min_parallel: Smaller workloads run inline in the caller
+
+        Raises:
+            ValueError: If workers or chunk_size is not positive, or the
+                strategy is unknown
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError("workers must be positive")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self._inline_checkers = {
+            name: create_anagram_checker(strategy, normalization=name) for name in NORMALIZERS
+        }
+        self._strategy = strategy
+        self._workers = workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._min_parallel = min_parallel
+        self._pool: Optional["ProcessPoolExecutor"] = None
+        # Requests call in from several threads; only one may start the pool
+        self._pool_lock = threading.Lock()
+
+    def _executor(self) -> "ProcessPoolExecutor":
+        with self._pool_lock:
+            if self._pool is None:
+                # Imported here so servers without a process pool never load
+                # multiprocessing at startup
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self._strategy,),
+                )
+            return self._pool
+
+    def _map_chunks(
+        self,
+        texts: Sequence[str],
+        step: int,
+        task: Callable,
+        normalization: str
+    ) -> list:
+        chunk = self._chunk_size * step
+        with _SharedStrings(texts) as shared:
+            futures = [
+                self._executor().submit(
+                    task, shared.block.name, shared.count, start,
+                    min(start + chunk, shared.count), normalization
+                )
+                for start in range(0, shared.count, chunk)
+            ]
+            return [future.result() for future in futures]
+
+    def check_batch(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        normalization: str = "default"
+    ) -> List[bool]:
+        """
+        Check many input pairs, in parallel when the batch is large
+
+        Args:
+            pairs: Iterable of (input1, input2) tuples
+            normalization: Name of the normalization profile in NORMALIZERS
+
+        Returns:
+            List of results in the same order as the pairs
+
+        Raises:
+            ValueError: If an input is not a string
+        """
+        pairs = list(pairs)
+        if len(pairs) < self._min_parallel:
+            return self._inline_checkers[normalization].check_batch(pairs)
+        texts = [text for pair in pairs for text in pair]
+        results: List[bool] = []
+        for chunk in self._map_chunks(texts, 2, _check_chunk, normalization):
+            results.extend(map(bool, chunk))
+        return results
+
+    def signatures(self, words: Iterable[str], normalization: str = "default") -> List[str]:
+        """
+        Compute the anagram signature of every word
+
+        Args:
+            words: Input strings
+            normalization: Name of the normalization profile in NORMALIZERS
+
+        Returns:
+            Signatures in input order
+        """
+        words = list(words)
+        if len(words) < self._min_parallel:
+            normalize = NORMALIZERS[normalization].normalize
+            return [anagram_signature(normalize(word)) for word in words]
+        signatures: List[str] = []
+        for chunk in self._map_chunks(words, 1, _signature_chunk, normalization):
+            signatures.extend(chunk)
+        return signatures
+
+    def group_anagrams(
+        self,
+        words: Iterable[str],
+        min_size: int = 1,
+        normalization: str = "default"
+    ) -> List[List[str]]:
+        """
+        Partition words into anagram classes with parallel signatures
+
+        Matches src.anagram_checker.group_anagrams with the profile's
+        normalizer.
+
+        Args:
+            words: Input strings; duplicates are kept in their group
+            min_size: Only return groups with at least this many members
+            normalization: Name of the normalization profile in NORMALIZERS
+
+        Returns:
+            Groups in order of first appearance, members in input order
+        """
+        words = list(words)
+        groups: Dict[str, List[str]] = {}
+        for word, signature in zip(words, self.signatures(words, normalization)):
+            groups.setdefault(signature, []).append(word)
+        return [group for group in groups.values() if len(group) >= min_size]
+
+    def close(self) -> None:
+        """Stop the worker processes, if any were started"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+
+class DispatcherBusyError(RuntimeError):
+    """Raised when too many offloaded calls are already waiting or running"""
+
+
+class SizeAwareDispatcher:
+    """
+    Runs calls inline or on a bounded thread pool depending on input size
+    (Single Responsibility Principle - protects the event loop)
+
+    Calls up to inline_limit characters finish faster than a thread
+    handoff and run directly. Larger calls run in a pool thread so the
+    event loop keeps serving other connections; at most max_pending of
+    them may be queued or running, and further calls fail fast so tail
+    latency cannot grow without bound.
+    """
+
+    def __init__(self, inline_limit: int = 10000, workers: int = 4, max_pending: int = 32):
+        """
+        Initialize the dispatcher
+
+        Args:
+            inline_limit: Largest input size, in characters, run inline
+            workers: Threads running offloaded calls
+            max_pending: Offloaded calls allowed to wait or run at once
+
+        Raises:
+            ValueError: If workers or max_pending is not positive
+        """
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        if max_pending <= 0:
+            raise ValueError("max_pending must be positive")
+        self._inline_limit = inline_limit
+        self._max_pending = max_pending
+        self._workers = workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._inline = 0
+        self._offloaded = 0
+        self._rejected = 0
+
+    @property
+    def inline_limit(self) -> int:
+        """Largest input size, in characters, that runs inline"""
+        return self._inline_limit
+
+    async def run(self, size: int, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call func(*args), offloading it when size exceeds the inline limit
+
+        Must be called from the event loop thread, which owns the counters.
+
+        Args:
+            size: Input size in characters
+            func: Synchronous callable
+            args: Positional arguments for func
+
+        Returns:
+            Whatever func returns
+
+        Raises:
+            DispatcherBusyError: If max_pending offloaded calls are in flight
+        """
+        if size <= self._inline_limit:
+            self._inline += 1
+            return func(*args)
+        return await self.offload(func, *args)
+
+    async def offload(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call func(*args) on a pool thread whatever its size
+
+        For calls that must leave the event loop for another reason, such
+        as blocking I/O. They share the max_pending limit with large calls.
+
+        Args:
+            func: Synchronous callable
+            args: Positional arguments for func
+
+        Returns:
+            Whatever func returns
+
+        Raises:
+            DispatcherBusyError: If max_pending offloaded calls are in flight
+        """
+        if self._pending >= self._max_pending:
+            self._rejected += 1
+            raise DispatcherBusyError("Too many large checks in progress")
+        self._pending += 1
+        self._offloaded += 1
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self._workers, thread_name_prefix="anagram-check")
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, functools.partial(func, *args))
+        finally:
+            self._pending -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Dispatch counters
+
+        Returns:
+            Dictionary with inline, offloaded, rejected and pending counts
+        """
+        return {
+            "inline": self._inline,
+            "offloaded": self._offloaded,
+            "rejected": self._rejected,
+            "pending": self._pending,
+        }
+
+    def close(self) -> None:
+        """Wait for running calls and stop the pool threads, if any were started"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+class SingleFlight:
+    """
+    Shares one in-flight computation between concurrent calls with the same key
+    (Single Responsibility Principle - deduplicates work, nothing else)
+
+    The first call for a key starts the computation as a task; calls for
+    the same key that arrive before it finishes await that task instead
+    of starting their own, and all of them get its result or exception.
+    Nothing is remembered once the task is done, so this never serves a
+    stale value; repeated inputs over time are the cache's job.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight"""
+        self._inflight: Dict[Hashable, "asyncio.Future"] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    async def run(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Await func(*args), or the call already in flight for key
+
+        Must be called from the event loop thread, which owns the table.
+        A caller that is cancelled stops waiting without cancelling the
+        shared computation for the others.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            func: Coroutine function
+            args: Positional arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self._leaders += 1
+            task = asyncio.ensure_future(func(*args))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._forget, key))
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Future") -> None:
+        del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Coalescing counters
+
+        Returns:
+            Dictionary with leaders (computations started), coalesced
+            (calls that joined one) and inflight counts
+        """
+        return {
+            "leaders": self._leaders,
+            "coalesced": self._coalesced,
+            "inflight": len(self._inflight),
+        }
@@ -0,0 +1,194 @@
+"""
+Compact, memory-mapped on-disk format for the anagram index
+
+The file is built offline once and opened read-only with mmap, so every
+server process shares the same page-cache pages and startup does not
+depend on corpus size.
+
+Layout (all integers little-endian):
+
+    header   magic "ANAGIDX1", group count (u64), word count (u64)
+    records  one per signature group, sorted by hash:
+             signature hash (u64), blob offset (u64), blob length (u32),
+             padding (u32)
+    blob     per group: UTF-8 signature, NUL, UTF-8 words joined by "\\n"
+
+Lookups hash the query signature, binary-search the record table and
+compare the stored signature to rule out hash collisions.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from typing import List
+
+from src.anagram_checker import (
+    AnagramIndex,
+    CaseInsensitiveNormalizer,
+    StringNormalizer,
+    anagram_signature,
+)
+
+MAGIC = b"ANAGIDX1"
+_HEADER = struct.Struct("<8sQQ")
+_RECORD = struct.Struct("<QQII")
+
+
+def signature_hash(signature: str) -> int:
+    """
+    Hash a signature to the 64-bit key used by the record table
+
+    Args:
+        signature: Canonical anagram signature
+
+    Returns:
+        Unsigned 64-bit hash
+    """
+    digest = hashlib.blake2b(signature.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def build_index_file(index: AnagramIndex, path: str) -> None:
+    """
+    Write an AnagramIndex to path in the compact binary format
+
+    The file is written next to path and renamed into place, so readers
+    never observe a partially written index.
+
+    Args:
+        index: Populated in-memory index
+        path: Destination file
+    """
+    entries = []
+    for signature, words in index.groups().items():
+        payload = signature.encode("utf-8") + b"\0" + "\n".join(words).encode("utf-8")
+        entries.append((signature_hash(signature), payload))
+    entries.sort(key=lambda entry: entry[0])
+
+    records = bytearray()
+    blob = bytearray()
+    for key, payload in entries:
+        records += _RECORD.pack(key, len(blob), len(payload), 0)
+        blob += payload
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, len(entries), len(index)))
+        handle.write(records)
+        handle.write(blob)
+    os.replace(temp_path, path)
+
+
+class MappedAnagramIndex:
+    """
+    Read-only anagram index backed by a memory-mapped file
+    (Liskov Substitution Principle - drop-in for AnagramIndex lookups)
+
+    The normalizer must match the one used when the file was built.
+    """
+
+    def __init__(self, path: str, normalizer: StringNormalizer):
+        """
+        Open and map an index file
+
+        Args:
+            path: File written by build_index_file
+            normalizer: Normalizer used to build query signatures
+
+        Raises:
+            ValueError: If the file is not an anagram index
+        """
+        self._normalizer = normalizer
+        with open(path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < _HEADER.size:
+            self._map.close()
+            raise ValueError(f"Not an anagram index file: {path}")
+        magic, self._group_count, self._word_count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"Not an anagram index file: {path}")
+        self._blob_start = _HEADER.size + self._group_count * _RECORD.size
+
+    def _record(self, position: int) -> tuple:
+        return _RECORD.unpack_from(self._map, _HEADER.size + position * _RECORD.size)
+
+    def _find_group(self, signature: str) -> List[str]:
+        key = signature_hash(signature)
+        low, high = 0, self._group_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._record(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        expected = signature.encode("utf-8") + b"\0"
+        while low < self._group_count:
+            record_key, offset, length, _ = self._record(low)
+            if record_key != key:
+                break
+            start = self._blob_start + offset
+            payload = self._map[start:start + length]
+            if payload.startswith(expected):
+                return payload[len(expected):].decode("utf-8").split("\n")
+            low += 1
+        return []
+
+    def lookup(self, word: str) -> List[str]:
+        """
+        Find all corpus words that are anagrams of word
+
+        Results are identical to AnagramIndex.lookup on the source index.
+
+        Args:
+            word: Query string
+
+        Returns:
+            Matching words in their original insertion order
+        """
+        normalized = self._normalizer.normalize(word)
+        return [
+            candidate for candidate in self._find_group(anagram_signature(normalized))
+            if self._normalizer.normalize(candidate) != normalized
+        ]
+
+    def preload(self) -> None:
+        """Ask the kernel to read the whole file into the page cache now"""
+        if hasattr(mmap, "MADV_WILLNEED"):
+            self._map.madvise(mmap.MADV_WILLNEED)
+
+    def close(self) -> None:
+        """Unmap the index file"""
+        self._map.close()
+
+    def __enter__(self) -> "MappedAnagramIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._word_count
+
+
+def main(argv: List[str]) -> int:
+    """
+    Build an index file from a word list
+
+    Usage: python -m src.index_file WORDLIST OUTPUT
+    """
+    if len(argv) != 2:
+        print("Usage: python -m src.index_file WORDLIST OUTPUT", file=sys.stderr)
+        return 2
+    wordlist, output = argv
+    index = AnagramIndex.from_file(wordlist, CaseInsensitiveNormalizer())
+    build_index_file(index, output)
+    print(f"Wrote {len(index)} words in {len(index.groups())} groups to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,101 @@
+"""
+Interactive, keystroke-level anagram checking sessions
+"""
+from typing import Any, Dict, List
+
+from src.anagram_checker import LetterBalance, StringNormalizer
+
+# Longest text a live session keeps per field
+MAX_LIVE_TEXT = 10000
+
+
+def _is_int(value: Any) -> bool:
+    # JSON numbers like 1.0 and Python bools compare equal to ints but
+    # cannot be used as positions
+    return type(value) is int
+
+
+class LiveCheckSession:
+    """
+    State of one interactive client
+    (Single Responsibility Principle - applies edits, reports results)
+
+    The session keeps both texts and a LetterBalance. Each edit only
+    touches the changed characters of the balance, so re-evaluating
+    after a keystroke is O(1) in the length of the texts.
+
+    Messages are dictionaries:
+        {"type": "set", "field": 1, "text": "listen"}
+        {"type": "edit", "field": 2, "start": 3, "delete": 1, "insert": "x"}
+    Positions count Unicode code points. An optional "seq" value is
+    echoed back so clients can ignore stale results.
+    """
+
+    def __init__(self, normalizer: StringNormalizer):
+        """
+        Initialize a session with two empty texts
+
+        Args:
+            normalizer: Decides which characters of each edit count towards
+                the letter balance between the two texts
+        """
+        self._balance = LetterBalance(normalizer)
+        self._texts: List[str] = ["", ""]
+
+    def _replace(self, field: int, start: int, delete: int, insert: str) -> None:
+        text = self._texts[field - 1]
+        if not 0 <= start <= len(text) or delete < 0 or start + delete > len(text):
+            raise ValueError("Edit is outside the current text")
+        if len(text) - delete + len(insert) > MAX_LIVE_TEXT:
+            raise ValueError(f"Text longer than {MAX_LIVE_TEXT} characters")
+        removed = text[start:start + delete]
+        self._balance.remove(removed, field)
+        self._balance.add(insert, field)
+        self._texts[field - 1] = text[:start] + insert + text[start + delete:]
+
+    def apply(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply one client message and describe the new state
+
+        Args:
+            message: Decoded client message
+
+        Returns:
+            {"seq", "result", "complete"} where complete means both
+            texts are non-empty
+
+        Raises:
+            ValueError: If the message is malformed
+        """
+        if not isinstance(message, dict):
+            raise ValueError("Message must be a JSON object")
+        field = message.get("field")
+        if not _is_int(field) or field not in (1, 2):
+            raise ValueError("field must be 1 or 2")
+
+        kind = message.get("type")
+        if kind == "set":
+            text = message.get("text")
+            if not isinstance(text, str):
+                raise ValueError("text must be a string")
+            self._replace(field, 0, len(self._texts[field - 1]), text)
+        elif kind == "edit":
+            start, delete, insert = (
+                message.get("start"), message.get("delete", 0), message.get("insert", "")
+            )
+            if not _is_int(start) or not _is_int(delete) or not isinstance(insert, str):
+                raise ValueError("edit needs integer start/delete and string insert")
+            self._replace(field, start, delete, insert)
+        else:
+            raise ValueError("type must be 'set' or 'edit'")
+
+        return {
+            "seq": message.get("seq"),
+            "result": self._balance.is_anagram(),
+            "complete": all(self._texts),
+        }
+
+    @property
+    def texts(self) -> List[str]:
+        """Current texts of both fields"""
+        return list(self._texts)
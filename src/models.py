@@ -1,8 +1,20 @@
 """
 Data models for the Anagram Checker API
 """
+from typing import List, Literal, Optional
+
 from pydantic import BaseModel, Field
 
+MAX_BATCH_SIZE = 10000
+MAX_GROUP_SIZE = 1000000
+# Longest letters query for /api/subanagrams; the trie walk grows with it
+MAX_SUBANAGRAM_LETTERS = 32
+# Longest word for /api/near-anagrams; candidate buckets grow with it
+MAX_NEAR_ANAGRAM_WORD = 32
+
+# Normalization profiles selectable per request (see anagram_checker.NORMALIZERS)
+Normalization = Literal["default", "casefold", "accents", "letters"]
+
 
 class AnagramRequest(BaseModel):
     """Request model for anagram checking"""
@@ -23,8 +35,12 @@ class AnagramRequest(BaseModel):
 
 class AnagramResponse(BaseModel):
     """Response model for anagram checking"""
-    input1: str
-    input2: str
+    input1: Optional[str] = Field(
+        None, description="Echo of the first input (omitted when ANAGRAM_ECHO_INPUTS=0)"
+    )
+    input2: Optional[str] = Field(
+        None, description="Echo of the second input (omitted when ANAGRAM_ECHO_INPUTS=0)"
+    )
     result: bool = Field(..., description="True if strings are anagrams, False otherwise")
 
     model_config = {
@@ -38,3 +54,176 @@ class AnagramResponse(BaseModel):
             ]
         }
     }
+
+
+class AnagramBatchRequest(BaseModel):
+    """Request model for checking many pairs at once"""
+    pairs: List[AnagramRequest] = Field(
+        ...,
+        description="Pairs of strings to compare",
+        min_length=1,
+        max_length=MAX_BATCH_SIZE
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "pairs": [
+                        {"input1": "listen", "input2": "silent"},
+                        {"input1": "hello", "input2": "world"}
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class AnagramBatchResponse(BaseModel):
+    """Response model for checking many pairs at once"""
+    results: List[bool] = Field(
+        ...,
+        description="Result for each pair, in request order"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "results": [True, False]
+                }
+            ]
+        }
+    }
+
+
+class AnagramUploadResponse(BaseModel):
+    """Response model for checking two uploaded documents"""
+    result: bool = Field(..., description="True if the documents are anagrams, False otherwise")
+    input1_chars: int = Field(..., description="Normalized characters in the first document")
+    input2_chars: int = Field(..., description="Normalized characters in the second document")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "result": True,
+                    "input1_chars": 120345,
+                    "input2_chars": 120345
+                }
+            ]
+        }
+    }
+
+
+class AnagramLookupResponse(BaseModel):
+    """Response model for corpus anagram lookups"""
+    word: str
+    anagrams: List[str] = Field(
+        ...,
+        description="Corpus words that are anagrams of the query"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "word": "listen",
+                    "anagrams": ["silent", "enlist", "tinsel", "inlets"]
+                }
+            ]
+        }
+    }
+
+
+class AnagramGroupRequest(BaseModel):
+    """Request model for grouping a word list into anagram classes"""
+    words: List[str] = Field(
+        ...,
+        description="Strings to partition into anagram classes",
+        min_length=1,
+        max_length=MAX_GROUP_SIZE
+    )
+    min_size: int = Field(
+        1,
+        description="Only return groups with at least this many members",
+        ge=1
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "words": ["listen", "silent", "hello", "enlist"],
+                    "min_size": 2
+                }
+            ]
+        }
+    }
+
+
+class AnagramGroupResponse(BaseModel):
+    """Response model for grouping a word list into anagram classes"""
+    groups: List[List[str]] = Field(
+        ...,
+        description="Anagram classes in order of first appearance"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "groups": [["listen", "silent", "enlist"]]
+                }
+            ]
+        }
+    }
+
+
+class SubAnagramResponse(BaseModel):
+    """Response model for "can be spelled from" queries"""
+    letters: str
+    words: List[str] = Field(
+        ...,
+        description="Corpus words spelled from the letters, longest first"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "letters": "silentx",
+                    "words": ["enlist", "inlets", "listen", "silent", "tinsel"]
+                }
+            ]
+        }
+    }
+
+
+class NearAnagramMatch(BaseModel):
+    """A corpus word close to being an anagram of the query"""
+    word: str
+    distance: int = Field(..., description="Letter edits needed to become an anagram")
+
+
+class NearAnagramResponse(BaseModel):
+    """Response model for near-anagram lookups"""
+    word: str
+    matches: List[NearAnagramMatch] = Field(
+        ...,
+        description="Matches ranked by distance, then alphabetically"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "word": "listens",
+                    "matches": [
+                        {"word": "enlist", "distance": 1},
+                        {"word": "listen", "distance": 1}
+                    ]
+                }
+            ]
+        }
+    }
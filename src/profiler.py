@@ -0,0 +1,108 @@
+"""
+On-demand, stdlib-only sampling profiler for a live server process
+
+While active, a background thread periodically snapshots the Python
+stack of every other thread with sys._current_frames() and counts
+identical stacks. The result is written in the collapsed-stack format
+("frame;frame;frame count" per line) consumed by flamegraph.pl and
+speedscope. Nothing runs while no profile is being taken.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+# Stacks deeper than this are truncated at the root end
+MAX_STACK_DEPTH = 128
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running"""
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of all threads in the current process
+    (Single Responsibility Principle)
+
+    Only one profile runs at a time per instance.
+    """
+
+    def __init__(self):
+        """Initialize the profiler"""
+        self._running = threading.Lock()
+
+    def sample_once(self, counts: Counter, skip_thread: Optional[int] = None) -> None:
+        """
+        Add one snapshot of every thread's stack to counts
+
+        Args:
+            counts: Collapsed stack to sample count mapping to update
+            skip_thread: Thread id to leave out (the sampler itself)
+        """
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == skip_thread:
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(names.get(thread_id, f"thread-{thread_id}"))
+            counts[";".join(reversed(stack))] += 1
+
+    def profile(self, seconds: float, interval: float = 0.005) -> Dict[str, int]:
+        """
+        Sample all threads for the given duration
+
+        Blocks the calling thread, which is excluded from the samples.
+
+        Args:
+            seconds: How long to sample
+            interval: Seconds between samples
+
+        Returns:
+            Mapping of collapsed stack to number of samples
+
+        Raises:
+            ValueError: If interval is not positive
+            ProfilerBusyError: If a profile is already running
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if not self._running.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running")
+        try:
+            counts: Counter = Counter()
+            me = threading.get_ident()
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                self.sample_once(counts, skip_thread=me)
+                time.sleep(interval)
+            return dict(counts)
+        finally:
+            self._running.release()
+
+
+def render_collapsed(counts: Dict[str, int]) -> str:
+    """
+    Render stack counts in the collapsed-stack text format
+
+    Args:
+        counts: Mapping of collapsed stack to number of samples
+
+    Returns:
+        One "stack count" line per stack, most frequent first
+    """
+    lines = [
+        f"{stack} {count}"
+        for stack, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    ]
+    return "\n".join(lines) + ("\n" if lines else "")
@@ -0,0 +1,43 @@
+"""
+Fast JSON responses for the API endpoints
+"""
+import json
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is the fallback
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to compact UTF-8 JSON bytes
+
+    Uses orjson when it is installed, otherwise the stdlib encoder with
+    compact separators.
+
+    Args:
+        content: JSON-compatible value
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with dumps()
+
+    Endpoints return it with plain, already-validated data, which makes
+    FastAPI skip re-validating and re-serializing through response_model.
+    The response_model is still declared for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
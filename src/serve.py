@@ -0,0 +1,126 @@
+"""
+Production launcher for the Anagram Checker
+
+    python -m src.serve
+
+Runs uvicorn with one worker per CPU actually available to the container
+(CPU affinity and cgroup quota, not the host's core count), the uvloop
+event loop and httptools parser when installed, and limits read from the
+environment:
+
+    HOST                 bind address (default 0.0.0.0)
+    PORT                 bind port (default 8000)
+    WEB_CONCURRENCY      worker processes (default: available CPUs)
+    KEEP_ALIVE_TIMEOUT   seconds an idle keep-alive connection is kept (default 5)
+    BACKLOG              listen backlog (default 2048)
+    LIMIT_CONCURRENCY    connections per worker before 503s (default: unlimited)
+    ACCESS_LOG           1 to log every request (default 0)
+
+Each worker pre-warms the checkers, and maps a prebuilt index file if
+one is configured, in its startup handler before uvicorn starts
+accepting connections (see src.app.warm_up). The word-list indexes are
+built on first use so a scale-from-zero answers quickly; set
+ANAGRAM_PREWARM=all to build them before traffic instead.
+"""
+import importlib.util
+import math
+import os
+import sys
+from typing import Any, Dict, Mapping, Optional
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding="ascii") as handle:
+            return handle.read().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit(root: str = "/sys/fs/cgroup") -> Optional[float]:
+    """
+    Read the CPU quota of the current cgroup
+
+    Args:
+        root: Mount point of the cgroup filesystem
+
+    Returns:
+        Quota in CPUs (e.g. 1.5), or None if unlimited or unknown
+    """
+    cpu_max = _read(os.path.join(root, "cpu.max"))
+    if cpu_max is not None:
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max" and period:
+            return int(quota) / int(period)
+        return None
+
+    quota = _read(os.path.join(root, "cpu", "cpu.cfs_quota_us"))
+    period = _read(os.path.join(root, "cpu", "cpu.cfs_period_us"))
+    if quota is not None and period is not None and int(quota) > 0:
+        return int(quota) / int(period)
+    return None
+
+
+def available_cpus(cgroup_root: str = "/sys/fs/cgroup") -> int:
+    """
+    Count the CPUs this process may actually use
+
+    Args:
+        cgroup_root: Mount point of the cgroup filesystem
+
+    Returns:
+        The smaller of the affinity mask size and the rounded-up cgroup
+        quota, at least 1
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    quota = cgroup_cpu_limit(cgroup_root)
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+def server_options(env: Mapping[str, str] = os.environ) -> Dict[str, Any]:
+    """
+    Build uvicorn settings from the environment
+
+    Args:
+        env: Environment variables
+
+    Returns:
+        Keyword arguments for uvicorn.run
+    """
+    limit = env.get("LIMIT_CONCURRENCY")
+    return {
+        "host": env.get("HOST", "0.0.0.0"),
+        "port": int(env.get("PORT", "8000")),
+        "workers": int(env.get("WEB_CONCURRENCY") or available_cpus()),
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+        "timeout_keep_alive": int(env.get("KEEP_ALIVE_TIMEOUT", "5")),
+        "backlog": int(env.get("BACKLOG", "2048")),
+        "limit_concurrency": int(limit) if limit else None,
+        "access_log": env.get("ACCESS_LOG", "0") == "1",
+        "lifespan": "on",
+    }
+
+
+def main() -> int:
+    """Start the production server"""
+    import uvicorn
+
+    options = server_options()
+    print(
+        "Starting Anagram Checker: {workers} workers, loop={loop}, http={http}, "
+        "keep-alive={timeout_keep_alive}s, backlog={backlog}, "
+        "limit_concurrency={limit_concurrency}".format(**options),
+        file=sys.stderr
+    )
+    uvicorn.run("src.app:app", **options)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
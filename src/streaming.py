@@ -0,0 +1,72 @@
+"""
+Streaming helpers for newline-delimited JSON (NDJSON) endpoints
+"""
+from typing import AsyncIterator
+
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Longest single input line accepted before the stream is rejected
+MAX_LINE_BYTES = 1024 * 1024
+
+
+class LineTooLongError(ValueError):
+    """Raised when an NDJSON line exceeds the configured maximum size"""
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int = MAX_LINE_BYTES
+) -> AsyncIterator[bytes]:
+    """
+    Split an async stream of byte chunks into lines
+
+    Only the current partial line is buffered, so memory stays bounded by
+    max_line_bytes regardless of the total stream size. Blank lines are
+    skipped.
+
+    Args:
+        chunks: Async iterator of raw body chunks
+        max_line_bytes: Maximum size of a single line
+
+    Yields:
+        Each non-empty line without its trailing newline
+
+    Raises:
+        LineTooLongError: If a line exceeds max_line_bytes
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if len(line) > max_line_bytes:
+                raise LineTooLongError(
+                    f"Line exceeds maximum size of {max_line_bytes} bytes"
+                )
+            if line.strip():
+                yield line
+        if len(buffer) > max_line_bytes:
+            raise LineTooLongError(
+                f"Line exceeds maximum size of {max_line_bytes} bytes"
+            )
+    if buffer.strip():
+        yield buffer
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that may keep reading the request body while sending
+
+    The stock StreamingResponse listens for client disconnects by calling
+    receive(), which would swallow request body messages still being read
+    by the content iterator. Here the iterator owns receive(); a client
+    disconnect surfaces as ClientDisconnect from request.stream().
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
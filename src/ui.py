@@ -0,0 +1,350 @@
+"""
+Web UI page, precomputed once and served with caching and compression
+"""
+import gzip
+import hashlib
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+INDEX_HTML = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Anagram Checker</title>
+        <style>
+            body {
+                font-family: Arial, sans-serif;
+                max-width: 800px;
+                margin: 50px auto;
+                padding: 20px;
+                background-color: #f5f5f5;
+            }
+            .container {
+                background-color: white;
+                padding: 30px;
+                border-radius: 10px;
+                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            }
+            h1 {
+                color: #333;
+                text-align: center;
+            }
+            .form-group {
+                margin: 20px 0;
+            }
+            label {
+                display: block;
+                margin-bottom: 5px;
+                font-weight: bold;
+                color: #555;
+            }
+            input[type="text"] {
+                width: 100%;
+                padding: 10px;
+                border: 1px solid #ddd;
+                border-radius: 5px;
+                font-size: 16px;
+                box-sizing: border-box;
+            }
+            button {
+                width: 100%;
+                padding: 12px;
+                background-color: #4CAF50;
+                color: white;
+                border: none;
+                border-radius: 5px;
+                font-size: 16px;
+                cursor: pointer;
+                margin-top: 10px;
+            }
+            button:hover {
+                background-color: #45a049;
+            }
+            #result {
+                margin-top: 20px;
+                padding: 15px;
+                border-radius: 5px;
+                text-align: center;
+                font-size: 18px;
+                font-weight: bold;
+                display: none;
+            }
+            .result-true {
+                background-color: #d4edda;
+                color: #155724;
+                border: 1px solid #c3e6cb;
+            }
+            .result-false {
+                background-color: #f8d7da;
+                color: #721c24;
+                border: 1px solid #f5c6cb;
+            }
+            .example {
+                background-color: #e7f3ff;
+                padding: 15px;
+                border-radius: 5px;
+                margin-top: 20px;
+            }
+            .example h3 {
+                margin-top: 0;
+            }
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <h1>Anagram Checker</h1>
+            <p style="text-align: center; color: #666;">
+                Check if two strings are anagrams of each other
+            </p>
+
+            <form id="anagramForm">
+                <div class="form-group">
+                    <label for="input1">Input 1:</label>
+                    <input type="text" id="input1" name="input1" required
+                           placeholder="Enter first string" data-testid="input1">
+                </div>
+
+                <div class="form-group">
+                    <label for="input2">Input 2:</label>
+                    <input type="text" id="input2" name="input2" required
+                           placeholder="Enter second string" data-testid="input2">
+                </div>
+
+                <button type="submit" data-testid="check-button">Check Anagram</button>
+            </form>
+
+            <div id="result" data-testid="result"></div>
+
+            <div class="example">
+                <h3>Examples:</h3>
+                <ul>
+                    <li><strong>listen</strong> and <strong>silent</strong> → TRUE</li>
+                    <li><strong>hello</strong> and <strong>world</strong> → FALSE</li>
+                    <li><strong>A gentleman</strong> and <strong>Elegant Man</strong> → TRUE</li>
+                    <li><strong>school master</strong> and <strong>the classroom</strong> → TRUE</li>
+                </ul>
+            </div>
+
+            <footer style="text-align: center; color: #777; margin-top: 25px; font-size: 14px;">
+                <span id="copyright"></span>
+            </footer>
+        </div>
+
+        <script>
+            // Set current year in footer
+            document.getElementById('copyright').textContent =
+              `\u00A9 ${new Date().getFullYear()} Siarhei Staravoitau`;
+
+            const resultDiv = document.getElementById('result');
+
+            function showResult(result) {
+                resultDiv.textContent = result ? 'TRUE - These are anagrams!' : 'FALSE - These are not anagrams';
+                resultDiv.className = result ? 'result-true' : 'result-false';
+                resultDiv.style.display = 'block';
+            }
+
+            // Live checking: each keystroke is sent to /ws/check as a small
+            // edit (positions in code points) and the server pushes back the
+            // result. Only the answer to the latest edit is shown. If the
+            // server rejects an edit, its texts no longer match ours, so
+            // both fields are sent in full again.
+            const fields = { 1: document.getElementById('input1'), 2: document.getElementById('input2') };
+            const sent = { 1: [], 2: [] };
+            let socket = null;
+            let seq = 0;
+            let resyncFirst = 0;
+
+            function resync() {
+                resyncFirst = seq + 1;
+                for (const field of [1, 2]) {
+                    sent[field] = Array.from(fields[field].value);
+                    socket.send(JSON.stringify({ type: 'set', field, text: fields[field].value, seq: ++seq }));
+                }
+            }
+
+            function connect() {
+                const scheme = location.protocol === 'https:' ? 'wss' : 'ws';
+                socket = new WebSocket(`${scheme}://${location.host}/ws/check`);
+                socket.onopen = resync;
+                socket.onmessage = (event) => {
+                    const data = JSON.parse(event.data);
+                    if (data.error !== undefined) {
+                        // A rejected resync would fail again; wait for the next edit
+                        if (!(data.seq >= resyncFirst && data.seq < resyncFirst + 2)) {
+                            resync();
+                        }
+                        return;
+                    }
+                    if (data.seq === seq && data.complete) {
+                        showResult(data.result);
+                    }
+                };
+                socket.onclose = () => { socket = null; };
+            }
+
+            function sendEdit(field) {
+                if (socket === null) {
+                    connect();
+                    return;
+                }
+                if (socket.readyState !== WebSocket.OPEN) {
+                    return;
+                }
+                const before = sent[field];
+                const after = Array.from(fields[field].value);
+                let start = 0;
+                while (start < before.length && start < after.length && before[start] === after[start]) {
+                    start++;
+                }
+                let endBefore = before.length;
+                let endAfter = after.length;
+                while (endBefore > start && endAfter > start && before[endBefore - 1] === after[endAfter - 1]) {
+                    endBefore--;
+                    endAfter--;
+                }
+                sent[field] = after;
+                socket.send(JSON.stringify({
+                    type: 'edit', field, start, delete: endBefore - start,
+                    insert: after.slice(start, endAfter).join(''), seq: ++seq
+                }));
+            }
+
+            fields[1].addEventListener('input', () => sendEdit(1));
+            fields[2].addEventListener('input', () => sendEdit(2));
+
+            document.getElementById('anagramForm').addEventListener('submit', async (e) => {
+                e.preventDefault();
+
+                const input1 = fields[1].value;
+                const input2 = fields[2].value;
+
+                try {
+                    const response = await fetch('/api/check', {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json',
+                        },
+                        body: JSON.stringify({ input1, input2 })
+                    });
+
+                    const data = await response.json();
+                    showResult(data.result);
+                } catch (error) {
+                    alert('Error checking anagram: ' + error.message);
+                }
+            });
+        </script>
+    </body>
+    </html>
+    """
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value"""
+    codings: Dict[str, float] = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        codings[name] = quality
+    return codings
+
+
+class StaticPage:
+    """
+    An immutable page served from precomputed bytes
+    (Single Responsibility Principle - conditional and compressed delivery)
+
+    The body is encoded once; gzip and, when the optional brotli package
+    is installed, brotli variants are compressed once up front. Every
+    variant has its own strong ETag. Requests pick a variant from
+    Accept-Encoding, and If-None-Match is answered with 304 Not Modified.
+    """
+
+    def __init__(self, content: str, media_type: str = "text/html",
+                 max_age: int = 300):
+        """
+        Precompute the page variants
+
+        Args:
+            content: Page text
+            media_type: Content-Type without parameters; Starlette appends
+                "; charset=utf-8" to text/* types itself
+            max_age: Seconds clients may reuse the page without revalidating
+        """
+        body = content.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self._media_type = media_type
+        self._cache_control = f"public, max-age={max_age}"
+        # (coding, body, etag), most preferred first
+        self._variants: List[Tuple[str, bytes, str]] = []
+        if brotli is not None:
+            self._variants.append(("br", brotli.compress(body), f'"{digest}-br"'))
+        self._variants.append(("gzip", gzip.compress(body, 9, mtime=0), f'"{digest}-gzip"'))
+        self._variants.append(("identity", body, f'"{digest}"'))
+
+    def select(self, accept_encoding: str) -> Tuple[str, bytes, str]:
+        """
+        Choose the variant to send for an Accept-Encoding header
+
+        Args:
+            accept_encoding: Request header value ("" when absent)
+
+        Returns:
+            (coding, body, etag) of the chosen variant
+        """
+        codings = _parse_accept_encoding(accept_encoding)
+        wildcard = codings.get("*")
+        best: Optional[Tuple[str, bytes, str]] = None
+        best_quality = 0.0
+        for variant in self._variants:
+            coding = variant[0]
+            if coding == "identity":
+                quality = codings.get("identity", wildcard if wildcard is not None else 1.0)
+            else:
+                quality = codings.get(coding, wildcard or 0.0)
+            if quality > best_quality:
+                best, best_quality = variant, quality
+        return best or self._variants[-1]
+
+    def response(self, headers: Mapping[str, str]) -> Response:
+        """
+        Build the response for a request
+
+        Args:
+            headers: Request headers
+
+        Returns:
+            304 response if the client's copy is current, otherwise the
+            chosen variant with validators and caching headers
+        """
+        coding, body, etag = self.select(headers.get("accept-encoding", ""))
+        response_headers = {
+            "ETag": etag,
+            "Cache-Control": self._cache_control,
+            "Vary": "Accept-Encoding",
+        }
+
+        if_none_match = headers.get("if-none-match")
+        if if_none_match:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if "*" in tags or tags & {variant[2] for variant in self._variants}:
+                return Response(status_code=304, headers=response_headers)
+
+        if coding != "identity":
+            response_headers["Content-Encoding"] = coding
+        return Response(body, media_type=self._media_type, headers=response_headers)
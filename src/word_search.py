@@ -0,0 +1,385 @@
+"""
+Corpus search engines built on anagram signatures
+"""
+import time
+from collections import Counter
+from itertools import combinations, combinations_with_replacement, groupby, product
+from math import comb
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.anagram_checker import (
+    StringNormalizer,
+    WordListIndex,
+    anagram_signature,
+    multiset_distance,
+)
+
+# Key under which a trie node stores the words ending there. Signatures
+# never contain the empty string, so it cannot clash with a child edge.
+_WORDS = ""
+
+
+class SubAnagramIndex(WordListIndex):
+    """
+    Answers "which words can be spelled from these letters" queries
+    (Single Responsibility Principle - multiset containment search)
+
+    Words are stored in a trie keyed by their signature (sorted normalized
+    characters). A query walks only edges whose character is still
+    available in the query's letter multiset, so the work depends on how
+    many corpus prefixes fit the letters, not on corpus size.
+    """
+
+    def __init__(self, normalizer: StringNormalizer, words: Iterable[str] = ()):
+        """
+        Initialize the index
+
+        Args:
+            normalizer: Normalizes words into the trie's signature paths and
+                query letters into the multiset the search draws from
+            words: Initial corpus
+        """
+        self._normalizer = normalizer
+        self._root: Dict = {}
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        """
+        Add a word to the index; duplicates and empty words are ignored
+
+        Args:
+            word: Word to add
+        """
+        signature = anagram_signature(self._normalizer.normalize(word))
+        if not signature:
+            return
+        node = self._root
+        for char in signature:
+            node = node.setdefault(char, {})
+        words = node.setdefault(_WORDS, [])
+        if word not in words:
+            words.append(word)
+            self._size += 1
+
+    def contained_groups(
+        self,
+        letters: Counter,
+        min_length: int = 1
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Find all signature groups contained in a letter multiset
+
+        Args:
+            letters: Available normalized characters and their counts
+            min_length: Only return signatures with at least this many letters
+
+        Returns:
+            (signature, words) pairs in trie order
+        """
+        remaining = Counter(letters)
+        found: List[Tuple[str, List[str]]] = []
+        path: List[str] = []
+
+        def walk(node: Dict) -> None:
+            for char, child in node.items():
+                if char == _WORDS:
+                    if len(path) >= min_length:
+                        found.append((''.join(path), child))
+                elif remaining[char] > 0:
+                    remaining[char] -= 1
+                    path.append(char)
+                    walk(child)
+                    path.pop()
+                    remaining[char] += 1
+
+        walk(self._root)
+        return found
+
+    def search(
+        self,
+        letters: str,
+        min_length: int = 1,
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Find all words whose letter multiset is contained in letters
+
+        Args:
+            letters: Available letters (normalized like any other input)
+            min_length: Only return words with at least this many letters
+            limit: Maximum number of words to return
+
+        Returns:
+            Matching words, longest first, then alphabetically
+        """
+        groups = self.contained_groups(
+            Counter(self._normalizer.normalize(letters)), min_length
+        )
+        found = [(len(signature), word) for signature, words in groups for word in words]
+        found.sort(key=lambda item: (-item[0], item[1]))
+        words = [word for _, word in found]
+        return words if limit is None else words[:limit]
+
+    @property
+    def normalizer(self) -> StringNormalizer:
+        """Normalizer used to build signatures"""
+        return self._normalizer
+
+    def __len__(self) -> int:
+        return self._size
+
+
+_MASK_BITS = 63
+
+
+def _letter_mask(text: str) -> int:
+    """Bit set with one (possibly shared) bit per distinct character"""
+    mask = 0
+    for char in text:
+        mask |= 1 << (ord(char) % _MASK_BITS)
+    return mask
+
+
+def _neighbour_masks(mask: int, max_changes: int) -> Iterator[int]:
+    """Yield every mask with at most max_changes bits cleared and set"""
+    present = [bit for bit in range(_MASK_BITS) if mask >> bit & 1]
+    absent = [bit for bit in range(_MASK_BITS) if not mask >> bit & 1]
+    for removed_count in range(max_changes + 1):
+        for removed in combinations(present, removed_count):
+            reduced = mask
+            for bit in removed:
+                reduced &= ~(1 << bit)
+            for added_count in range(max_changes + 1):
+                for added in combinations(absent, added_count):
+                    result = reduced
+                    for bit in added:
+                        result |= 1 << bit
+                    yield result
+
+
+def _neighbour_count(mask: int, max_changes: int) -> int:
+    """Number of masks _neighbour_masks would yield"""
+    present = mask.bit_count()
+    absent = _MASK_BITS - present
+    return (
+        sum(comb(present, count) for count in range(max_changes + 1))
+        * sum(comb(absent, count) for count in range(max_changes + 1))
+    )
+
+
+class NearAnagramIndex(WordListIndex):
+    """
+    Finds corpus words within k letter edits of a query
+    (Single Responsibility Principle - near-anagram lookup)
+
+    Signature groups are bucketed by length, since the distance is at
+    least the length difference; only 2k + 1 buckets are visited. Each
+    bucket is keyed by a letter-presence bitmask. A bit present on one
+    side only is a distinct letter missing from the other, so a match
+    can differ from the query mask in at most k set and k cleared bits.
+    Small neighbourhoods are enumerated and probed directly; otherwise
+    the bucket's masks are scanned with that bound as a filter. Exact
+    count comparisons run only on the surviving groups.
+    """
+
+    def __init__(self, normalizer: StringNormalizer, words: Iterable[str] = ()):
+        """
+        Initialize the index
+
+        Args:
+            normalizer: Normalizes words for their signatures and decides
+                which candidates are the query itself rather than near matches
+            words: Initial corpus
+        """
+        self._normalizer = normalizer
+        self._groups: Dict[str, List[str]] = {}
+        self._buckets: Dict[int, Dict[int, List[Tuple[str, List[str]]]]] = {}
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        """
+        Add a word to the index; duplicates and empty words are ignored
+
+        Args:
+            word: Word to add
+        """
+        signature = anagram_signature(self._normalizer.normalize(word))
+        if not signature:
+            return
+        words = self._groups.get(signature)
+        if words is None:
+            words = self._groups[signature] = []
+            bucket = self._buckets.setdefault(len(signature), {})
+            bucket.setdefault(_letter_mask(signature), []).append((signature, words))
+        if word not in words:
+            words.append(word)
+            self._size += 1
+
+    def _candidates(
+        self,
+        bucket: Dict[int, List[Tuple[str, List[str]]]],
+        query_mask: int,
+        max_distance: int
+    ) -> Iterator[Tuple[str, List[str]]]:
+        if _neighbour_count(query_mask, max_distance) < len(bucket):
+            for mask in _neighbour_masks(query_mask, max_distance):
+                yield from bucket.get(mask, ())
+            return
+        for mask, entries in bucket.items():
+            if (mask & ~query_mask).bit_count() > max_distance:
+                continue
+            if (query_mask & ~mask).bit_count() > max_distance:
+                continue
+            yield from entries
+
+    def lookup(
+        self,
+        word: str,
+        max_distance: int = 1,
+        limit: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        """
+        Find corpus words within max_distance letter edits of word
+
+        Entries that normalize to the same string as the query are left out.
+
+        Args:
+            word: Query string
+            max_distance: Largest multiset distance to return
+            limit: Maximum number of matches to return
+
+        Returns:
+            (word, distance) pairs, closest first, then alphabetically
+        """
+        normalized = self._normalizer.normalize(word)
+        query_mask = _letter_mask(normalized)
+        length = len(normalized)
+        matches: List[Tuple[str, int]] = []
+
+        for size in range(max(1, length - max_distance), length + max_distance + 1):
+            bucket = self._buckets.get(size)
+            if not bucket:
+                continue
+            for signature, words in self._candidates(bucket, query_mask, max_distance):
+                distance = multiset_distance(normalized, signature)
+                if distance > max_distance:
+                    continue
+                matches.extend(
+                    (candidate, distance) for candidate in words
+                    if self._normalizer.normalize(candidate) != normalized
+                )
+
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches if limit is None else matches[:limit]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class PhraseAnagramSearch:
+    """
+    Enumerates multi-word anagrams of a phrase from a dictionary
+    (Single Responsibility Principle - phrase generation)
+
+    Candidate words are the corpus signatures contained in the phrase.
+    The search picks them in non-increasing length order so each
+    combination is produced once (a word group picked k times yields each
+    multiset of k of its words, not their orderings), prunes any word
+    that no longer fits the remaining letters, and remembers
+    remaining-letter states that proved to have no completion so they
+    are never explored twice.
+    """
+
+    def __init__(self, index: SubAnagramIndex):
+        """
+        Initialize the search over a dictionary
+
+        Args:
+            index: Containment index over the dictionary
+        """
+        self._index = index
+
+    def search(
+        self,
+        phrase: str,
+        max_results: int = 100,
+        max_seconds: float = 5.0,
+        min_word_length: int = 1,
+        max_words: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Generate multi-word anagrams of phrase lazily
+
+        Results are yielded as soon as they are found, so callers can
+        stream them before the search finishes.
+
+        Args:
+            phrase: Input phrase
+            max_results: Stop after this many phrases
+            max_seconds: Stop once this much time has passed
+            min_word_length: Shortest dictionary word to use
+            max_words: Maximum number of words per phrase
+
+        Yields:
+            Phrases made of dictionary words separated by single spaces
+        """
+        letters = Counter(self._index.normalizer.normalize(phrase))
+        groups = self._index.contained_groups(letters, min_word_length)
+        groups.sort(key=lambda group: (-len(group[0]), group[0]))
+        candidates = [(len(sig), Counter(sig), words) for sig, words in groups]
+
+        deadline = time.monotonic() + max_seconds
+        remaining = Counter(letters)
+        chosen: List[int] = []
+        dead = set()
+
+        def state_key(start: int) -> tuple:
+            depth = len(chosen) if max_words is not None else 0
+            return start, depth, ''.join(sorted(remaining.elements()))
+
+        def extend(start: int, letters_left: int) -> Iterator[List[int]]:
+            if letters_left == 0:
+                yield list(chosen)
+                return
+            if time.monotonic() > deadline:
+                return
+            if max_words is not None and len(chosen) >= max_words:
+                return
+            key = state_key(start)
+            if key in dead:
+                return
+
+            completed = False
+            for position in range(start, len(candidates)):
+                length, counts, _ = candidates[position]
+                if length > letters_left:
+                    continue
+                if any(remaining[char] < count for char, count in counts.items()):
+                    continue
+                remaining.subtract(counts)
+                chosen.append(position)
+                for solution in extend(position, letters_left - length):
+                    completed = True
+                    yield solution
+                chosen.pop()
+                remaining.update(counts)
+            if not completed and time.monotonic() <= deadline:
+                dead.add(key)
+
+        produced = 0
+        for solution in extend(0, sum(letters.values())):
+            # A group picked k times contributes a multiset of k of its
+            # words, not every ordering of them
+            choices = [
+                combinations_with_replacement(candidates[position][2], len(list(repeats)))
+                for position, repeats in groupby(solution)
+            ]
+            for picks in product(*choices):
+                yield ' '.join(word for pick in picks for word in pick)
+                produced += 1
+                if produced >= max_results:
+                    return
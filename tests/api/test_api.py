@@ -1,10 +1,24 @@
 """
 API tests for Anagram Checker
 """
+import json
+import threading
+import time
+
 import pytest
 import allure
 from fastapi.testclient import TestClient
+import src.app as app_module
+from src.anagram_checker import (
+    NORMALIZERS,
+    create_anagram_checker,
+    create_anagram_index,
+    group_anagrams,
+)
 from src.app import app
+from src.cache import LRUCache, SQLiteCache, TieredCache
+from src.executor import DispatcherBusyError, SizeAwareDispatcher
+from src.models import MAX_NEAR_ANAGRAM_WORD, MAX_SUBANAGRAM_LETTERS
 
 
 @pytest.fixture
@@ -37,9 +51,30 @@ class TestAnagramAPI:
 
         with allure.step("Verify response"):
             assert response.status_code == 200
-            assert "text/html" in response.headers["content-type"]
+            assert response.headers["content-type"] == "text/html; charset=utf-8"
             assert "Anagram Checker" in response.text
 
+    @allure.title("Test root endpoint supports conditional requests")
+    def test_root_endpoint_not_modified(self, client):
+        """Test that the UI is compressed, cacheable and revalidated with 304"""
+        with allure.step("GET / with gzip"):
+            response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+        with allure.step("Verify caching headers"):
+            assert response.status_code == 200
+            assert response.headers["content-encoding"] == "gzip"
+            assert "max-age" in response.headers["cache-control"]
+            etag = response.headers["etag"]
+
+        with allure.step("GET / with If-None-Match"):
+            response = client.get(
+                "/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+            )
+
+        with allure.step("Verify 304 Not Modified"):
+            assert response.status_code == 304
+            assert response.content == b""
+
     @allure.title("Test API check endpoint with valid anagrams")
     @pytest.mark.parametrize("input1,input2,expected", [
         ("listen", "silent", True),
@@ -70,6 +105,19 @@ class TestAnagramAPI:
             attachment_type=allure.attachment_type.TEXT
         )
 
+    @allure.title("Test API check endpoint without echoed inputs")
+    def test_check_without_echo(self, client, monkeypatch):
+        """Test that input echoing can be switched off"""
+        monkeypatch.setattr("src.app.echo_inputs", False)
+        with allure.step("POST /api/check"):
+            response = client.post(
+                "/api/check", json={"input1": "listen", "input2": "silent"}
+            )
+
+        with allure.step("Verify response only carries the result"):
+            assert response.status_code == 200
+            assert response.json() == {"result": True}
+
     @allure.title("Test API check endpoint with non-anagrams")
     @pytest.mark.parametrize("input1,input2,expected", [
         ("hello", "world", False),
@@ -112,6 +160,57 @@ class TestAnagramAPI:
         with allure.step("Verify validation error"):
             assert response.status_code == 422
 
+    @allure.title("Test batch input length limit")
+    def test_check_batch_input_too_long(self, client, monkeypatch):
+        """Test that any batch input over ANAGRAM_MAX_INPUT_LENGTH gets 413"""
+        monkeypatch.setattr(app_module, "max_input_length", 5)
+        pairs = [{"input1": "rat", "input2": "tar"}, {"input1": "abcdef", "input2": "fed"}]
+        response = client.post("/api/check/batch", json={"pairs": pairs})
+        assert response.status_code == 413
+
+    @allure.title("Test large batches are offloaded")
+    def test_check_batch_offloaded(self, client, monkeypatch):
+        """Test that batches above the inline limit run on the check threads"""
+        dispatcher = SizeAwareDispatcher(inline_limit=10, workers=1, max_pending=1)
+        monkeypatch.setattr(app_module, "check_dispatcher", dispatcher)
+        pairs = [{"input1": "listen", "input2": "silent"}, {"input1": "rat", "input2": "car"}]
+        try:
+            response = client.post("/api/check/batch", json={"pairs": pairs})
+        finally:
+            dispatcher.close()
+        assert response.json() == {"results": [True, False]}
+        assert dispatcher.stats()["offloaded"] == 1
+
+    @allure.title("Test process-pool batches respect the queue limit")
+    def test_check_batch_process_pool_overloaded(self, client, monkeypatch):
+        """Test that batches for the process pool also get 503 when the queue is full"""
+        class BusyDispatcher:
+            async def offload(self, func, *args):
+                raise DispatcherBusyError("Too many large checks in progress")
+
+        class FakeBackend:
+            def check_batch(self, pairs, normalization):
+                raise AssertionError("Batch bypassed the dispatcher")
+
+        monkeypatch.setattr(app_module, "process_backend", FakeBackend())
+        monkeypatch.setattr(app_module, "check_dispatcher", BusyDispatcher())
+        pairs = [{"input1": "listen", "input2": "silent"}]
+        response = client.post("/api/check/batch", json={"pairs": pairs})
+        assert response.status_code == 503
+
+    @allure.title("Test batch overload returns 503")
+    def test_check_batch_overloaded(self, client, monkeypatch):
+        """Test that a full dispatch queue answers batches with 503"""
+        class BusyDispatcher:
+            async def run(self, size, func, *args):
+                raise DispatcherBusyError("Too many large checks in progress")
+
+        monkeypatch.setattr(app_module, "check_dispatcher", BusyDispatcher())
+        pairs = [{"input1": "listen", "input2": "silent"}]
+        response = client.post("/api/check/batch", json={"pairs": pairs})
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+
     @allure.title("Test API with invalid JSON")
     def test_api_invalid_json(self, client):
         """Test API with invalid JSON"""
@@ -125,6 +224,546 @@ class TestAnagramAPI:
         with allure.step("Verify error response"):
             assert response.status_code == 422
 
+    @allure.title("Test batch check endpoint")
+    def test_check_batch_api(self, client):
+        """Test batch endpoint returns results in request order"""
+        pairs = [
+            {"input1": "listen", "input2": "silent"},
+            {"input1": "hello", "input2": "world"},
+            {"input1": "school master", "input2": "the classroom"},
+        ]
+        with allure.step("POST /api/check/batch"):
+            response = client.post("/api/check/batch", json={"pairs": pairs})
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            assert response.json() == {"results": [True, False, True]}
+
+    @allure.title("Test batch check endpoint with empty batch")
+    def test_check_batch_api_empty(self, client):
+        """Test batch endpoint rejects an empty list of pairs"""
+        with allure.step("POST /api/check/batch with no pairs"):
+            response = client.post("/api/check/batch", json={"pairs": []})
+
+        with allure.step("Verify validation error"):
+            assert response.status_code == 422
+
+    @allure.title("Test streaming NDJSON check endpoint")
+    def test_check_stream_api(self, client):
+        """Test streaming endpoint returns one result per input line"""
+        body = (
+            '{"input1": "listen", "input2": "silent"}\n'
+            '{"input1": "hello", "input2": "world"}\n'
+            '{"input1": ""}\n'
+        )
+        with allure.step("POST /api/check/stream"):
+            response = client.post(
+                "/api/check/stream",
+                content=body,
+                headers={"Content-Type": "application/x-ndjson"}
+            )
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            assert "application/x-ndjson" in response.headers["content-type"]
+            lines = [json.loads(line) for line in response.text.splitlines()]
+            assert lines[0] == {"input1": "listen", "input2": "silent", "result": True}
+            assert lines[1]["result"] is False
+            assert lines[2]["line"] == 3
+            assert "error" in lines[2]
+
+    @allure.title("Test streaming endpoint applies check limits per line")
+    def test_check_stream_limits(self, client, monkeypatch):
+        """Test that oversized lines and a full queue become per-line errors"""
+        class BusyDispatcher:
+            async def run(self, size, func, *args):
+                if size > 20:
+                    raise DispatcherBusyError("Too many large checks in progress")
+                return func(*args)
+
+        monkeypatch.setattr(app_module, "max_input_length", 20)
+        monkeypatch.setattr(app_module, "check_dispatcher", BusyDispatcher())
+        body = (
+            '{"input1": "listen", "input2": "silent"}\n'
+            + json.dumps({"input1": "a" * 21, "input2": "a"}) + "\n"
+            + json.dumps({"input1": "a" * 15, "input2": "a" * 15}) + "\n"
+        )
+        response = client.post(
+            "/api/check/stream", content=body,
+            headers={"Content-Type": "application/x-ndjson"}
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["result"] is True
+        assert lines[1] == {"line": 2, "error": "Inputs are limited to 20 characters"}
+        assert lines[2] == {"line": 3, "error": "Too many large checks in progress"}
+
+    @allure.title("Test group endpoint")
+    def test_group_words(self, client):
+        """Test grouping a word list into anagram classes"""
+        words = ["listen", "hello", "silent", "rat", "tar", "enlist"]
+        with allure.step("POST /api/group"):
+            response = client.post("/api/group", json={"words": words, "min_size": 2})
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            assert response.json() == {
+                "groups": [["listen", "silent", "enlist"], ["rat", "tar"]]
+            }
+
+    @allure.title("Test group endpoint streams large results")
+    def test_group_words_large(self, client):
+        """Test that results spanning several chunks form valid JSON"""
+        words = [chr(0x4E00 + i) for i in range(2500)]
+        with allure.step("POST /api/group with 2500 distinct words"):
+            response = client.post("/api/group", json={"words": words})
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            groups = response.json()["groups"]
+            assert len(groups) == 2500
+            assert groups[-1] == [chr(0x4E00 + 2499)]
+
+    @allure.title("Test grouping runs off the event loop")
+    def test_group_words_off_loop(self, client, monkeypatch):
+        """Test that grouping does not block the event loop thread"""
+        import asyncio
+
+        on_loop = []
+
+        def recording_group_anagrams(*args):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return group_anagrams(*args)
+
+        monkeypatch.setattr(app_module, "group_anagrams", recording_group_anagrams)
+        response = client.post("/api/group", json={"words": ["rat", "tar"]})
+        assert response.status_code == 200
+        assert on_loop == [False]
+
+    @allure.title("Test anagram lookup endpoint")
+    def test_find_anagrams(self, client):
+        """Test corpus lookup returns anagrams from the bundled word list"""
+        with allure.step("GET /api/anagrams?word=listen"):
+            response = client.get("/api/anagrams", params={"word": "listen"})
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            data = response.json()
+            assert data["word"] == "listen"
+            assert set(data["anagrams"]) == {"silent", "enlist", "tinsel", "inlets"}
+
+    @allure.title("Test anagram lookup endpoint without a word")
+    def test_find_anagrams_missing_word(self, client):
+        """Test corpus lookup requires the word parameter"""
+        with allure.step("GET /api/anagrams"):
+            response = client.get("/api/anagrams")
+
+        with allure.step("Verify validation error"):
+            assert response.status_code == 422
+
+    @allure.title("Test sub-anagram endpoint")
+    def test_find_subanagrams(self, client):
+        """Test words spelled from letters are returned longest first"""
+        with allure.step("GET /api/subanagrams?letters=tsaer"):
+            response = client.get(
+                "/api/subanagrams", params={"letters": "tsaer", "min_length": 3}
+            )
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            data = response.json()
+            assert data["letters"] == "tsaer"
+            assert "taste" not in data["words"]
+            assert {"rat", "tar", "art", "eat", "tea"} <= set(data["words"])
+            lengths = [len(word) for word in data["words"]]
+            assert lengths == sorted(lengths, reverse=True)
+
+    @allure.title("Test sub-anagram query length limit")
+    def test_find_subanagrams_too_long(self, client):
+        """Test that letters longer than MAX_SUBANAGRAM_LETTERS are rejected"""
+        response = client.get(
+            "/api/subanagrams", params={"letters": "a" * (MAX_SUBANAGRAM_LETTERS + 1)}
+        )
+        assert response.status_code == 422
+
+    @allure.title("Test near-anagram endpoint")
+    def test_find_near_anagrams(self, client):
+        """Test near-anagram lookup ranks matches by distance"""
+        with allure.step("GET /api/near-anagrams?word=listens"):
+            response = client.get(
+                "/api/near-anagrams", params={"word": "listens", "max_distance": 1}
+            )
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            data = response.json()
+            assert data["word"] == "listens"
+            assert {"word": "silent", "distance": 1} in data["matches"]
+            distances = [match["distance"] for match in data["matches"]]
+            assert distances == sorted(distances)
+
+    @allure.title("Test near-anagram word length limit")
+    def test_find_near_anagrams_too_long(self, client):
+        """Test that words longer than MAX_NEAR_ANAGRAM_WORD are rejected"""
+        response = client.get(
+            "/api/near-anagrams", params={"word": "a" * (MAX_NEAR_ANAGRAM_WORD + 1)}
+        )
+        assert response.status_code == 422
+
+    @allure.title("Test phrase anagram streaming endpoint")
+    def test_find_phrase_anagrams(self, client):
+        """Test phrase anagrams are streamed as NDJSON"""
+        with allure.step("GET /api/phrases?phrase=school master"):
+            response = client.get("/api/phrases", params={"phrase": "school master"})
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            assert "application/x-ndjson" in response.headers["content-type"]
+            phrases = [json.loads(line)["phrase"] for line in response.text.splitlines()]
+            assert "classroom the" in phrases
+            assert "master school" in phrases
+
+    @allure.title("Test cache stats endpoint")
+    def test_cache_stats(self, client):
+        """Test that cache counters are exposed"""
+        client.post("/api/check", json={"input1": "listen", "input2": "silent"})
+
+        with allure.step("GET /api/cache/stats"):
+            response = client.get("/api/cache/stats")
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            data = response.json()
+            assert data["enabled"] is True
+            for counter in ("hits", "misses", "evictions", "size", "max_size"):
+                assert counter in data
+
+    @allure.title("Test metrics endpoint")
+    def test_metrics(self, client):
+        """Test that request and stage metrics are exported"""
+        client.post("/api/check", json={"input1": "listen", "input2": "silent"})
+
+        with allure.step("GET /metrics"):
+            response = client.get("/metrics")
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            assert "text/plain" in response.headers["content-type"]
+            body = response.text
+            assert 'anagram_http_requests_total{method="POST",route="/api/check",status="200"}' in body
+            assert 'anagram_stage_duration_seconds_count{stage="check_handler"}' in body
+            assert 'anagram_stage_duration_seconds_count{stage="validate"}' in body
+            assert "anagram_input_chars_count" in body
+            assert "anagram_cache_hits" in body
+
+    @allure.title("Test profiler endpoint is disabled without a token")
+    def test_profile_disabled(self, client, monkeypatch):
+        """Test that the admin profiler is hidden unless ADMIN_TOKEN is set"""
+        monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+        response = client.post("/admin/profile", params={"seconds": 0.1})
+        assert response.status_code == 404
+
+    @allure.title("Test profiler endpoint requires the admin token")
+    def test_profile_unauthorized(self, client, monkeypatch):
+        """Test that a wrong bearer token is rejected"""
+        monkeypatch.setenv("ADMIN_TOKEN", "secret")
+        response = client.post(
+            "/admin/profile",
+            params={"seconds": 0.1},
+            headers={"Authorization": "Bearer wrong"}
+        )
+        assert response.status_code == 401
+
+    @allure.title("Test profiler endpoint returns collapsed stacks")
+    def test_profile_authorized(self, client, monkeypatch):
+        """Test that an authorized request returns collapsed stacks"""
+        monkeypatch.setenv("ADMIN_TOKEN", "secret")
+        with allure.step("POST /admin/profile"):
+            response = client.post(
+                "/admin/profile",
+                params={"seconds": 0.1, "interval_ms": 5},
+                headers={"Authorization": "Bearer secret"}
+            )
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            lines = response.text.splitlines()
+            assert lines
+            stack, count = lines[0].rsplit(" ", 1)
+            assert ";" in stack
+            assert int(count) >= 1
+
+    @allure.title("Test normalization profile per request")
+    def test_check_normalization_profile(self, client):
+        """Test that ?normalization= selects how inputs are normalized"""
+        body = {"input1": "Dormitory!", "input2": "dirty room"}
+        with allure.step("Check with default and letters profiles"):
+            default = client.post("/api/check", json=body)
+            letters = client.post("/api/check", params={"normalization": "letters"}, json=body)
+
+        with allure.step("Verify results"):
+            assert default.json()["result"] is False
+            assert letters.json()["result"] is True
+
+        with allure.step("Verify unknown profile is rejected"):
+            response = client.post("/api/check", params={"normalization": "nope"}, json=body)
+            assert response.status_code == 422
+
+    @allure.title("Test large check runs off the event loop")
+    def test_check_large_input(self, client):
+        """Test that inputs above the inline limit are still checked"""
+        text = "abc" * 10000
+        response = client.post("/api/check", json={"input1": text, "input2": text[::-1]})
+        assert response.status_code == 200
+        assert response.json()["result"] is True
+
+    @allure.title("Test input length limit")
+    def test_check_input_too_long(self, client, monkeypatch):
+        """Test that inputs over ANAGRAM_MAX_INPUT_LENGTH get 413"""
+        monkeypatch.setattr(app_module, "max_input_length", 5)
+        response = client.post("/api/check", json={"input1": "abcdef", "input2": "fedcba"})
+        assert response.status_code == 413
+
+    @allure.title("Test workers share signatures through the shared cache")
+    def test_check_shared_cache(self, client, monkeypatch, tmp_path):
+        """Test that a second worker's fresh local cache is filled from the shared tier"""
+        path = str(tmp_path / "cache.db")
+
+        def start_worker():
+            cache = TieredCache(SQLiteCache(path), local=LRUCache(max_size=100))
+            monkeypatch.setattr(app_module, "checkers", {
+                name: create_anagram_checker(cache=cache, normalization=name)
+                for name in NORMALIZERS
+            })
+            return cache
+
+        monkeypatch.setattr(app_module, "shared_cache_enabled", True)
+        pair = {"input1": "Dormitory", "input2": "dirty room"}
+        with allure.step("First worker computes and stores the signatures"):
+            first = start_worker()
+            assert client.post("/api/check", json=pair).json()["result"] is True
+            assert first.stats()["shared_misses"] == 2
+
+        with allure.step("Second worker finds them in the shared cache"):
+            second = start_worker()
+            assert client.post("/api/check", json=pair).json()["result"] is True
+            assert second.stats()["shared_hits"] == 2
+            assert second.stats()["shared_skipped"] == 0
+
+    @allure.title("Test overload returns 503")
+    def test_check_overloaded(self, client, monkeypatch):
+        """Test that a full dispatch queue answers 503 with Retry-After"""
+        class BusyDispatcher:
+            inline_limit = 0
+
+            async def run(self, size, func, *args):
+                raise DispatcherBusyError("Too many large checks in progress")
+
+        monkeypatch.setattr(app_module, "check_dispatcher", BusyDispatcher())
+        response = client.post("/api/check", json={"input1": "listen", "input2": "silent"})
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+
+    @allure.title("Test concurrent identical checks are coalesced")
+    def test_check_coalesced(self, client, monkeypatch):
+        """Test that concurrent large checks of the same pair share one computation"""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        calls = []
+        started = threading.Event()
+
+        class SlowDispatcher:
+            inline_limit = 0
+
+            async def run(self, size, func, *args):
+                calls.append(args)
+                started.set()
+                await asyncio.sleep(0.2)
+                return func(*args)
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(app_module, "check_dispatcher", SlowDispatcher())
+        before = app_module.check_flights.stats()["coalesced"]
+        pairs = [("listen", "silent"), ("silent", "listen"), ("listen", "silent")]
+
+        def post(pair):
+            return client.post("/api/check", json={"input1": pair[0], "input2": pair[1]})
+
+        with allure.step("POST the same pair three times concurrently"):
+            # Inside the context manager every request runs on one event loop
+            with client, ThreadPoolExecutor(3) as pool:
+                first = pool.submit(post, pairs[0])
+                started.wait(5)
+                responses = [first] + [pool.submit(post, pair) for pair in pairs[1:]]
+                responses = [future.result() for future in responses]
+
+        with allure.step("Verify one computation served every request"):
+            assert [response.json()["result"] for response in responses] == [True] * 3
+            assert len(calls) == 1
+            assert app_module.check_flights.stats()["coalesced"] - before == 2
+
+    @allure.title("Test uploading two documents")
+    def test_check_upload(self, client):
+        """Test that a body split by X-Input1-Length is compared as two documents"""
+        first = ("Dormitory " * 1000).encode("utf-8")
+        second = ("dirty room " * 1000).encode("utf-8")
+        with allure.step("POST /api/check/upload"):
+            response = client.post(
+                "/api/check/upload",
+                content=first + second,
+                headers={"X-Input1-Length": str(len(first))}
+            )
+
+        with allure.step("Verify response"):
+            assert response.status_code == 200
+            assert response.json() == {
+                "result": True, "input1_chars": 9000, "input2_chars": 9000
+            }
+
+    @allure.title("Test upload shorter than declared")
+    def test_check_upload_short_body(self, client):
+        """Test that a body shorter than X-Input1-Length is rejected"""
+        response = client.post(
+            "/api/check/upload", content=b"abc", headers={"X-Input1-Length": "10"}
+        )
+        assert response.status_code == 400
+
+    @allure.title("Test upload with unknown encoding")
+    def test_check_upload_unknown_encoding(self, client):
+        """Test that an unknown encoding is rejected"""
+        response = client.post(
+            "/api/check/upload", params={"encoding": "nope"}, content=b"ab",
+            headers={"X-Input1-Length": "1"}
+        )
+        assert response.status_code == 400
+
+    @allure.title("Test upload with a non-text codec")
+    @pytest.mark.parametrize("encoding", ["rot13", "zlib"])
+    def test_check_upload_non_text_encoding(self, client, encoding):
+        """Test that codecs which do not produce text are rejected with 400"""
+        response = client.post(
+            "/api/check/upload", params={"encoding": encoding}, content=b"ab",
+            headers={"X-Input1-Length": "1"}
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == f"Unsupported encoding: {encoding}"
+
+    @allure.title("Test live checking over WebSocket")
+    def test_live_check_websocket(self, client):
+        """Test that edits sent over /ws/check are answered with results"""
+        with client.websocket_connect("/ws/check") as websocket:
+            with allure.step("Set both fields"):
+                websocket.send_json({"type": "set", "field": 1, "text": "listen", "seq": 1})
+                assert websocket.receive_json() == {"seq": 1, "result": False, "complete": False}
+                websocket.send_json({"type": "set", "field": 2, "text": "silen", "seq": 2})
+                assert websocket.receive_json()["result"] is False
+
+            with allure.step("Type the missing letter"):
+                websocket.send_json(
+                    {"type": "edit", "field": 2, "start": 5, "insert": "t", "seq": 3}
+                )
+                assert websocket.receive_json() == {"seq": 3, "result": True, "complete": True}
+
+            with allure.step("Send an invalid edit"):
+                websocket.send_json({"type": "edit", "field": 1, "start": 99, "seq": 4})
+                reply = websocket.receive_json()
+                assert reply["seq"] == 4
+                assert "error" in reply
+
+            with allure.step("Send a non-integer field and a binary frame"):
+                websocket.send_json({"type": "set", "field": 1.0, "text": "x", "seq": 5})
+                assert "error" in websocket.receive_json()
+                websocket.send_bytes(b"{}")
+                assert websocket.receive_json() == {
+                    "seq": None, "error": "Messages must be text frames"
+                }
+
+            with allure.step("Verify the connection still works"):
+                websocket.send_json({"type": "set", "field": 1, "text": "tinsel", "seq": 6})
+                assert websocket.receive_json() == {"seq": 6, "result": True, "complete": True}
+
+    @allure.title("Test startup pre-warms before serving")
+    def test_startup_warm_up(self, monkeypatch):
+        """Test that the lifespan startup runs warm_up before requests"""
+        calls = []
+        monkeypatch.setattr(
+            app_module, "warm_up", lambda include_indexes: calls.append(include_indexes)
+        )
+        with TestClient(app) as warmed_client:
+            assert calls == [False]
+            assert warmed_client.get("/health").status_code == 200
+
+    @allure.title("Test warm-up runs every hot path")
+    def test_warm_up(self):
+        """Test that warm_up completes against the real indexes"""
+        app_module.warm_up(include_indexes=True)
+
+    @allure.title("Test default warm-up only maps the index file")
+    def test_warm_up_index_file(self, monkeypatch, tmp_path):
+        """Test that warm_up preloads a mapped index but builds no word-list index"""
+        from src.index_file import build_index_file
+
+        path = str(tmp_path / "words.idx")
+        build_index_file(create_anagram_index(app_module.wordlist_path), path)
+        monkeypatch.setenv("ANAGRAM_INDEX_FILE", path)
+        built = []
+        mapped = app_module.build_once(app_module.get_anagram_index.__wrapped__)
+        monkeypatch.setattr(app_module, "get_anagram_index", mapped)
+        for name in ("get_sub_anagram_index", "get_near_anagram_index", "get_phrase_search"):
+            monkeypatch.setattr(app_module, name, lambda name=name: built.append(name))
+
+        app_module.warm_up()
+        assert mapped.is_built()
+        assert built == []
+        mapped().close()
+
+    @allure.title("Test lazy indexes are built once")
+    def test_build_once(self):
+        """Test that concurrent first calls share a single build"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        calls = []
+
+        def build():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        get = app_module.build_once(build)
+        assert not get.is_built()
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(lambda _: get(), range(4)))
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert get.is_built()
+
+    @allure.title("Test lazy indexes are built off the event loop")
+    def test_index_built_off_loop(self, client, monkeypatch):
+        """Test that the first lookup builds its index on a worker thread"""
+        import asyncio
+
+        on_loop = []
+
+        def build():
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return create_anagram_index(app_module.wordlist_path)
+
+        monkeypatch.setattr(app_module, "get_anagram_index", app_module.build_once(build))
+        response = client.get("/api/anagrams", params={"word": "listen"})
+        assert response.status_code == 200
+        assert "silent" in response.json()["anagrams"]
+        assert on_loop == [False]
+
     @allure.title("Test OpenAPI documentation")
     def test_openapi_docs(self, client):
         """Test that OpenAPI docs are available"""
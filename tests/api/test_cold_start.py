@@ -0,0 +1,52 @@
+"""
+Cold-start regression tests: lazy imports and time to the first response
+"""
+import os
+import random
+import string
+import subprocess
+import sys
+
+import pytest
+import allure
+from benchmarks.startup import time_to_first_response
+
+# Rarely used features that must not be imported at application startup
+LAZY_MODULES = ("multiprocessing", "sqlite3", "mmap", "redis", "src.index_file")
+
+
+@allure.feature('Anagram Checker API')
+@allure.story('Cold Start')
+@pytest.mark.api
+class TestColdStart:
+    """Test cases for startup cost"""
+
+    @allure.title("Test rarely used modules are imported lazily")
+    def test_lazy_imports(self):
+        """Test that importing the app does not load optional features"""
+        script = (
+            "import sys, src.app; "
+            f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+        )
+        with allure.step("Import src.app in a fresh interpreter"):
+            completed = subprocess.run(
+                [sys.executable, "-c", script], capture_output=True, text=True, check=True
+            )
+        assert completed.stdout.strip() == ""
+
+    @allure.title("Test cold start stays within budget")
+    def test_first_response_budget(self, tmp_path):
+        """Test that a fresh server answers /health within COLD_START_BUDGET seconds"""
+        budget = float(os.getenv("COLD_START_BUDGET", "5"))
+        # A corpus large enough that building its indexes at startup would
+        # blow the budget, so pre-warming them by default is caught here
+        rng = random.Random(0)
+        wordlist = tmp_path / "words.txt"
+        wordlist.write_text("\n".join(
+            "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 12)))
+            for _ in range(300000)
+        ))
+        with allure.step("Start the production launcher with its default worker count"):
+            elapsed = time_to_first_response(env={"ANAGRAM_WORDLIST": str(wordlist)})
+        allure.attach(f"{elapsed:.3f} s (budget {budget:.3f} s)", name="Cold start")
+        assert elapsed <= budget
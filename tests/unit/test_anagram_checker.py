@@ -4,11 +4,23 @@ Unit tests for AnagramChecker
 import pytest
 import allure
 from src.anagram_checker import (
+    NORMALIZERS,
     CaseInsensitiveNormalizer,
+    FoldingNormalizer,
     SortedAnagramValidator,
+    CountingAnagramValidator,
+    CachedAnagramValidator,
+    NearAnagramValidator,
+    AnagramAccumulator,
     AnagramChecker,
-    create_anagram_checker
+    AnagramIndex,
+    anagram_signature,
+    create_anagram_checker,
+    create_anagram_index,
+    group_anagrams,
+    multiset_distance
 )
+from src.cache import LRUCache
 
 
 @allure.feature('Anagram Checker')
@@ -42,6 +54,64 @@ class TestCaseInsensitiveNormalizer:
         assert self.normalizer.normalize("") == ""
 
 
+@allure.feature('Anagram Checker')
+@allure.story('String Normalization')
+@pytest.mark.unit
+class TestFoldingNormalizer:
+    """Test cases for FoldingNormalizer"""
+
+    @allure.title("Test Unicode case folding")
+    def test_casefold(self):
+        """Test that case folding handles characters lower() does not"""
+        assert FoldingNormalizer().normalize("Straße ΣΑΣ") == "strasseσασ"
+
+    @allure.title("Test whitespace is always removed")
+    def test_whitespace(self):
+        """Test that all Unicode whitespace is removed"""
+        assert FoldingNormalizer().normalize(" a\tb\u00a0c\u3000 ") == "abc"
+
+    @allure.title("Test accent stripping")
+    def test_strip_accents(self):
+        """Test that accents and compatibility forms are decomposed"""
+        normalizer = FoldingNormalizer(strip_accents=True)
+        assert normalizer.normalize("Crème Brûlée ﬁ") == "cremebruleefi"
+
+    @allure.title("Test punctuation and digit filtering")
+    def test_strip_punctuation_digits(self):
+        """Test that punctuation, symbols and digits are dropped"""
+        normalizer = FoldingNormalizer(strip_punctuation=True, strip_digits=True)
+        assert normalizer.normalize("Dormitory! #1 (2024) €") == "dormitory"
+
+    @allure.title("Test case is kept without folding")
+    def test_no_casefold(self):
+        """Test that case is preserved when folding is off"""
+        assert FoldingNormalizer(casefold=False).normalize("Ab C") == "AbC"
+
+    @allure.title("Test configurations share translation tables")
+    def test_shared_table(self):
+        """Test that equal configurations reuse one table"""
+        assert FoldingNormalizer()._table is FoldingNormalizer(casefold=False)._table
+
+    @allure.title("Test normalization profiles")
+    def test_profiles(self):
+        """Test that each profile is selectable by name in the factory"""
+        assert set(NORMALIZERS) == {"default", "casefold", "accents", "letters"}
+        assert create_anagram_checker(normalization="letters").check("Dormitory!", "dirty room")
+        assert not create_anagram_checker().check("Dormitory!", "dirty room")
+        with pytest.raises(ValueError):
+            create_anagram_checker(normalization="unknown")
+
+    @allure.title("Test profiles share a cache safely")
+    def test_profiles_share_cache(self):
+        """Test that cached signatures are kept apart per profile"""
+        cache = LRUCache(max_size=10)
+        default = create_anagram_checker(cache=cache)
+        letters = create_anagram_checker(cache=cache, normalization="letters")
+        assert default.check("ab!", "ba") is False
+        assert letters.check("ab!", "ba") is True
+        assert default.check("ab!", "ba") is False
+
+
 @allure.feature('Anagram Checker')
 @allure.story('Anagram Validation')
 @pytest.mark.unit
@@ -79,6 +149,139 @@ class TestSortedAnagramValidator:
         assert self.validator.validate("", "") is True
 
 
+@allure.feature('Anagram Checker')
+@allure.story('Anagram Validation')
+@pytest.mark.unit
+class TestCountingAnagramValidator:
+    """Test cases for CountingAnagramValidator"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        normalizer = CaseInsensitiveNormalizer()
+        self.validator = CountingAnagramValidator(normalizer)
+
+    @allure.title("Test valid anagrams: listen and silent")
+    def test_validate_anagrams(self):
+        """Test that valid anagrams are detected"""
+        assert self.validator.validate("listen", "silent") is True
+
+    @allure.title("Test non-anagrams with equal length")
+    def test_validate_non_anagrams(self):
+        """Test that non-anagrams of the same length are detected"""
+        assert self.validator.validate("hello", "world") is False
+
+    @allure.title("Test length mismatch is rejected")
+    def test_validate_length_mismatch(self):
+        """Test that strings of different normalized length are rejected"""
+        assert self.validator.validate("apple", "apples") is False
+
+    @allure.title("Test validation with case and spaces")
+    def test_validate_case_and_spaces(self):
+        """Test that case and spaces are ignored"""
+        assert self.validator.validate("A gentleman", "Elegant Man") is True
+
+    @allure.title("Test Latin-1 characters")
+    def test_validate_latin1(self):
+        """Test the dense counting path with accented Latin-1 characters"""
+        assert self.validator.validate("café", "éfac") is True
+        assert self.validator.validate("café", "cafe") is False
+
+    @allure.title("Test arbitrary Unicode characters")
+    def test_validate_unicode(self):
+        """Test the dictionary counting path with non-Latin-1 characters"""
+        assert self.validator.validate("привет", "тевирп") is True
+        assert self.validator.validate("привет", "тевиря") is False
+
+    @allure.title("Test empty strings")
+    def test_validate_empty_strings(self):
+        """Test validation of empty strings"""
+        assert self.validator.validate("", "") is True
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Anagram Validation')
+@pytest.mark.unit
+class TestCachedAnagramValidator:
+    """Test cases for CachedAnagramValidator"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        normalizer = CaseInsensitiveNormalizer()
+        self.cache = LRUCache(max_size=100)
+        self.validator = CachedAnagramValidator(
+            normalizer,
+            self.cache,
+            CountingAnagramValidator(normalizer),
+            max_cached_length=20
+        )
+
+    @allure.title("Test signature is canonical")
+    def test_anagram_signature(self):
+        """Test that anagrams share the same signature"""
+        assert anagram_signature("listen") == anagram_signature("silent") == "eilnst"
+
+    @allure.title("Test repeated inputs hit the cache")
+    def test_validate_uses_cache(self):
+        """Test that repeated inputs are served from the cache"""
+        assert self.validator.validate("Listen", "Silent") is True
+        assert self.validator.validate("Listen", "Tinsel") is True
+        assert self.validator.validate("hello", "world") is False
+        stats = self.cache.stats()
+        assert stats["misses"] == 5
+        assert stats["hits"] == 1
+
+    @allure.title("Test long inputs bypass the cache")
+    def test_validate_long_inputs_bypass_cache(self):
+        """Test that inputs longer than the limit use the fallback"""
+        text = "abc" * 20
+        assert self.validator.validate(text, text[::-1]) is True
+        assert len(self.cache) == 0
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Anagram Validation')
+@pytest.mark.unit
+class TestNearAnagramValidator:
+    """Test cases for NearAnagramValidator"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.validator = NearAnagramValidator(CaseInsensitiveNormalizer(), max_distance=1)
+
+    @allure.title("Test multiset distance")
+    @pytest.mark.parametrize("str1,str2,expected", [
+        ("listen", "silent", 0),
+        ("listen", "silents", 1),
+        ("listen", "silenx", 1),
+        ("listen", "list", 2),
+        ("abc", "xyz", 3),
+        ("", "ab", 2),
+    ])
+    def test_multiset_distance(self, str1, str2, expected):
+        """Test that insertions, deletions and substitutions count once each"""
+        assert multiset_distance(str1, str2) == expected
+
+    @allure.title("Test near-anagrams within tolerance")
+    def test_validate_within_tolerance(self):
+        """Test that one edit is accepted"""
+        assert self.validator.validate("Listen", "silent") is True
+        assert self.validator.validate("listen", "Silent s") is True
+        assert self.validator.validate("listen", "silenx") is True
+        assert self.validator.distance("listen", "silenx") == 1
+
+    @allure.title("Test near-anagrams beyond tolerance")
+    def test_validate_beyond_tolerance(self):
+        """Test that two edits are rejected"""
+        assert self.validator.validate("listen", "list") is False
+        assert self.validator.validate("listen", "silexx") is False
+
+    @allure.title("Test negative tolerance is rejected")
+    def test_invalid_tolerance(self):
+        """Test that a negative max_distance raises ValueError"""
+        with pytest.raises(ValueError):
+            NearAnagramValidator(CaseInsensitiveNormalizer(), max_distance=-1)
+
+
 @allure.feature('Anagram Checker')
 @allure.story('Main Checker Class')
 @pytest.mark.unit
@@ -121,9 +324,187 @@ class TestAnagramChecker:
         with pytest.raises(ValueError, match="Both inputs must be strings"):
             self.checker.check(123, "test")
 
+    @allure.title("Test batch check preserves order")
+    def test_check_batch(self):
+        """Test that check_batch returns one result per pair, in order"""
+        pairs = [("listen", "silent"), ("hello", "world"), ("rat", "tar")]
+        assert self.checker.check_batch(pairs) == [True, False, True]
+
+    @allure.title("Test batch check with invalid input type")
+    def test_check_batch_invalid_input(self):
+        """Test that check_batch rejects non-string inputs"""
+        with pytest.raises(ValueError, match="Both inputs must be strings"):
+            self.checker.check_batch([("listen", "silent"), (1, "test")])
+
     @allure.title("Test factory function")
     def test_create_anagram_checker(self):
         """Test factory function creates valid instance"""
         checker = create_anagram_checker()
         assert isinstance(checker, AnagramChecker)
         assert checker.check("listen", "silent") is True
+
+    @allure.title("Test factory function with sorted strategy")
+    def test_create_anagram_checker_sorted(self):
+        """Test factory function can still select the sorting validator"""
+        checker = create_anagram_checker("sorted")
+        assert checker.check("listen", "silent") is True
+        assert checker.check("hello", "world") is False
+
+    @allure.title("Test factory function with a cache")
+    def test_create_anagram_checker_cached(self):
+        """Test factory function wires the signature cache in"""
+        cache = LRUCache(max_size=10)
+        checker = create_anagram_checker(cache=cache)
+        assert checker.check("listen", "silent") is True
+        assert checker.check("listen", "silent") is True
+        assert cache.stats()["hits"] == 2
+
+    @allure.title("Test factory function with unknown strategy")
+    def test_create_anagram_checker_unknown_strategy(self):
+        """Test factory function rejects unknown strategies"""
+        with pytest.raises(ValueError, match="Unknown validator strategy"):
+            create_anagram_checker("bogus")
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Anagram Index')
+@pytest.mark.unit
+class TestAnagramIndex:
+    """Test cases for AnagramIndex"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.index = AnagramIndex(
+            CaseInsensitiveNormalizer(),
+            ["listen", "silent", "Tinsel", "hello", "enlist", "silent"]
+        )
+
+    @allure.title("Test lookup returns all anagrams")
+    def test_lookup(self):
+        """Test that all anagrams in the corpus are returned"""
+        assert self.index.lookup("listen") == ["silent", "Tinsel", "enlist"]
+
+    @allure.title("Test lookup excludes the query itself")
+    def test_lookup_excludes_query(self):
+        """Test that entries equal to the query after normalization are excluded"""
+        assert self.index.lookup("SILENT") == ["listen", "Tinsel", "enlist"]
+
+    @allure.title("Test lookup with no matches")
+    def test_lookup_no_matches(self):
+        """Test that an unknown signature returns an empty list"""
+        assert self.index.lookup("world") == []
+
+    @allure.title("Test duplicates are ignored")
+    def test_duplicates_ignored(self):
+        """Test that adding the same word twice keeps one entry"""
+        assert len(self.index) == 5
+
+    @allure.title("Test loading from a word list file")
+    def test_from_file(self, tmp_path):
+        """Test that the index loads words, skipping blanks and comments"""
+        path = tmp_path / "words.txt"
+        path.write_text("# comment\nrat\n\ntar\nart\n", encoding="utf-8")
+        index = create_anagram_index(str(path))
+        assert len(index) == 3
+        assert index.lookup("rat") == ["tar", "art"]
+
+    @allure.title("Test factory function without a word list")
+    def test_create_anagram_index_empty(self):
+        """Test factory function builds an empty index without a path"""
+        assert len(create_anagram_index()) == 0
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Grouping')
+@pytest.mark.unit
+class TestGroupAnagrams:
+    """Test cases for group_anagrams"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.normalizer = CaseInsensitiveNormalizer()
+        self.words = ["listen", "hello", "Silent", "rat", "enlist", "tar", "world"]
+
+    @allure.title("Test grouping preserves first-appearance order")
+    def test_group_anagrams(self):
+        """Test that words are grouped by signature in input order"""
+        assert group_anagrams(self.words, self.normalizer) == [
+            ["listen", "Silent", "enlist"],
+            ["hello"],
+            ["rat", "tar"],
+            ["world"],
+        ]
+
+    @allure.title("Test minimum group size")
+    def test_group_anagrams_min_size(self):
+        """Test that singleton groups can be filtered out"""
+        assert group_anagrams(self.words, self.normalizer, min_size=2) == [
+            ["listen", "Silent", "enlist"],
+            ["rat", "tar"],
+        ]
+
+    @allure.title("Test duplicates stay in their group")
+    def test_group_anagrams_duplicates(self):
+        """Test that repeated inputs are kept"""
+        assert group_anagrams(["rat", "rat"], self.normalizer) == [["rat", "rat"]]
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Streaming Comparison')
+@pytest.mark.unit
+class TestAnagramAccumulator:
+    """Test cases for AnagramAccumulator"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.normalizer = CaseInsensitiveNormalizer()
+
+    @allure.title("Test chunked text matches a full check")
+    def test_chunked_text(self):
+        """Test that arbitrary chunking gives the same answer as check()"""
+        accumulator = AnagramAccumulator(self.normalizer)
+        for chunk in ("A gen", "tle", "man"):
+            accumulator.feed(chunk, 1)
+        for chunk in ("Eleg", "ant M", "an"):
+            accumulator.feed(chunk, 2)
+        assert accumulator.result() is True
+        assert accumulator.sizes == (10, 10)
+
+    @allure.title("Test multi-byte characters split across chunks")
+    def test_split_multibyte(self):
+        """Test that bytes chunks may split a UTF-8 sequence"""
+        accumulator = AnagramAccumulator(self.normalizer)
+        first = "café".encode("utf-8")
+        accumulator.feed(first[:4], 1)
+        accumulator.feed(first[4:], 1)
+        accumulator.feed("ÉFAC".encode("utf-8"), 2)
+        assert accumulator.result() is True
+
+    @allure.title("Test other encodings")
+    def test_encoding(self):
+        """Test that the configured encoding is used for bytes"""
+        accumulator = AnagramAccumulator(self.normalizer, encoding="utf-16-le")
+        accumulator.feed("listen".encode("utf-16-le"), 1)
+        accumulator.feed("silence".encode("utf-16-le"), 2)
+        assert accumulator.result() is False
+
+    @allure.title("Test non-text codecs are rejected")
+    def test_non_text_encoding(self):
+        """Test that codecs which do not decode bytes to text are refused"""
+        for encoding in ("rot13", "zlib", "base64"):
+            with pytest.raises(LookupError):
+                AnagramAccumulator(self.normalizer, encoding=encoding)
+
+    @allure.title("Test truncated byte sequence")
+    def test_truncated_bytes(self):
+        """Test that an incomplete final character is an error"""
+        accumulator = AnagramAccumulator(self.normalizer)
+        accumulator.feed("é".encode("utf-8")[:1], 1)
+        with pytest.raises(ValueError):
+            accumulator.result()
+
+    @allure.title("Test invalid side")
+    def test_invalid_side(self):
+        """Test that only sides 1 and 2 are accepted"""
+        with pytest.raises(ValueError):
+            AnagramAccumulator(self.normalizer).feed("x", 3)
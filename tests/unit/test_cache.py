@@ -0,0 +1,227 @@
+"""
+Unit tests for the LRU cache
+"""
+import asyncio
+import sqlite3
+import threading
+import time
+from unittest import mock
+
+import pytest
+import allure
+from src.cache import (
+    LRUCache,
+    RedisCache,
+    SQLiteCache,
+    TieredCache,
+    create_shared_cache,
+)
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Caching')
+@pytest.mark.unit
+class TestLRUCache:
+    """Test cases for LRUCache"""
+
+    @allure.title("Test hit and miss counting")
+    def test_hits_and_misses(self):
+        """Test that the first lookup misses and later lookups hit"""
+        cache = LRUCache(max_size=10)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_compute("key", compute) == "value"
+        assert cache.get_or_compute("key", compute) == "value"
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @allure.title("Test least recently used entry is evicted")
+    def test_eviction(self):
+        """Test that the least recently used entry is evicted when full"""
+        cache = LRUCache(max_size=2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("c", lambda: 3)
+
+        assert len(cache) == 2
+        assert cache.stats()["evictions"] == 1
+        assert cache.get_or_compute("a", lambda: 10) == 1
+        assert cache.get_or_compute("b", lambda: 20) == 20
+
+    @allure.title("Test entries expire after the TTL")
+    def test_ttl_expiry(self):
+        """Test that an entry older than the TTL is recomputed"""
+        cache = LRUCache(max_size=10, ttl=5)
+        with mock.patch("src.cache.time.monotonic", return_value=100.0):
+            cache.get_or_compute("key", lambda: "old")
+        with mock.patch("src.cache.time.monotonic", return_value=104.0):
+            assert cache.get_or_compute("key", lambda: "new") == "old"
+        with mock.patch("src.cache.time.monotonic", return_value=106.0):
+            assert cache.get_or_compute("key", lambda: "new") == "new"
+        assert cache.stats()["expirations"] == 1
+
+    @allure.title("Test concurrent access stays bounded")
+    def test_thread_safety(self):
+        """Test that concurrent writers never exceed max_size"""
+        cache = LRUCache(max_size=50)
+
+        def worker(offset):
+            for i in range(500):
+                cache.get_or_compute((offset, i % 80), lambda: i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert stats["size"] <= 50
+        assert stats["hits"] + stats["misses"] == 2000
+
+    @allure.title("Test invalid configuration")
+    def test_invalid_configuration(self):
+        """Test that a non-positive size is rejected"""
+        with pytest.raises(ValueError):
+            LRUCache(max_size=0)
+
+
+class FakeRedis:
+    """In-memory stand-in for a redis-py client"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, name):
+        value = self.data.get(name)
+        return value.encode("utf-8") if value is not None else None
+
+    def set(self, name, value, ex=None):
+        self.data[name] = value
+
+
+class BrokenBackend:
+    """Shared backend that is always unavailable"""
+
+    def get(self, key):
+        raise ConnectionError("down")
+
+    def set(self, key, value):
+        raise ConnectionError("down")
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Caching')
+@pytest.mark.unit
+class TestSQLiteCache:
+    """Test cases for SQLiteCache"""
+
+    @allure.title("Test values are shared between instances")
+    def test_shared_between_instances(self, tmp_path):
+        """Test that a second process-like instance sees stored values"""
+        path = str(tmp_path / "cache.db")
+        writer = SQLiteCache(path)
+        writer.set("key", "value")
+        assert SQLiteCache(path).get("key") == "value"
+        assert writer.get("missing") is None
+
+    @allure.title("Test least recently used entries are evicted")
+    def test_eviction(self, tmp_path):
+        """Test that eviction keeps the most recently used entries"""
+        cache = SQLiteCache(
+            str(tmp_path / "cache.db"), max_size=2, evict_every=100, touch_interval=0
+        )
+        for key in ("a", "b", "c"):
+            cache.set(key, key.upper())
+            time.sleep(0.01)
+        cache.get("a")
+        assert cache.evict() == 1
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert len(cache) == 2
+
+    @allure.title("Test invalid configuration")
+    def test_invalid_configuration(self, tmp_path):
+        """Test that non-positive sizes are rejected"""
+        with pytest.raises(ValueError):
+            SQLiteCache(str(tmp_path / "cache.db"), max_size=0)
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Caching')
+@pytest.mark.unit
+class TestTieredCache:
+    """Test cases for TieredCache"""
+
+    @allure.title("Test workers share computed values")
+    def test_shared_between_workers(self):
+        """Test that a value computed by one worker is reused by another"""
+        backend = RedisCache(FakeRedis())
+        first = TieredCache(backend, local=LRUCache(max_size=10))
+        second = TieredCache(backend, local=LRUCache(max_size=10))
+        compute = mock.Mock(return_value="eilnst")
+
+        assert first.get_or_compute("listen", compute) == "eilnst"
+        assert second.get_or_compute("listen", compute) == "eilnst"
+        assert compute.call_count == 1
+        assert second.stats()["shared_hits"] == 1
+
+    @allure.title("Test namespaced keys stay apart")
+    def test_tuple_keys(self, tmp_path):
+        """Test that tuple keys do not collide with string keys"""
+        cache = TieredCache(SQLiteCache(str(tmp_path / "cache.db")))
+        assert cache.get_or_compute(("letters", "ab"), lambda: "one") == "one"
+        assert cache.get_or_compute("ab", lambda: "two") == "two"
+        assert cache.get_or_compute(("letters", "ab"), lambda: "three") == "one"
+
+    @allure.title("Test unavailable backend degrades to computing")
+    def test_broken_backend(self):
+        """Test that backend errors count as misses"""
+        cache = TieredCache(BrokenBackend())
+        assert cache.get_or_compute("key", lambda: "value") == "value"
+        assert cache.stats() == {
+            "shared_hits": 0, "shared_misses": 0, "shared_errors": 1, "shared_skipped": 0
+        }
+
+    @allure.title("Test locked database degrades to a miss quickly")
+    def test_locked_database(self, tmp_path):
+        """Test that another worker's write lock costs milliseconds, not seconds"""
+        path = str(tmp_path / "cache.db")
+        cache = TieredCache(SQLiteCache(path))
+        locker = sqlite3.connect(path, isolation_level=None)
+        locker.execute("BEGIN IMMEDIATE")
+        try:
+            started = time.perf_counter()
+            assert cache.get_or_compute("key", lambda: "value") == "value"
+            elapsed = time.perf_counter() - started
+        finally:
+            locker.execute("ROLLBACK")
+            locker.close()
+        assert elapsed < 0.5
+        assert cache.stats()["shared_errors"] == 1
+
+    @allure.title("Test event loop calls skip the shared tier")
+    def test_skipped_on_event_loop(self):
+        """Test that calls on an event loop thread never touch the backend"""
+        backend = mock.Mock()
+        cache = TieredCache(backend, local=LRUCache(max_size=10))
+
+        async def on_loop():
+            return cache.get_or_compute("key", lambda: "value")
+
+        assert asyncio.run(on_loop()) == "value"
+        assert not backend.get.called and not backend.set.called
+        assert cache.stats()["shared_skipped"] == 1
+
+    @allure.title("Test shared cache factory")
+    def test_create_shared_cache(self, tmp_path):
+        """Test that URLs select the backend"""
+        assert isinstance(create_shared_cache(f"sqlite:///{tmp_path}/cache.db"), SQLiteCache)
+        with pytest.raises(ValueError):
+            create_shared_cache("memcached://localhost")
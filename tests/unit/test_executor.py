@@ -0,0 +1,237 @@
+"""
+Unit tests for the process-pool execution backend
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+import allure
+from src.anagram_checker import (
+    CaseInsensitiveNormalizer,
+    create_anagram_checker,
+    group_anagrams,
+)
+from src.executor import DispatcherBusyError, ProcessPoolBackend, SingleFlight, SizeAwareDispatcher
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Parallel Execution')
+@pytest.mark.unit
+class TestProcessPoolBackend:
+    """Test cases for ProcessPoolBackend"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.backend = ProcessPoolBackend(workers=2, chunk_size=3, min_parallel=4)
+        self.pairs = [
+            ("listen", "silent"), ("hello", "world"), ("A gentleman", "Elegant Man"),
+            ("café", "ÉFAC"), ("", ""), ("abc", "abcd"), ("Dormitory", "dirty room"),
+        ]
+
+    def teardown_method(self):
+        """Stop the worker processes"""
+        self.backend.close()
+
+    @allure.title("Test parallel batch matches inline results")
+    def test_check_batch_parallel(self):
+        """Test that results come back in order and match the checker"""
+        expected = create_anagram_checker().check_batch(self.pairs)
+        assert self.backend.check_batch(self.pairs) == expected
+
+    @allure.title("Test small batches run inline")
+    def test_check_batch_inline(self):
+        """Test that batches below the threshold never start the pool"""
+        assert self.backend.check_batch(self.pairs[:2]) == [True, False]
+        assert self.backend._pool is None
+
+    @allure.title("Test concurrent first use starts one pool")
+    def test_single_pool(self, monkeypatch):
+        """Test that threads racing to start the pool share one executor"""
+        import concurrent.futures
+
+        created = []
+
+        class SlowPool:
+            def __init__(self, **kwargs):
+                created.append(self)
+                time.sleep(0.05)
+
+            def shutdown(self):
+                pass
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", SlowPool)
+        with concurrent.futures.ThreadPoolExecutor(4) as threads:
+            pools = list(threads.map(lambda _: self.backend._executor(), range(4)))
+        assert len(created) == 1
+        assert all(pool is created[0] for pool in pools)
+
+    @allure.title("Test non-string inputs are rejected")
+    def test_check_batch_invalid(self):
+        """Test that a non-string input raises ValueError"""
+        with pytest.raises(ValueError):
+            self.backend.check_batch(self.pairs + [("abc", None)])
+
+    @allure.title("Test parallel grouping matches group_anagrams")
+    def test_group_anagrams(self):
+        """Test that grouping with parallel signatures gives the same groups"""
+        words = ["listen", "silent", "hello", "enlist", "inlets", "world", "olleh"]
+        expected = group_anagrams(words, CaseInsensitiveNormalizer(), 2)
+        assert self.backend.group_anagrams(words, 2) == expected
+
+    @allure.title("Test invalid configuration")
+    def test_invalid_configuration(self):
+        """Test that non-positive sizes are rejected"""
+        with pytest.raises(ValueError):
+            ProcessPoolBackend(workers=0)
+        with pytest.raises(ValueError):
+            ProcessPoolBackend(chunk_size=0)
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Parallel Execution')
+@pytest.mark.unit
+class TestSizeAwareDispatcher:
+    """Test cases for SizeAwareDispatcher"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.dispatcher = SizeAwareDispatcher(inline_limit=5, workers=1, max_pending=1)
+
+    def teardown_method(self):
+        """Stop the pool threads"""
+        self.dispatcher.close()
+
+    @allure.title("Test small calls run inline")
+    def test_inline(self):
+        """Test that calls within the limit run on the calling thread"""
+        result = asyncio.run(self.dispatcher.run(5, threading.get_ident))
+        assert result == threading.get_ident()
+        assert self.dispatcher.stats()["inline"] == 1
+
+    @allure.title("Test large calls are offloaded")
+    def test_offloaded(self):
+        """Test that calls above the limit run on a pool thread"""
+        result = asyncio.run(self.dispatcher.run(6, threading.get_ident))
+        assert result != threading.get_ident()
+        assert self.dispatcher.stats()["offloaded"] == 1
+
+    @allure.title("Test explicit offloading")
+    def test_offload(self):
+        """Test that offload() uses a pool thread even for small calls"""
+        result = asyncio.run(self.dispatcher.offload(threading.get_ident))
+        assert result != threading.get_ident()
+        assert self.dispatcher.stats()["offloaded"] == 1
+
+    @allure.title("Test queue-depth limit")
+    def test_busy(self):
+        """Test that calls beyond max_pending fail fast"""
+        release = threading.Event()
+
+        async def scenario():
+            first = asyncio.ensure_future(self.dispatcher.run(10, release.wait))
+            await asyncio.sleep(0)
+            with pytest.raises(DispatcherBusyError):
+                await self.dispatcher.run(10, release.wait)
+            release.set()
+            return await first
+
+        assert asyncio.run(scenario()) is True
+        assert self.dispatcher.stats() == {
+            "inline": 0, "offloaded": 1, "rejected": 1, "pending": 0
+        }
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Parallel Execution')
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test cases for SingleFlight"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.flights = SingleFlight()
+        self.calls = []
+
+    async def _compute(self, value, release):
+        self.calls.append(value)
+        await release.wait()
+        if value is None:
+            raise ValueError("Both inputs must be strings")
+        return value * 2
+
+    @allure.title("Test concurrent calls share one computation")
+    def test_coalesced(self):
+        """Test that calls with the same key get the first call's result"""
+        async def scenario():
+            release = asyncio.Event()
+            calls = [
+                asyncio.ensure_future(self.flights.run("key", self._compute, 21, release))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(*calls)
+
+        assert asyncio.run(scenario()) == [42, 42, 42]
+        assert self.calls == [21]
+        assert self.flights.stats() == {"leaders": 1, "coalesced": 2, "inflight": 0}
+
+    @allure.title("Test different keys run separately")
+    def test_distinct_keys(self):
+        """Test that only calls with equal keys are coalesced"""
+        async def scenario():
+            release = asyncio.Event()
+            release.set()
+            return await asyncio.gather(
+                self.flights.run("a", self._compute, 1, release),
+                self.flights.run("b", self._compute, 2, release),
+            )
+
+        assert asyncio.run(scenario()) == [2, 4]
+        assert self.flights.stats()["leaders"] == 2
+
+    @allure.title("Test finished calls are not reused")
+    def test_not_cached(self):
+        """Test that a call after completion starts a new computation"""
+        async def scenario():
+            release = asyncio.Event()
+            release.set()
+            await self.flights.run("key", self._compute, 1, release)
+            await self.flights.run("key", self._compute, 1, release)
+
+        asyncio.run(scenario())
+        assert self.calls == [1, 1]
+
+    @allure.title("Test errors reach every caller")
+    def test_exception_shared(self):
+        """Test that every coalesced caller gets the computation's exception"""
+        async def scenario():
+            release = asyncio.Event()
+            calls = [
+                asyncio.ensure_future(self.flights.run("key", self._compute, None, release))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(*calls, return_exceptions=True)
+
+        results = asyncio.run(scenario())
+        assert all(isinstance(result, ValueError) for result in results)
+        assert self.calls == [None]
+
+    @allure.title("Test cancelling the first caller")
+    def test_leader_cancelled(self):
+        """Test that a cancelled caller does not cancel the shared computation"""
+        async def scenario():
+            release = asyncio.Event()
+            leader = asyncio.ensure_future(self.flights.run("key", self._compute, 5, release))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(self.flights.run("key", self._compute, 5, release))
+            await asyncio.sleep(0)
+            leader.cancel()
+            release.set()
+            return await follower
+
+        assert asyncio.run(scenario()) == 10
+        assert self.calls == [5]
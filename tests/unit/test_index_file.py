@@ -0,0 +1,73 @@
+"""
+Unit tests for the memory-mapped anagram index file
+"""
+import pytest
+import allure
+from src.anagram_checker import AnagramIndex, CaseInsensitiveNormalizer
+from src.index_file import MappedAnagramIndex, build_index_file, main
+
+WORDS = ["listen", "silent", "Tinsel", "enlist", "hello", "rat", "tar", "art",
+         "привет", "тевирп", "café", "face"]
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Anagram Index')
+@pytest.mark.unit
+class TestMappedAnagramIndex:
+    """Test cases for MappedAnagramIndex"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.normalizer = CaseInsensitiveNormalizer()
+        self.source = AnagramIndex(self.normalizer, WORDS)
+
+    @allure.title("Test lookups match the in-memory index")
+    def test_lookup_matches_in_memory(self, tmp_path):
+        """Test that every lookup returns the same words as AnagramIndex"""
+        path = str(tmp_path / "words.idx")
+        build_index_file(self.source, path)
+
+        with MappedAnagramIndex(path, self.normalizer) as mapped:
+            assert len(mapped) == len(self.source)
+            for word in WORDS + ["LISTEN", "world", "éfac"]:
+                assert mapped.lookup(word) == self.source.lookup(word)
+
+    @allure.title("Test empty index")
+    def test_empty_index(self, tmp_path):
+        """Test that an empty index can be written and queried"""
+        path = str(tmp_path / "empty.idx")
+        build_index_file(AnagramIndex(self.normalizer), path)
+
+        with MappedAnagramIndex(path, self.normalizer) as mapped:
+            assert len(mapped) == 0
+            assert mapped.lookup("listen") == []
+
+    @allure.title("Test hash collisions are resolved by signature")
+    def test_hash_collision(self, tmp_path, monkeypatch):
+        """Test that groups sharing a hash are told apart by their signature"""
+        monkeypatch.setattr("src.index_file.signature_hash", lambda signature: 7)
+        path = str(tmp_path / "collide.idx")
+        build_index_file(self.source, path)
+
+        with MappedAnagramIndex(path, self.normalizer) as mapped:
+            assert mapped.lookup("art") == ["rat", "tar"]
+            assert mapped.lookup("listen") == self.source.lookup("listen")
+
+    @allure.title("Test invalid file is rejected")
+    def test_invalid_file(self, tmp_path):
+        """Test that a file without the magic header is rejected"""
+        path = tmp_path / "bogus.idx"
+        path.write_bytes(b"not an index file at all")
+        with pytest.raises(ValueError, match="Not an anagram index file"):
+            MappedAnagramIndex(str(path), self.normalizer)
+
+    @allure.title("Test command line builder")
+    def test_main(self, tmp_path):
+        """Test that the command line entry point builds a usable file"""
+        wordlist = tmp_path / "words.txt"
+        wordlist.write_text("rat\ntar\nart\n", encoding="utf-8")
+        output = str(tmp_path / "words.idx")
+
+        assert main([str(wordlist), output]) == 0
+        with MappedAnagramIndex(output, self.normalizer) as mapped:
+            assert mapped.lookup("rat") == ["tar", "art"]
@@ -0,0 +1,88 @@
+"""
+Unit tests for live checking sessions
+"""
+import pytest
+import allure
+from src.anagram_checker import CaseInsensitiveNormalizer, LetterBalance
+from src.live import MAX_LIVE_TEXT, LiveCheckSession
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Live Checking')
+@pytest.mark.unit
+class TestLetterBalance:
+    """Test cases for LetterBalance"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.balance = LetterBalance(CaseInsensitiveNormalizer())
+
+    @allure.title("Test empty balance is an anagram")
+    def test_empty(self):
+        """Test that two empty sides are balanced"""
+        assert self.balance.is_anagram() is True
+
+    @allure.title("Test adding and removing fragments")
+    def test_add_remove(self):
+        """Test that the balance follows fragments added to both sides"""
+        self.balance.add("Dormitory", 1)
+        assert self.balance.is_anagram() is False
+        self.balance.add("dirty ", 2)
+        self.balance.add("Room", 2)
+        assert self.balance.is_anagram() is True
+        self.balance.remove("m", 2)
+        assert self.balance.is_anagram() is False
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Live Checking')
+@pytest.mark.unit
+class TestLiveCheckSession:
+    """Test cases for LiveCheckSession"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.session = LiveCheckSession(CaseInsensitiveNormalizer())
+
+    @allure.title("Test keystrokes match a full check")
+    def test_keystrokes(self):
+        """Test that typing one character at a time gives the final result"""
+        self.session.apply({"type": "set", "field": 1, "text": "A gentleman"})
+        for position, char in enumerate("Elegant Man"):
+            reply = self.session.apply(
+                {"type": "edit", "field": 2, "start": position, "insert": char}
+            )
+        assert reply == {"seq": None, "result": True, "complete": True}
+        assert self.session.texts == ["A gentleman", "Elegant Man"]
+
+    @allure.title("Test replacing a range")
+    def test_replace_range(self):
+        """Test that an edit deletes and inserts in one step"""
+        self.session.apply({"type": "set", "field": 1, "text": "listen"})
+        self.session.apply({"type": "set", "field": 2, "text": "silent"})
+        reply = self.session.apply(
+            {"type": "edit", "field": 2, "start": 1, "delete": 3, "insert": "XYZ", "seq": 9}
+        )
+        assert reply["seq"] == 9
+        assert reply["result"] is False
+        assert self.session.texts[1] == "sXYZnt"
+
+    @allure.title("Test invalid messages are rejected")
+    @pytest.mark.parametrize("message", [
+        [],
+        {"type": "set", "field": 3, "text": "x"},
+        {"type": "set", "field": 1, "text": 5},
+        {"type": "edit", "field": 1, "start": 1},
+        {"type": "edit", "field": 1, "start": 0, "delete": 1},
+        {"type": "move", "field": 1},
+        {"type": "set", "field": 1, "text": "x" * (MAX_LIVE_TEXT + 1)},
+        {"type": "set", "field": 1.0, "text": "x"},
+        {"type": "set", "field": True, "text": "x"},
+        {"type": "edit", "field": 1, "start": False, "insert": "x"},
+        {"type": "edit", "field": 1, "start": 0, "delete": 0.0, "insert": "x"},
+    ])
+    def test_invalid_messages(self, message):
+        """Test that malformed messages raise ValueError and change nothing"""
+        with pytest.raises(ValueError):
+            self.session.apply(message)
+        assert self.session.texts == ["", ""]
@@ -0,0 +1,94 @@
+"""
+Unit tests for metrics and stage instrumentation
+"""
+import asyncio
+
+import pytest
+import allure
+from src.anagram_checker import create_anagram_checker
+from src.metrics import Counter, Histogram, Metrics, stats_collector
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Metrics')
+@pytest.mark.unit
+class TestMetricTypes:
+    """Test cases for Counter and Histogram"""
+
+    @allure.title("Test counter rendering")
+    def test_counter(self):
+        """Test that labelled counters accumulate and render"""
+        counter = Counter("requests_total", "Requests", ("route",))
+        counter.inc("/a")
+        counter.inc("/a")
+        counter.inc("/b", amount=3)
+
+        assert counter.value("/a") == 2
+        assert 'requests_total{route="/b"} 3' in counter.render()
+
+    @allure.title("Test histogram buckets are cumulative")
+    def test_histogram(self):
+        """Test that histogram buckets, sum and count are rendered"""
+        histogram = Histogram("latency", "Latency", (1, 5))
+        for value in (0.5, 1, 3, 10):
+            histogram.observe(value)
+
+        lines = histogram.render()
+        assert 'latency_bucket{le="1"} 2' in lines
+        assert 'latency_bucket{le="5"} 3' in lines
+        assert 'latency_bucket{le="+Inf"} 4' in lines
+        assert "latency_sum 14.5" in lines
+        assert "latency_count 4" in lines
+        assert histogram.count() == 4
+
+    @allure.title("Test label escaping")
+    def test_label_escaping(self):
+        """Test that quotes in label values are escaped"""
+        counter = Counter("c", "C", ("path",))
+        counter.inc('say "hi"')
+        assert 'c{path="say \\"hi\\""} 1' in counter.render()
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Metrics')
+@pytest.mark.unit
+class TestMetrics:
+    """Test cases for the Metrics registry"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.metrics = Metrics()
+
+    @allure.title("Test checker stages and input sizes are observed")
+    def test_checker_observer(self):
+        """Test that the checker reports normalize/validate stages and sizes"""
+        checker = create_anagram_checker(observer=self.metrics)
+        assert checker.check("listen", "silent") is True
+
+        assert self.metrics.stage_latency.count("validate") == 1
+        assert self.metrics.stage_latency.count("normalize") == 2
+        assert self.metrics.input_size.count() == 2
+
+    @allure.title("Test batch checks are observed per pair")
+    def test_checker_observer_batch(self):
+        """Test that check_batch reports each pair"""
+        checker = create_anagram_checker(observer=self.metrics)
+        assert checker.check_batch([("rat", "tar"), ("a", "b")]) == [True, False]
+        assert self.metrics.stage_latency.count("validate") == 2
+
+    @allure.title("Test timed endpoint decorator")
+    def test_timed(self):
+        """Test that decorated coroutines record a stage and keep their name"""
+        @self.metrics.timed("handler")
+        async def endpoint(value):
+            return value * 2
+
+        assert asyncio.run(endpoint(21)) == 42
+        assert endpoint.__name__ == "endpoint"
+        assert self.metrics.stage_latency.count("handler") == 1
+
+    @allure.title("Test collectors are rendered")
+    def test_collector(self):
+        """Test that stats collectors are exported as gauges"""
+        self.metrics.add_collector(stats_collector("cache", "Cache", lambda: {"hits": 3}))
+        assert "cache_hits 3" in self.metrics.render()
@@ -0,0 +1,72 @@
+"""
+Unit tests for the sampling profiler
+"""
+import threading
+
+import pytest
+import allure
+from src.anagram_checker import create_anagram_checker
+from src.profiler import ProfilerBusyError, SamplingProfiler, render_collapsed
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Profiling')
+@pytest.mark.unit
+class TestSamplingProfiler:
+    """Test cases for SamplingProfiler"""
+
+    @allure.title("Test checker frames are captured")
+    def test_profile_captures_checker_frames(self):
+        """Test that frames inside anagram_checker.py appear in the stacks"""
+        checker = create_anagram_checker()
+        text = "abcdefghij" * 20000
+        stop = threading.Event()
+
+        def busy():
+            while not stop.is_set():
+                checker.check(text, text[::-1])
+
+        worker = threading.Thread(target=busy, name="busy-worker")
+        worker.start()
+        try:
+            counts = SamplingProfiler().profile(0.3, interval=0.002)
+        finally:
+            stop.set()
+            worker.join()
+
+        stacks = [stack for stack in counts if stack.startswith("busy-worker;")]
+        assert stacks
+        assert any("validate (anagram_checker.py:" in stack for stack in stacks)
+
+    @allure.title("Test only one profile runs at a time")
+    def test_profile_busy(self):
+        """Test that a concurrent profile request is rejected"""
+        profiler = SamplingProfiler()
+        started = threading.Event()
+        original = profiler.sample_once
+
+        def sample_once(counts, skip_thread=None):
+            started.set()
+            original(counts, skip_thread)
+
+        profiler.sample_once = sample_once
+        runner = threading.Thread(target=profiler.profile, args=(0.3,))
+        runner.start()
+        started.wait()
+        try:
+            with pytest.raises(ProfilerBusyError):
+                profiler.profile(0.01)
+        finally:
+            runner.join()
+
+    @allure.title("Test invalid interval")
+    def test_profile_invalid_interval(self):
+        """Test that a non-positive interval is rejected"""
+        with pytest.raises(ValueError):
+            SamplingProfiler().profile(0.1, interval=0)
+
+    @allure.title("Test collapsed-stack rendering")
+    def test_render_collapsed(self):
+        """Test that stacks are rendered most frequent first"""
+        assert render_collapsed({"main;a": 1, "main;b": 3}) == "main;b 3\nmain;a 1\n"
+        assert render_collapsed({}) == ""
@@ -0,0 +1,37 @@
+"""
+Unit tests for fast JSON responses
+"""
+import json
+
+import pytest
+import allure
+from src import responses
+from src.responses import FastJSONResponse, dumps
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Serialization')
+@pytest.mark.unit
+class TestFastJSONResponse:
+    """Test cases for dumps and FastJSONResponse"""
+
+    @allure.title("Test compact serialization")
+    def test_dumps(self):
+        """Test that dumps produces compact UTF-8 JSON"""
+        payload = {"input1": "café", "input2": "éfac", "result": True}
+        encoded = dumps(payload)
+        assert json.loads(encoded) == payload
+        assert b" " not in encoded
+
+    @allure.title("Test stdlib fallback without orjson")
+    def test_dumps_without_orjson(self, monkeypatch):
+        """Test that the stdlib encoder is used when orjson is missing"""
+        monkeypatch.setattr(responses, "orjson", None)
+        assert dumps({"result": False, "word": "café"}) == '{"result":false,"word":"café"}'.encode()
+
+    @allure.title("Test response body and media type")
+    def test_response(self):
+        """Test that the response renders the JSON body"""
+        response = FastJSONResponse({"results": [True, False]})
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {"results": [True, False]}
@@ -0,0 +1,74 @@
+"""
+Unit tests for the production launcher settings
+"""
+import pytest
+import allure
+from src.serve import available_cpus, cgroup_cpu_limit, server_options
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Deployment')
+@pytest.mark.unit
+class TestCpuDetection:
+    """Test cases for CPU quota detection"""
+
+    @allure.title("Test cgroup v2 quota")
+    def test_cgroup_v2(self, tmp_path):
+        """Test that cpu.max quota and period give a CPU count"""
+        (tmp_path / "cpu.max").write_text("150000 100000\n")
+        assert cgroup_cpu_limit(str(tmp_path)) == 1.5
+
+    @allure.title("Test cgroup v2 without quota")
+    def test_cgroup_v2_unlimited(self, tmp_path):
+        """Test that 'max' means no limit"""
+        (tmp_path / "cpu.max").write_text("max 100000\n")
+        assert cgroup_cpu_limit(str(tmp_path)) is None
+
+    @allure.title("Test cgroup v1 quota")
+    def test_cgroup_v1(self, tmp_path):
+        """Test that the CFS quota files are read when cpu.max is missing"""
+        (tmp_path / "cpu").mkdir()
+        (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("200000\n")
+        (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+        assert cgroup_cpu_limit(str(tmp_path)) == 2.0
+
+    @allure.title("Test quota caps the CPU count")
+    def test_available_cpus_quota(self, tmp_path):
+        """Test that a fractional quota is rounded up and caps the count"""
+        (tmp_path / "cpu.max").write_text("50000 100000\n")
+        assert available_cpus(str(tmp_path)) == 1
+
+    @allure.title("Test no cgroup information")
+    def test_available_cpus_no_cgroup(self, tmp_path):
+        """Test that the affinity mask is used without a quota"""
+        assert available_cpus(str(tmp_path)) >= 1
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Deployment')
+@pytest.mark.unit
+class TestServerOptions:
+    """Test cases for server_options"""
+
+    @allure.title("Test defaults")
+    def test_defaults(self):
+        """Test the settings used with an empty environment"""
+        options = server_options({})
+        assert options["port"] == 8000
+        assert options["workers"] >= 1
+        assert options["backlog"] == 2048
+        assert options["limit_concurrency"] is None
+        assert options["access_log"] is False
+        assert options["lifespan"] == "on"
+
+    @allure.title("Test environment overrides")
+    def test_overrides(self):
+        """Test that tuning variables are read from the environment"""
+        options = server_options({
+            "PORT": "9000", "WEB_CONCURRENCY": "3", "KEEP_ALIVE_TIMEOUT": "30",
+            "BACKLOG": "4096", "LIMIT_CONCURRENCY": "500", "ACCESS_LOG": "1",
+        })
+        assert (options["port"], options["workers"]) == (9000, 3)
+        assert (options["timeout_keep_alive"], options["backlog"]) == (30, 4096)
+        assert options["limit_concurrency"] == 500
+        assert options["access_log"] is True
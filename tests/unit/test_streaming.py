@@ -0,0 +1,48 @@
+"""
+Unit tests for NDJSON streaming helpers
+"""
+import asyncio
+
+import pytest
+import allure
+from src.streaming import LineTooLongError, iter_lines
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+def _collect(chunks, **kwargs):
+    async def run():
+        return [line async for line in iter_lines(chunks, **kwargs)]
+    return asyncio.run(run())
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Streaming')
+@pytest.mark.unit
+class TestIterLines:
+    """Test cases for iter_lines"""
+
+    @allure.title("Test lines split across chunks")
+    def test_lines_across_chunks(self):
+        """Test that lines split over chunk boundaries are reassembled"""
+        lines = _collect(_chunks(b'{"a":', b'1}\n{"b"', b':2}\n'))
+        assert lines == [b'{"a":1}', b'{"b":2}']
+
+    @allure.title("Test final line without newline")
+    def test_trailing_line(self):
+        """Test that a final line without a newline is still yielded"""
+        assert _collect(_chunks(b"one\ntwo")) == [b"one", b"two"]
+
+    @allure.title("Test blank lines are skipped")
+    def test_blank_lines(self):
+        """Test that empty and whitespace-only lines are ignored"""
+        assert _collect(_chunks(b"\n one \n\n \n")) == [b" one "]
+
+    @allure.title("Test oversized line is rejected")
+    def test_line_too_long(self):
+        """Test that a line longer than the limit raises an error"""
+        with pytest.raises(LineTooLongError):
+            _collect(_chunks(b"x" * 10, b"x" * 10), max_line_bytes=15)
@@ -0,0 +1,66 @@
+"""
+Unit tests for the precomputed web UI page
+"""
+import gzip
+
+import pytest
+import allure
+from src.ui import INDEX_HTML, StaticPage
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Web UI')
+@pytest.mark.unit
+class TestStaticPage:
+    """Test cases for StaticPage"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.page = StaticPage(INDEX_HTML, max_age=60)
+
+    @allure.title("Test identity response without Accept-Encoding")
+    def test_identity(self):
+        """Test that clients without Accept-Encoding get the plain page"""
+        response = self.page.response({})
+        assert response.status_code == 200
+        assert response.body == INDEX_HTML.encode("utf-8")
+        assert "content-encoding" not in response.headers
+        assert response.headers["cache-control"] == "public, max-age=60"
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    @allure.title("Test gzip variant")
+    def test_gzip(self):
+        """Test that gzip is served when accepted"""
+        response = self.page.response({"accept-encoding": "gzip, deflate"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(response.body) == INDEX_HTML.encode("utf-8")
+        assert len(response.body) < len(INDEX_HTML)
+
+    @allure.title("Test q=0 refuses a coding")
+    def test_gzip_refused(self):
+        """Test that a coding with q=0 is not chosen"""
+        coding, _, _ = self.page.select("gzip;q=0, identity")
+        assert coding == "identity"
+
+    @allure.title("Test variants have distinct strong ETags")
+    def test_etags(self):
+        """Test that each representation has its own ETag"""
+        plain = self.page.response({}).headers["etag"]
+        compressed = self.page.response({"accept-encoding": "gzip"}).headers["etag"]
+        assert plain != compressed
+        assert plain.startswith('"') and not plain.startswith("W/")
+
+    @allure.title("Test conditional request returns 304")
+    def test_not_modified(self):
+        """Test that a matching If-None-Match yields 304 without a body"""
+        etag = self.page.response({"accept-encoding": "gzip"}).headers["etag"]
+        response = self.page.response({"accept-encoding": "gzip", "if-none-match": etag})
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+    @allure.title("Test stale ETag returns the page")
+    def test_stale_etag(self):
+        """Test that a non-matching If-None-Match returns the full page"""
+        response = self.page.response({"if-none-match": '"stale"'})
+        assert response.status_code == 200
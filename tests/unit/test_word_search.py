@@ -0,0 +1,165 @@
+"""
+Unit tests for corpus search engines
+"""
+import pytest
+import allure
+from src.anagram_checker import CaseInsensitiveNormalizer, multiset_distance
+from src.word_search import NearAnagramIndex, PhraseAnagramSearch, SubAnagramIndex
+
+WORDS = ["listen", "silent", "Tinsel", "list", "sit", "its", "tin", "lent",
+         "apple", "a", "ell", "sell"]
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Word Search')
+@pytest.mark.unit
+class TestSubAnagramIndex:
+    """Test cases for SubAnagramIndex"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.index = SubAnagramIndex(CaseInsensitiveNormalizer(), WORDS)
+
+    @allure.title("Test words spelled from letters")
+    def test_search(self):
+        """Test that all contained words are found, longest first"""
+        assert self.index.search("silent") == [
+            "Tinsel", "listen", "silent", "lent", "list", "its", "sit", "tin"
+        ]
+
+    @allure.title("Test letter multiplicity is respected")
+    def test_search_multiplicity(self):
+        """Test that a letter cannot be used more often than given"""
+        assert self.index.search("sel") == []
+        assert self.index.search("sell") == ["sell", "ell"]
+
+    @allure.title("Test query normalization")
+    def test_search_normalizes_query(self):
+        """Test that case and spaces in the query are ignored"""
+        assert self.index.search("S I T") == ["its", "sit"]
+
+    @allure.title("Test minimum length and limit")
+    def test_search_min_length_and_limit(self):
+        """Test that short words are filtered and results are capped"""
+        assert self.index.search("silent", min_length=5) == ["Tinsel", "listen", "silent"]
+        assert self.index.search("silent", limit=2) == ["Tinsel", "listen"]
+
+    @allure.title("Test corpus size")
+    def test_len(self):
+        """Test that every distinct word is counted once"""
+        assert len(SubAnagramIndex(CaseInsensitiveNormalizer(), ["a", "a", " "])) == 1
+
+    @allure.title("Test loading from a word list file")
+    def test_from_file(self, tmp_path):
+        """Test that the shared loader builds a SubAnagramIndex"""
+        path = tmp_path / "words.txt"
+        path.write_text("# comment\nsit\n\nits\n", encoding="utf-8")
+        index = SubAnagramIndex.from_file(str(path), CaseInsensitiveNormalizer())
+        assert isinstance(index, SubAnagramIndex)
+        assert index.search("tis") == ["its", "sit"]
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Word Search')
+@pytest.mark.unit
+class TestPhraseAnagramSearch:
+    """Test cases for PhraseAnagramSearch"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        words = ["school", "master", "the", "classroom", "eleven", "plus", "two",
+                 "twelve", "one", "a", "an", "to", "we"]
+        self.search = PhraseAnagramSearch(
+            SubAnagramIndex(CaseInsensitiveNormalizer(), words)
+        )
+
+    @allure.title("Test phrases from the feature files")
+    def test_search(self):
+        """Test that known phrase anagrams are generated"""
+        assert set(self.search.search("school master")) == {
+            "classroom the", "master school"
+        }
+        assert "twelve plus one" in self.search.search("eleven plus two")
+
+    @allure.title("Test each combination is produced once")
+    def test_search_no_permutations(self):
+        """Test that word order permutations are not repeated"""
+        results = list(self.search.search("school master"))
+        assert len(results) == len(set(results)) == 2
+
+    @allure.title("Test repeated word groups are not permuted")
+    def test_search_repeated_group(self):
+        """Test that a group picked twice yields each multiset of its words once"""
+        normalizer = CaseInsensitiveNormalizer()
+        search = PhraseAnagramSearch(SubAnagramIndex(normalizer, ["on", "no", "noon"]))
+        assert sorted(search.search("noon")) == ["no no", "noon", "on no", "on on"]
+        search = PhraseAnagramSearch(SubAnagramIndex(normalizer, ["ab", "ba"]))
+        assert sorted(search.search("abab")) == ["ab ab", "ab ba", "ba ba"]
+
+    @allure.title("Test result limit")
+    def test_search_max_results(self):
+        """Test that the search stops after max_results phrases"""
+        assert len(list(self.search.search("school master", max_results=1))) == 1
+
+    @allure.title("Test word count and length limits")
+    def test_search_word_limits(self):
+        """Test that max_words and min_word_length restrict the phrases"""
+        assert list(self.search.search("school master", max_words=1)) == []
+        assert list(self.search.search("anew", min_word_length=2)) == ["an we"]
+
+    @allure.title("Test time limit")
+    def test_search_max_seconds(self):
+        """Test that an expired time limit ends the search"""
+        assert list(self.search.search("school master", max_seconds=-1)) == []
+
+
+@allure.feature('Anagram Checker')
+@allure.story('Word Search')
+@pytest.mark.unit
+class TestNearAnagramIndex:
+    """Test cases for NearAnagramIndex"""
+
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.index = NearAnagramIndex(CaseInsensitiveNormalizer(), WORDS)
+
+    @allure.title("Test ranked near-anagram lookup")
+    def test_lookup(self):
+        """Test that matches are ranked by distance, then alphabetically"""
+        assert self.index.lookup("listens") == [
+            ("Tinsel", 1), ("listen", 1), ("silent", 1)
+        ]
+
+    @allure.title("Test exact anagrams have distance zero")
+    def test_lookup_exact(self):
+        """Test that exact anagrams are included but the query is not"""
+        assert self.index.lookup("listen", max_distance=0) == [
+            ("Tinsel", 0), ("silent", 0)
+        ]
+
+    @allure.title("Test lookup matches a full scan")
+    @pytest.mark.parametrize("query", ["listen", "lists", "sell", "apples", "tin"])
+    @pytest.mark.parametrize("max_distance", [0, 1, 2, 3])
+    def test_lookup_matches_scan(self, query, max_distance):
+        """Test that the pruned lookup agrees with brute force"""
+        expected = sorted(
+            (word, multiset_distance(query, word.lower()))
+            for word in set(WORDS)
+            if word.lower() != query
+            and multiset_distance(query, word.lower()) <= max_distance
+        )
+        assert sorted(self.index.lookup(query, max_distance)) == expected
+
+    @allure.title("Test result limit")
+    def test_lookup_limit(self):
+        """Test that results are capped"""
+        assert self.index.lookup("listens", limit=1) == [("Tinsel", 1)]
+
+    @allure.title("Test loading from a word list file")
+    def test_from_file(self, tmp_path):
+        """Test that the shared loader builds a NearAnagramIndex"""
+        path = tmp_path / "words.txt"
+        path.write_text("# comment\nlent\n\nlist\n", encoding="utf-8")
+        index = NearAnagramIndex.from_file(str(path), CaseInsensitiveNormalizer())
+        assert isinstance(index, NearAnagramIndex)
+        assert index.lookup("lint") == [("lent", 1), ("list", 1)]